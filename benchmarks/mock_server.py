@@ -0,0 +1,160 @@
+"""A local HTTP stand-in for the NODA Self-host API serving synthetic data at scale
+
+Only the endpoints exercised by the benchmarks are implemented. Response bodies are generated once per distinct
+request and cached, so the measurements are dominated by the client rather than by the server.
+"""
+import datetime
+import json
+import re
+import threading
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+_TIMESERIES_DATA_PATH = re.compile(r'^/v2/timeseries/(?P<uuid>[^/]+)/data$')
+_EPOCH = datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc)
+_SEVERITIES = ('critical', 'major', 'minor', 'warning', 'informational')
+
+
+def _timestamp(index: int) -> str:
+    return (_EPOCH + datetime.timedelta(seconds=index)).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+
+@lru_cache(maxsize=None)
+def data_points(points: int) -> List[Dict]:
+    return [{'v': index * 0.5, 'ts': _timestamp(index)} for index in range(points)]
+
+
+@lru_cache(maxsize=None)
+def _timeseries_data_body(points: int) -> bytes:
+    return json.dumps(data_points(points)).encode('utf-8')
+
+
+@lru_cache(maxsize=256)
+def _tsquery_body(uuids: Tuple[str, ...], points: int) -> bytes:
+    return json.dumps([{'uuid': uuid, 'data': data_points(points)} for uuid in uuids]).encode('utf-8')
+
+
+@lru_cache(maxsize=256)
+def _alerts_body(offset: int, limit: int, total: int) -> bytes:
+    return json.dumps([
+        {
+            'uuid': f'00000000-0000-0000-0000-{index:012d}',
+            'resource': f'resource-{index % 100}',
+            'environment': 'production',
+            'event': 'threshold',
+            'severity': _SEVERITIES[index % len(_SEVERITIES)],
+            'status': 'open',
+            'service': ['benchmark'],
+            'value': str(index),
+            'description': 'synthetic alert',
+            'origin': 'benchmark',
+            'tags': ['tag1', 'tag2'],
+            'timeout': 0,
+            'rawdata': 'c3ludGhldGljIHJhdyBkYXRh' * 8,
+            'duplicate': 0,
+            'previous_severity': 'minor',
+            'created': _timestamp(index),
+            'last_receive_time': _timestamp(index),
+        }
+        for index in range(offset, min(offset + limit, total))
+    ]).encode('utf-8')
+
+
+@lru_cache(maxsize=256)
+def _datasets_body(offset: int, limit: int, total: int) -> bytes:
+    return json.dumps([
+        {
+            'uuid': f'10000000-0000-0000-0000-{index:012d}',
+            'name': f'dataset {index}',
+            'format': 'ini',
+            'checksum': '853ff93762a06ddbf722c4ebe9ddd66d8f63ddaea97f521c3ecc20da7c976020',
+            'size': 1024,
+            'thing_uuid': 'f36834fb-8d96-4c01-b0e4-0bd85906bc25',
+            'created': _timestamp(index),
+            'created_by': 'f36834fb-8d96-4c01-b0e4-0bd85906bc25',
+            'updated': _timestamp(index),
+            'updated_by': 'f36834fb-8d96-4c01-b0e4-0bd85906bc25',
+            'tags': ['tag1'],
+        }
+        for index in range(offset, min(offset + limit, total))
+    ]).encode('utf-8')
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    server: 'MockSelfHostServer'
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def _send(self, status: int, body: bytes = b'') -> None:
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _paging(self, query: Dict[str, List[str]], total: int) -> Tuple[int, int, int]:
+        return int(query.get('offset', ['0'])[0]), int(query.get('limit', ['20'])[0]), total
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        if _TIMESERIES_DATA_PATH.match(url.path):
+            self._send(200, _timeseries_data_body(self.server.points))
+        elif url.path == '/v2/tsquery':
+            self._send(200, _tsquery_body(tuple(query.get('uuids', [])), self.server.points))
+        elif url.path == '/v2/alerts':
+            self._send(200, _alerts_body(*self._paging(query, self.server.items)))
+        elif url.path == '/v2/datasets':
+            self._send(200, _datasets_body(*self._paging(query, self.server.items)))
+        else:
+            self._send(404)
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if _TIMESERIES_DATA_PATH.match(urlparse(self.path).path):
+            self._send(201)
+        else:
+            self._send(404)
+
+
+class MockSelfHostServer(ThreadingHTTPServer):
+    """
+    Serves synthetic timeseries data, alerts and datasets on a local port
+
+    Example::
+
+        with MockSelfHostServer(points=10000) as server:
+            client = SelfHostClient(base_url=server.base_url, username='bench', password='bench')
+    """
+    daemon_threads = True
+
+    def __init__(self, points: int = 10000, items: int = 1000, port: int = 0) -> None:
+        """MockSelfHostServer constructor
+
+        Args:
+            points (int): The number of data points served per timeseries.
+            items (int): The total number of alerts and datasets available for paging.
+            port (int): The port to listen on, a free port is picked by default.
+        """
+        super().__init__(('127.0.0.1', port), _Handler)
+        self.points = points
+        self.items = items
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        return f'http://127.0.0.1:{self.server_address[1]}'
+
+    def __enter__(self) -> 'MockSelfHostServer':
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.shutdown()
+        self.server_close()
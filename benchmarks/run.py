@@ -0,0 +1,162 @@
+"""Benchmarks of the hot paths of the client against a local mock of the NODA Self-host API
+
+Usage::
+
+    $ python -m benchmarks.run
+    $ python -m benchmarks.run --output before.json
+    $ python -m benchmarks.run --compare before.json
+
+Every benchmark is run a number of times after a warm up round and reports the median, the fastest and the 95th
+percentile latency together with a throughput in benchmark specific units, e.g. data points per second.
+Results written with --output record the commit and Python version so runs on different commits can be compared.
+"""
+import argparse
+import datetime
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pyrfc3339
+
+from selfhost_client import SelfHostClient
+
+from .mock_server import MockSelfHostServer, data_points
+
+_START = datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc)
+_END = datetime.datetime(2022, 12, 31, tzinfo=datetime.timezone.utc)
+_UUIDS = [f'20000000-0000-0000-0000-{index:012d}' for index in range(10)]
+
+Benchmark = Tuple[str, str, Callable[[], int]]
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _page(fetch: Callable[..., List], page_size: int) -> int:
+    fetched = 0
+    while True:
+        page = fetch(limit=page_size, offset=fetched)
+        fetched += len(page)
+        if len(page) < page_size:
+            return fetched
+
+
+def _benchmarks(client: SelfHostClient, points: int, page_size: int) -> List[Benchmark]:
+    raw_points = json.dumps(data_points(points))
+    decoded_points = [{'v': point['v'], 'ts': pyrfc3339.parse(point['ts'])} for point in data_points(points)]
+
+    def get_timeseries_data() -> int:
+        return len(client.get_timeseries_data(_UUIDS[0], _START, _END))
+
+    def get_multiple_timeseries_data() -> int:
+        return sum(len(series['data']) for series in client.get_multiple_timeseries_data(_UUIDS, _START, _END))
+
+    def create_timeseries_data() -> int:
+        client.create_timeseries_data(_UUIDS[0], decoded_points)
+        return len(decoded_points)
+
+    def decode_json() -> int:
+        return len(json.loads(raw_points))
+
+    def decode_timestamps() -> int:
+        return len([pyrfc3339.parse(point['ts']) for point in data_points(points)])
+
+    return [
+        ('get_timeseries_data', 'points', get_timeseries_data),
+        ('get_multiple_timeseries_data', 'points', get_multiple_timeseries_data),
+        ('create_timeseries_data', 'points', create_timeseries_data),
+        ('get_alerts paging', 'alerts', lambda: _page(client.get_alerts, page_size)),
+        ('get_datasets paging', 'datasets', lambda: _page(client.get_datasets, page_size)),
+        ('json decoding', 'points', decode_json),
+        ('timestamp decoding', 'points', decode_timestamps),
+    ]
+
+
+def _measure(function: Callable[[], int], repeat: int) -> Dict[str, float]:
+    function()
+    durations: List[float] = []
+    units = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        units = function()
+        durations.append(time.perf_counter() - started)
+    durations.sort()
+    median = statistics.median(durations)
+    return {
+        'median_ms': median * 1000,
+        'min_ms': durations[0] * 1000,
+        'p95_ms': durations[min(len(durations) - 1, int(len(durations) * 0.95))] * 1000,
+        'throughput': units / median if median else 0.0,
+    }
+
+
+def run(points: int, items: int, page_size: int, repeat: int, only: Optional[List[str]] = None) -> Dict:
+    """Runs the benchmarks and returns the results keyed by benchmark name"""
+    results: Dict[str, Dict] = {}
+    with MockSelfHostServer(points=points, items=items) as server:
+        client = SelfHostClient(base_url=server.base_url, username='benchmark', password='benchmark')
+        for name, unit, function in _benchmarks(client, points, page_size):
+            if only and not any(pattern in name for pattern in only):
+                continue
+            results[name] = {'unit': unit, **_measure(function, repeat)}
+    return {
+        'commit': _commit(),
+        'python': platform.python_version(),
+        'parameters': {'points': points, 'items': items, 'page_size': page_size, 'repeat': repeat},
+        'results': results,
+    }
+
+
+def _print(report: Dict, baseline: Optional[Dict]) -> None:
+    header = f'{"benchmark":<32}{"median ms":>12}{"min ms":>12}{"p95 ms":>12}{"throughput":>22}'
+    if baseline:
+        header += f'{"vs " + str(baseline.get("commit")):>16}'
+    print(f'commit {report["commit"]}, python {report["python"]}, {report["parameters"]}')
+    print(header)
+    for name, result in report['results'].items():
+        line = (
+            f'{name:<32}{result["median_ms"]:>12.2f}{result["min_ms"]:>12.2f}{result["p95_ms"]:>12.2f}'
+            f'{result["throughput"]:>14.0f} {result["unit"] + "/s":<7}'
+        )
+        previous = baseline.get('results', {}).get(name) if baseline else None
+        if previous:
+            line += f'{previous["median_ms"] / result["median_ms"]:>15.2f}x'
+        print(line)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--points', type=int, default=10000, help='data points per timeseries')
+    parser.add_argument('--items', type=int, default=1000, help='alerts and datasets available for paging')
+    parser.add_argument('--page-size', type=int, default=100, help='page size used when paging')
+    parser.add_argument('--repeat', type=int, default=10, help='measured runs per benchmark')
+    parser.add_argument('--only', nargs='*', help='only run benchmarks whose name contains one of these')
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    parser.add_argument('--compare', help='compare with the results in this JSON file')
+    args = parser.parse_args(argv)
+
+    baseline: Optional[Dict] = None
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+
+    report = run(args.points, args.items, args.page_size, args.repeat, args.only)
+    _print(report, baseline)
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -2,7 +2,7 @@ __version__ = '0.1.0'
 
 import logging
 from .client import SelfHostClient
-from .alerts_client import AlertsClient
+from .alerts_client import AlertsClient, LazyRawData
 from .base_client import BaseClient
 from .datasets_client import DatasetsClient
 from .groups_client import GroupsClient
@@ -11,6 +11,17 @@ from .programs_client import ProgramsClient
 from .things_client import ThingsClient
 from .timeseries_client import TimeseriesClient
 from .users_client import UsersClient
+from .tsquery_planner import TsQueryPlanner
+from .metrics import MetricsCollector
+from .tracing import Tracer, OpenTelemetryTracer
+from .dataset_cache import DatasetCache
+from .alert_batcher import AlertBatcher
+from .backfill import Backfill
+from .export import export_timeseries
+from .bulk_import import import_timeseries
+from .alert_store import AlertStore
+from .units import UnitRegistry, unit_registry
+from .alert_severity import AlertSeverity, filter_alerts, sort_alerts_by_severity
 from .exceptions import (
     SelfHostBadRequestException,
     SelfHostUnauthorizedException,
@@ -18,23 +29,31 @@ from .exceptions import (
     SelfHostNotFoundException,
     SelfHostMethodNotAllowedException,
     SelfHostConflictException,
+    SelfHostRangeNotSatisfiableException,
     SelfHostTooManyRequestsException,
     SelfHostInternalServerException,
-    SelfHostFatalErrorException
+    SelfHostFatalErrorException,
+    SelfHostChecksumMismatchException,
+    SelfHostOutOfBoundsException,
+    SelfHostImportFailedException
 )
-from .types.dataset_types import DatasetType, DatasetResponse
+from .types.dataset_types import DatasetType, DatasetResponse, DatasetSyncResultType
 from .types.program_types import ProgramType
 from .types.timeseries_types import (
     TimeseriesType,
     TimeseriesDataType,
     TimeseriesDataPointType,
     TimeseriesDataPointResponse,
-    TimeseriesDataResponse
+    TimeseriesDataResponse,
+    BackfillProgressType,
+    ImportProgressType
 )
 from .types.thing_types import ThingType
 from .types.user_types import UserType, UserTokenType, CreatedUserTokenResponse, UserTokenResponse
 from .types.group_types import GroupType
 from .types.policy_types import PolicyType
-from .types.alert_types import AlertType, CreatedAlertResponse, AlertResponse
+from .types.alert_types import AlertType, CreatedAlertResponse, AlertResponse, FlushedAlertType, AlertChangesType
+from .types.request_types import RequestMetricsType
+from .types.batch_types import BatchResultType
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
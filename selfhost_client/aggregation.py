@@ -0,0 +1,359 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from warnings import filterwarnings
+
+from beartype import beartype
+from beartype.roar import BeartypeDecorHintPep585DeprecationWarning
+
+from .dataframes import pd, require_pandas
+from .timezones import utc_to_wall_clock, wall_clock_to_utc
+
+filterwarnings("ignore", category=BeartypeDecorHintPep585DeprecationWarning)
+
+PRECISIONS = (
+    'microseconds', 'milliseconds', 'second', 'minute', 'minute5', 'minute10', 'minute15', 'minute20', 'minute30',
+    'hour', 'day', 'week', 'month', 'year', 'decade', 'century', 'millennia'
+)
+
+AGGREGATES = ('avg', 'min', 'max', 'sum', 'count')
+
+_PANDAS_AGGREGATES: Dict[str, str] = {
+    'avg': 'mean',
+    'min': 'min',
+    'max': 'max',
+    'sum': 'sum',
+    'count': 'count',
+}
+
+# How the aggregates of source buckets are combined into the aggregates of the buckets containing them.
+_COMBINED_AGGREGATES: Dict[str, str] = {
+    'min': 'min',
+    'max': 'max',
+    'sum': 'sum',
+    'count': 'sum',
+}
+
+_FIXED_PRECISIONS: Dict[str, int] = {
+    'microseconds': 1,
+    'milliseconds': 1000,
+    'second': 1000000,
+    'minute': 60000000,
+    'minute5': 300000000,
+    'minute10': 600000000,
+    'minute15': 900000000,
+    'minute20': 1200000000,
+    'minute30': 1800000000,
+    'hour': 3600000000,
+    'day': 86400000000,
+}
+
+# The calendar precisions whose buckets are unions of whole buckets of another calendar precision. Decades start
+# with year 0 and centuries with year 1, so a century is not made of decades.
+_CALENDAR_PRECISIONS: Dict[str, Tuple[str, ...]] = {
+    'week': ('day',),
+    'month': ('day',),
+    'year': ('month', 'day'),
+    'decade': ('year', 'month', 'day'),
+    'century': ('year', 'month', 'day'),
+    'millennia': ('century', 'year', 'month', 'day'),
+}
+
+
+def _fixed_offsets() -> Dict[str, Any]:
+    return {
+        'microseconds': pd.offsets.Micro(1),
+        'milliseconds': pd.offsets.Milli(1),
+        'second': pd.offsets.Second(1),
+        'minute': pd.offsets.Minute(1),
+        'minute5': pd.offsets.Minute(5),
+        'minute10': pd.offsets.Minute(10),
+        'minute15': pd.offsets.Minute(15),
+        'minute20': pd.offsets.Minute(20),
+        'minute30': pd.offsets.Minute(30),
+        'hour': pd.offsets.Hour(1),
+        'day': pd.offsets.Day(1),
+    }
+
+
+def _truncate_years(wall_clock: Any, first_year: Callable[[Any], Any]) -> Any:
+    years = first_year(wall_clock.dt.year.to_numpy())
+    return pd.Series((years - 1970).astype('datetime64[Y]').astype('datetime64[us]'), index=wall_clock.index)
+
+
+def _truncate_wall_clock(wall_clock: Any, precision: str) -> Any:
+    fixed_offsets = _fixed_offsets()
+    if precision in fixed_offsets:
+        return wall_clock.dt.floor(fixed_offsets[precision])
+    if precision == 'week':
+        return wall_clock.dt.normalize() - pd.to_timedelta(wall_clock.dt.dayofweek, unit='D')
+    if precision == 'month':
+        return pd.Series(wall_clock.to_numpy().astype('datetime64[M]').astype('datetime64[us]'), index=wall_clock.index)
+    if precision == 'year':
+        return _truncate_years(wall_clock, lambda years: years)
+    if precision == 'decade':
+        return _truncate_years(wall_clock, lambda years: years // 10 * 10)
+    # Centuries and millennia start with year 1, e.g. the 21st century starts 2001-01-01.
+    if precision == 'century':
+        return _truncate_years(wall_clock, lambda years: (years - 1) // 100 * 100 + 1)
+    return _truncate_years(wall_clock, lambda years: (years - 1) // 1000 * 1000 + 1)
+
+
+@beartype
+def truncate_timestamps(timestamps: Any, precision: str, timezone: Optional[str] = None) -> Any:
+    """Truncates timestamps to the start of their precision bucket
+
+    Buckets follow the same rules as the precision option of the NODA Self-host API. They are computed on the
+    wall clock of the given time zone, weeks start on Mondays and centuries and millennia start with year 1.
+    Around daylight saving time transitions a bucket is anchored at the first occurrence of its wall clock time.
+    The UTC offsets are looked up in cached transition tables of the time zone, see
+    :func:`selfhost_client.timezones.utc_to_wall_clock`.
+
+    Args:
+        timestamps (pandas.Series): Time zone aware timestamps.
+        precision (str): The precision to truncate to.
+            Available values : microseconds, milliseconds, second, minute, minute5, minute10,
+            minute15, minute20, minute30, hour, day, week, month, year, decade, century, millennia
+        timezone (Optional[str]): IANA time zone to compute the buckets in. Defaults to UTC.
+
+    Returns:
+        pandas.Series: The start of the bucket of every timestamp, in the given time zone.
+
+    Raises:
+        ImportError: pandas is not installed.
+        ValueError: Unknown precision or time zone.
+    """
+    require_pandas()
+    if precision not in PRECISIONS:
+        raise ValueError(f'precision must be one of {", ".join(PRECISIONS)}, got {precision}')
+
+    timezone = timezone or 'UTC'
+    utc = pd.Series(timestamps).dt.tz_convert('UTC').dt.tz_localize(None)
+    wall_clock = pd.Series(
+        utc_to_wall_clock(utc.to_numpy(dtype='datetime64[us]'), timezone),
+        index=utc.index
+    )
+    buckets = _truncate_wall_clock(wall_clock, precision)
+    instants = wall_clock_to_utc(buckets.to_numpy(dtype='datetime64[us]'), timezone)
+    return pd.Series(instants, index=utc.index).dt.tz_localize('UTC').dt.tz_convert(timezone)
+
+
+def _percentile(aggregate: str) -> Optional[float]:
+    if not aggregate.startswith('p'):
+        return None
+    try:
+        percentile = float(aggregate[1:])
+    except ValueError:
+        return None
+    return percentile / 100 if 0 <= percentile <= 100 else None
+
+
+def _parse_aggregates(aggregates: List[str]) -> Dict[str, float]:
+    """Validates aggregate names and returns the percentiles among them as fractions"""
+    percentiles: Dict[str, float] = {}
+    for aggregate in aggregates:
+        if aggregate in AGGREGATES:
+            continue
+        percentile = _percentile(aggregate)
+        if percentile is None:
+            raise ValueError(f'aggregate must be one of {", ".join(AGGREGATES)} or a percentile, got {aggregate}')
+        percentiles[aggregate] = percentile
+    return percentiles
+
+
+@beartype
+def validate_aggregation(precision: str, aggregates: List[str]) -> None:
+    """Checks the options of :func:`aggregate_timeseries_dataframe` before any data is fetched for it
+
+    Args:
+        precision (str): The size of the buckets, see :func:`truncate_timestamps` for available values.
+        aggregates (List[str]): The aggregates to compute, see :func:`aggregate_timeseries_dataframe`.
+
+    Raises:
+        ValueError: Unknown precision or aggregate.
+    """
+    if precision not in PRECISIONS:
+        raise ValueError(f'precision must be one of {", ".join(PRECISIONS)}, got {precision}')
+    _parse_aggregates(aggregates)
+
+
+def _divides(precision: str, source_precision: str) -> bool:
+    if precision in _FIXED_PRECISIONS:
+        if source_precision not in _FIXED_PRECISIONS:
+            return False
+        size, source_size = _FIXED_PRECISIONS[precision], _FIXED_PRECISIONS[source_precision]
+        return size > source_size and size % source_size == 0
+    if source_precision in _FIXED_PRECISIONS:
+        return _divides('day', source_precision) or source_precision == 'day'
+    return source_precision in _CALENDAR_PRECISIONS[precision]
+
+
+@beartype
+def source_aggregates(precision: str, aggregates: List[str], source_precision: str) -> List[str]:
+    """Lists the aggregates to fetch per source bucket to compute aggregates of the buckets containing them
+
+    Every bucket of precision must be made of whole buckets of source_precision, e.g. hours of minute15 buckets
+    or years of months, but not minute30 of minute20 buckets. avg is computed from the sum and count of the source
+    buckets, weighted by their number of data points, and percentiles can not be computed from source buckets.
+
+    Args:
+        precision (str): The size of the buckets to aggregate, see :func:`truncate_timestamps`.
+        aggregates (List[str]): The aggregates to compute, see :func:`aggregate_timeseries_dataframe`.
+        source_precision (str): The size of the source buckets.
+
+    Returns:
+        List[str]: The aggregates of the NODA Self-host API to fetch per source bucket.
+
+    Raises:
+        ValueError: Unknown precision or aggregate, a percentile, or precision not a multiple of source_precision.
+    """
+    for name, value in (('precision', precision), ('source_precision', source_precision)):
+        if value not in PRECISIONS:
+            raise ValueError(f'{name} must be one of {", ".join(PRECISIONS)}, got {value}')
+    if not _divides(precision, source_precision):
+        raise ValueError(f'precision must be a multiple of source_precision, got {precision} and {source_precision}')
+    percentiles: Dict[str, float] = _parse_aggregates(aggregates)
+    if percentiles:
+        raise ValueError(f'Percentiles can not be computed with source_precision, got {", ".join(percentiles)}')
+
+    fetched: List[str] = []
+    for aggregate in aggregates:
+        for source in (('sum', 'count') if aggregate == 'avg' else (aggregate,)):
+            if source not in fetched:
+                fetched.append(source)
+    return fetched
+
+
+@beartype
+def combine_bucket_aggregates(
+        frames: Dict[str, Any],
+        precision: str,
+        aggregates: List[str],
+        timezone: Optional[str] = None
+) -> Any:
+    """Computes aggregates per precision bucket from the aggregates of finer source buckets
+
+    Args:
+        frames (Dict[str, pandas.DataFrame]): The source buckets in the long layout with the columns uuid, ts and v,
+            per aggregate listed by :func:`source_aggregates`.
+        precision (str): The size of the buckets, see :func:`truncate_timestamps` for available values.
+        aggregates (List[str]): The aggregates to compute, avg, min, max, sum or count.
+        timezone (Optional[str]): IANA time zone to compute the buckets in. Defaults to UTC.
+
+    Returns:
+        pandas.DataFrame: One row per timeseries and bucket with the columns uuid, ts and one column per aggregate.
+
+    Raises:
+        ImportError: pandas is not installed.
+        ValueError: Unknown precision or aggregate.
+    """
+    require_pandas()
+    columns: Dict[str, Any] = {}
+    for source, frame in frames.items():
+        bucketed = pd.DataFrame({
+            'uuid': frame['uuid'],
+            'ts': truncate_timestamps(frame['ts'], precision, timezone),
+            'v': frame['v'],
+        })
+        columns[source] = bucketed.groupby(['uuid', 'ts'], observed=True, sort=True)['v'].agg(
+            _COMBINED_AGGREGATES[source]
+        )
+    combined = pd.DataFrame(columns)
+
+    result = pd.DataFrame(index=combined.index)
+    for aggregate in aggregates:
+        if aggregate == 'avg':
+            result[aggregate] = combined['sum'] / combined['count']
+        elif aggregate in _COMBINED_AGGREGATES:
+            result[aggregate] = combined[aggregate]
+        else:
+            raise ValueError(f'aggregate must be one of {", ".join(AGGREGATES)}, got {aggregate}')
+    if 'count' in aggregates:
+        result['count'] = result['count'].astype('int64')
+    return result.reset_index()
+
+
+@beartype
+def aggregate_timeseries_dataframe(
+        frame: Any,
+        precision: str,
+        aggregates: List[str],
+        timezone: Optional[str] = None
+) -> Any:
+    """Computes several aggregates per precision bucket of timeseries data in one pass
+
+    Args:
+        frame (pandas.DataFrame): Timeseries data in the long layout with the columns uuid, ts and v, as returned by
+            :func:`selfhost_client.dataframes.timeseries_data_to_dataframe`.
+        precision (str): The size of the buckets, see :func:`truncate_timestamps` for available values.
+        aggregates (List[str]): The aggregates to compute.
+
+            -   avg
+
+            -   min
+
+            -   max
+
+            -   sum
+
+            -   count
+
+            -   pNN: The NNth percentile, e.g. p50, p95 or p99.9
+
+        timezone (Optional[str]): IANA time zone to compute the buckets in. Defaults to UTC.
+
+    Returns:
+        pandas.DataFrame: One row per timeseries and bucket with the columns uuid, ts and one column per aggregate.
+
+    Raises:
+        ImportError: pandas is not installed.
+        ValueError: Unknown precision or aggregate.
+    """
+    require_pandas()
+    percentiles: Dict[str, float] = _parse_aggregates(aggregates)
+
+    bucketed = pd.DataFrame({
+        'uuid': frame['uuid'],
+        'ts': truncate_timestamps(frame['ts'], precision, timezone),
+        'v': frame['v'],
+    })
+    grouped = bucketed.groupby(['uuid', 'ts'], observed=True, sort=True)['v']
+
+    columns: Dict[str, Any] = {}
+    for aggregate in aggregates:
+        if aggregate in percentiles:
+            columns[aggregate] = grouped.quantile(percentiles[aggregate])
+        else:
+            columns[aggregate] = grouped.agg(_PANDAS_AGGREGATES[aggregate])
+    result = pd.DataFrame(columns) if columns else grouped.size().to_frame()[[]]
+    return result.reset_index()
+
+
+@beartype
+def resample_timeseries_dataframe(
+        frame: Any,
+        precision: str,
+        timezones: List[str],
+        aggregates: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Buckets the same timeseries data in several time zones
+
+    Data fetched once in UTC can be reported for every region, instead of fetching it once per time zone with the
+    timezone option of the API.
+
+    Args:
+        frame (pandas.DataFrame): Timeseries data in the long layout with the columns uuid, ts and v.
+        precision (str): The size of the buckets, see :func:`truncate_timestamps` for available values.
+        timezones (List[str]): IANA time zones to compute the buckets in.
+        aggregates (Optional[List[str]]): The aggregates to compute, see :func:`aggregate_timeseries_dataframe`.
+            Defaults to avg.
+
+    Returns:
+        Dict[str, pandas.DataFrame]: The aggregates of :func:`aggregate_timeseries_dataframe` per time zone.
+
+    Raises:
+        ImportError: pandas is not installed.
+        ValueError: Unknown precision, aggregate or time zone.
+    """
+    return {
+        timezone: aggregate_timeseries_dataframe(frame, precision, aggregates or ['avg'], timezone)
+        for timezone in timezones
+    }
@@ -0,0 +1,202 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Union
+from warnings import filterwarnings
+
+from beartype import beartype
+from beartype.roar import BeartypeDecorHintPep585DeprecationWarning
+
+from .alerts_client import AlertsClient
+from .types.alert_types import FlushedAlertType
+from .types.batch_types import BatchResultType
+
+filterwarnings("ignore", category=BeartypeDecorHintPep585DeprecationWarning)
+
+logger = logging.getLogger(__name__)
+
+
+def default_alert_key(alert: Dict[str, Any]) -> Hashable:
+    """Considers alerts duplicates when their resource, environment and event are equal"""
+    return alert.get('resource'), alert.get('environment'), alert.get('event')
+
+
+class _PendingAlert:
+    __slots__ = ('alert', 'count', 'first_seen')
+
+    def __init__(self, alert: Dict[str, Any], first_seen: float) -> None:
+        self.alert = alert
+        self.count = 1
+        self.first_seen = first_seen
+
+
+class AlertBatcher:
+    """
+    Coalesces duplicate alerts on the client before they are created
+
+    Alerts with the same key that are added within window seconds of each other are created once, with the fields of
+    the last occurrence, and their number of occurrences is reported to on_flush and in the flushed outcomes. The
+    count is only reported locally, the created alert does not carry it unless key or the caller puts it into one of
+    its fields. Alerts are flushed concurrently once their window has passed, when more than max_pending distinct
+    alerts are waiting, and when the batcher is closed.
+
+    Flushing happens in a background thread while the batcher is used as a context manager or after :meth:`start`,
+    otherwise whenever alerts are added or :meth:`flush_due` is called.
+
+    Example::
+
+        with AlertBatcher(client, window=30, on_flush=report) as batcher:
+            for event in monitor:
+                batcher.add(resource=event.resource, environment='production', event=event.name, ...)
+    """
+
+    @beartype
+    def __init__(
+            self,
+            client: AlertsClient,
+            window: Union[int, float] = 10.0,
+            max_pending: int = 10000,
+            max_workers: int = 8,
+            key: Callable[[Dict[str, Any]], Hashable] = default_alert_key,
+            on_flush: Optional[Callable[[List[FlushedAlertType]], None]] = None,
+            clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """AlertBatcher constructor
+
+        Args:
+            client (:class:`.AlertsClient`): The client used to create the alerts.
+            window (float): The number of seconds duplicates of an alert are coalesced after its first occurrence.
+            max_pending (int): The maximum number of distinct alerts kept before all of them are flushed.
+            max_workers (int): The maximum number of alerts created concurrently.
+            key (Callable[[Dict[str, Any]], Hashable]): Returns the key of an alert, given the keyword arguments of
+                :meth:`.AlertsClient.create_alert`. Alerts with equal keys are duplicates.
+                Defaults to the resource, environment and event of the alert.
+            on_flush (Optional[Callable[[List[FlushedAlertType]], None]]): Called with the outcome of every flush,
+                including those of the background thread. Exceptions it raises in the background thread are logged.
+            clock (Callable[[], float]): Returns the current time in seconds.
+        """
+        if window < 0 or max_pending < 1:
+            raise ValueError('window must not be negative and max_pending must be positive')
+        self._client = client
+        self._window = window
+        self._max_pending = max_pending
+        self._max_workers = max_workers
+        self._key = key
+        self._on_flush = on_flush
+        self._clock = clock
+        self._pending: 'OrderedDict[Hashable, _PendingAlert]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> 'AlertBatcher':
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Returns the number of distinct alerts waiting to be flushed"""
+        return len(self._pending)
+
+    def add(self, **alert: Any) -> bool:
+        """Adds an occurrence of an alert
+
+        Args:
+            **alert: The keyword arguments of :meth:`.AlertsClient.create_alert`.
+
+        Returns:
+            bool: Whether the alert is new, i.e. not coalesced with a pending duplicate.
+        """
+        now: float = self._clock()
+        key: Hashable = self._key(alert)
+        with self._lock:
+            pending: Optional[_PendingAlert] = self._pending.get(key)
+            if pending is not None and now - pending.first_seen < self._window:
+                pending.alert = alert
+                pending.count += 1
+                return False
+            if pending is None:
+                self._pending[key] = _PendingAlert(alert, now)
+            full: bool = len(self._pending) > self._max_pending
+        if pending is not None:
+            # The window of the duplicate has passed, its pending alert is flushed before the new one is added.
+            self.flush_due()
+            return self.add(**alert)
+        if full:
+            self.flush()
+        elif self._thread is None:
+            self.flush_due()
+        return True
+
+    def flush_due(self) -> List[FlushedAlertType]:
+        """Creates the alerts whose window has passed
+
+        Returns:
+            List[:class:`.FlushedAlertType`]: The outcome for every flushed alert, in the order they first occurred.
+        """
+        now: float = self._clock()
+        with self._lock:
+            due: List[_PendingAlert] = []
+            while self._pending and now - next(iter(self._pending.values())).first_seen >= self._window:
+                due.append(self._pending.popitem(last=False)[1])
+        return self._create(due)
+
+    def flush(self) -> List[FlushedAlertType]:
+        """Creates all pending alerts
+
+        Returns:
+            List[:class:`.FlushedAlertType`]: The outcome for every flushed alert, in the order they first occurred.
+        """
+        with self._lock:
+            due: List[_PendingAlert] = list(self._pending.values())
+            self._pending.clear()
+        return self._create(due)
+
+    def start(self) -> None:
+        """Starts flushing alerts in a background thread as soon as their window has passed"""
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name='alert-batcher', daemon=True)
+        self._thread.start()
+
+    def close(self) -> List[FlushedAlertType]:
+        """Stops the background thread and creates all pending alerts
+
+        Returns:
+            List[:class:`.FlushedAlertType`]: The outcome for every flushed alert, in the order they first occurred.
+        """
+        if self._thread is not None:
+            self._stopped.set()
+            self._thread.join()
+            self._thread = None
+        return self.flush()
+
+    def _run(self) -> None:
+        interval: float = min(max(self._window / 10, 0.01), 1.0)
+        while not self._stopped.wait(interval):
+            try:
+                self.flush_due()
+            except Exception:
+                # The thread keeps flushing, otherwise alerts would pile up until close.
+                logger.exception('Flushing alerts failed')
+
+    def _create(self, due: List[_PendingAlert]) -> List[FlushedAlertType]:
+        if not due:
+            return []
+        results: List[BatchResultType] = self._client.create_alerts_many(
+            [pending.alert for pending in due],
+            max_workers=self._max_workers
+        )
+        flushed: List[FlushedAlertType] = [{
+            'alert': pending.alert,
+            'count': pending.count,
+            'result': result['result'],
+            'exception': result['exception'],
+        } for pending, result in zip(due, results)]
+        if self._on_flush is not None:
+            self._on_flush(flushed)
+        return flushed
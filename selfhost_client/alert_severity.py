@@ -0,0 +1,103 @@
+import enum
+from typing import Dict, Iterable, List, Optional, Union
+from warnings import filterwarnings
+
+from beartype import beartype
+from beartype.roar import BeartypeDecorHintPep585DeprecationWarning
+
+from .types.alert_types import AlertType
+
+filterwarnings("ignore", category=BeartypeDecorHintPep585DeprecationWarning)
+
+
+class AlertSeverity(enum.IntEnum):
+    """
+    The severities of alerts, ranked so that more severe alerts compare greater
+
+    Example::
+
+        AlertSeverity.parse('critical') >= AlertSeverity.MAJOR  # True
+    """
+    INDETERMINATE = 0
+    TRACE = 1
+    DEBUG = 2
+    INFORMATIONAL = 3
+    WARNING = 4
+    MINOR = 5
+    MAJOR = 6
+    CRITICAL = 7
+    SECURITY = 8
+
+    @classmethod
+    def parse(cls, severity: Union[str, 'AlertSeverity']) -> 'AlertSeverity':
+        """Returns the severity of its name as used by the API, e.g. 'critical'
+
+        Raises:
+            ValueError: Unknown severity.
+        """
+        if isinstance(severity, AlertSeverity):
+            return severity
+        try:
+            return _SEVERITIES[severity]
+        except KeyError:
+            raise ValueError(f'Unknown severity: {severity}') from None
+
+
+_SEVERITIES: Dict[str, AlertSeverity] = {severity.name.lower(): severity for severity in AlertSeverity}
+
+# The rank of every severity name, looked up once per alert. Unknown severities rank below all others.
+SEVERITY_RANKS: Dict[str, int] = {name: int(severity) for name, severity in _SEVERITIES.items()}
+UNKNOWN_SEVERITY_RANK = -1
+
+
+def severity_rank(severity: Optional[str]) -> int:
+    """Returns the rank of a severity name, :data:`UNKNOWN_SEVERITY_RANK` for unknown severities"""
+    return SEVERITY_RANKS.get(severity, UNKNOWN_SEVERITY_RANK)
+
+
+@beartype
+def filter_alerts(
+        alerts: Iterable[AlertType],
+        severity_ge: Optional[Union[str, AlertSeverity]] = None,
+        severity_le: Optional[Union[str, AlertSeverity]] = None,
+        status: Optional[List[str]] = None
+) -> List[AlertType]:
+    """Returns the alerts within a range of severities, locally, like the filters of :meth:`.AlertsClient.get_alerts`
+
+    Args:
+        alerts (Iterable[:class:`.AlertType`]): The alerts to filter, e.g. a cached listing or an :class:`.AlertStore`.
+        severity_ge (Optional[Union[str, AlertSeverity]]): The alerts must be at least this severe.
+        severity_le (Optional[Union[str, AlertSeverity]]): The alerts must be at most this severe.
+        status (Optional[List[str]]): The alerts must have one of these statuses.
+
+    Returns:
+        List[:class:`.AlertType`]: The matching alerts, in their original order.
+
+    Raises:
+        ValueError: Unknown severity.
+    """
+    lowest: int = AlertSeverity.parse(severity_ge) if severity_ge is not None else UNKNOWN_SEVERITY_RANK
+    highest: int = AlertSeverity.parse(severity_le) if severity_le is not None else max(AlertSeverity)
+    statuses: Optional[frozenset] = frozenset(status) if status is not None else None
+    return [
+        alert for alert in alerts
+        if lowest <= severity_rank(alert.get('severity')) <= highest and (
+            statuses is None or alert.get('status') in statuses
+        )
+    ]
+
+
+@beartype
+def sort_alerts_by_severity(alerts: Iterable[AlertType], descending: bool = True) -> List[AlertType]:
+    """Returns the alerts sorted by severity, the most severe first by default
+
+    Alerts of equal severity keep their original order.
+
+    Args:
+        alerts (Iterable[:class:`.AlertType`]): The alerts to sort.
+        descending (bool): Whether the most severe alerts come first.
+
+    Returns:
+        List[:class:`.AlertType`]
+    """
+    return sorted(alerts, key=lambda alert: severity_rank(alert.get('severity')), reverse=descending)
@@ -0,0 +1,236 @@
+import datetime
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+from warnings import filterwarnings
+
+from beartype import beartype
+from beartype.roar import BeartypeDecorHintPep585DeprecationWarning
+
+from .alert_severity import AlertSeverity, severity_rank, UNKNOWN_SEVERITY_RANK
+from .alerts_client import AlertsClient
+from .types.alert_types import AlertChangesType, AlertType
+
+filterwarnings("ignore", category=BeartypeDecorHintPep585DeprecationWarning)
+
+
+class AlertStore:
+    """
+    A local copy of the alerts of the NODA Self-host API, indexed by uuid, status, severity and tags
+
+    :meth:`refresh` pages through the alerts and only re-indexes those that were added or changed in any field since
+    the last refresh. Filtered queries are then answered from the indexes without contacting the server.
+
+    The API can not filter alerts by last_receive_time or created, so the store can not pull only the alerts received
+    after its :attr:`watermark`. Every refresh fetches all alerts matching the filters, which also finds the removed
+    ones, and only the work of indexing is incremental. Use filters to keep the refreshes small.
+
+    The rawdata of the alerts is omitted by default, since dashboards rarely show it.
+
+    Example::
+
+        store = AlertStore(client, filters={'environment': 'production'})
+        while True:
+            store.refresh()
+            show(store.query(status=['open'], severity=['critical', 'major']))
+            time.sleep(5)
+    """
+
+    @beartype
+    def __init__(
+            self,
+            client: AlertsClient,
+            filters: Optional[Dict[str, Any]] = None,
+            page_size: int = 500,
+            rawdata_mode: str = 'omit'
+    ) -> None:
+        """AlertStore constructor
+
+        Args:
+            client (:class:`.AlertsClient`): The client used to fetch the alerts.
+            filters (Optional[Dict[str, Any]]): Keyword arguments of :meth:`.AlertsClient.get_alerts` limiting which
+                alerts are kept, e.g. {'environment': 'production'}.
+            page_size (int): The number of alerts fetched per request.
+            rawdata_mode (str): The rawdata_mode of :meth:`.AlertsClient.get_alerts`.
+        """
+        self._client = client
+        self._filters: Dict[str, Any] = dict(filters or {})
+        self._page_size = page_size
+        self._rawdata_mode = rawdata_mode
+        self._lock = threading.Lock()
+        self._alerts: Dict[str, AlertType] = {}
+        self._by_status: Dict[str, Set[str]] = {}
+        self._by_severity: Dict[str, Set[str]] = {}
+        self._by_tag: Dict[str, Set[str]] = {}
+        self._watermark: Optional[datetime.datetime] = None
+
+    def __len__(self) -> int:
+        return len(self._alerts)
+
+    def __contains__(self, alert_uuid: object) -> bool:
+        return alert_uuid in self._alerts
+
+    def __iter__(self) -> Iterator[AlertType]:
+        return iter(list(self._alerts.values()))
+
+    @property
+    def watermark(self) -> Optional[datetime.datetime]:
+        """The latest last_receive_time of the stored alerts, None before the first refresh
+
+        It is not sent to the server, which can not filter by it, but tells how recent the store is.
+        """
+        return self._watermark
+
+    def refresh(self) -> AlertChangesType:
+        """Fetches all alerts matching the filters and updates the store with those that changed
+
+        This is a full sweep on every call, since the API has no filter for the alerts received after the
+        :attr:`watermark`. Alerts that are no longer returned by the server are removed, unless alerts were added or
+        removed on the server while the sweep paged through them, which may have made it skip some.
+
+        Returns:
+            :class:`.AlertChangesType`: The uuids of the alerts that were added, updated and removed.
+
+        Raises:
+            The exceptions of :meth:`.AlertsClient.get_alerts`. The store is left unchanged.
+        """
+        fetched, stable = self._fetch()
+        changes: AlertChangesType = {'added': [], 'updated': [], 'removed': []}
+        with self._lock:
+            seen: Set[str] = set()
+            for alert in fetched:
+                seen.add(alert['uuid'])
+                previous: Optional[AlertType] = self._alerts.get(alert['uuid'])
+                if previous is None:
+                    changes['added'].append(alert['uuid'])
+                elif previous != alert:
+                    self._unindex(previous)
+                    changes['updated'].append(alert['uuid'])
+                else:
+                    continue
+                self._alerts[alert['uuid']] = alert
+                self._index(alert)
+            # Alerts missing from a sweep that was shifted may have been skipped, they are removed by a later refresh.
+            for alert_uuid in [alert_uuid for alert_uuid in self._alerts if stable and alert_uuid not in seen]:
+                self._unindex(self._alerts.pop(alert_uuid))
+                changes['removed'].append(alert_uuid)
+            self._watermark = max(
+                (alert['last_receive_time'] for alert in self._alerts.values() if alert.get('last_receive_time')),
+                default=None
+            )
+        return changes
+
+    def get(self, alert_uuid: str) -> Optional[AlertType]:
+        """Returns a stored alert, or None if it is not stored"""
+        return self._alerts.get(alert_uuid)
+
+    @beartype
+    def query(
+            self,
+            status: Optional[List[str]] = None,
+            severity: Optional[List[str]] = None,
+            tags: Optional[List[str]] = None,
+            severity_ge: Optional[Union[str, AlertSeverity]] = None,
+            severity_le: Optional[Union[str, AlertSeverity]] = None
+    ) -> List[AlertType]:
+        """Returns the stored alerts matching all given filters, most recently received first
+
+        Args:
+            status (Optional[List[str]]): The alert must have one of these statuses.
+            severity (Optional[List[str]]): The alert must have one of these severities.
+            tags (Optional[List[str]]): The alert must have all of these tags.
+            severity_ge (Optional[Union[str, AlertSeverity]]): The alert must be at least this severe.
+            severity_le (Optional[Union[str, AlertSeverity]]): The alert must be at most this severe.
+
+        Returns:
+            List[:class:`.AlertType`]
+
+        Raises:
+            ValueError: Unknown severity.
+        """
+        with self._lock:
+            candidates: List[Set[str]] = []
+            if status is not None:
+                candidates.append(set().union(*(self._by_status.get(value, set()) for value in status)))
+            if severity is not None:
+                candidates.append(set().union(*(self._by_severity.get(value, set()) for value in severity)))
+            if severity_ge is not None or severity_le is not None:
+                candidates.append(self._severity_range(severity_ge, severity_le))
+            for tag in tags or []:
+                candidates.append(self._by_tag.get(tag, set()))
+            uuids: Set[str] = set.intersection(*sorted(candidates, key=len)) if candidates else set(self._alerts)
+            alerts: List[AlertType] = [self._alerts[alert_uuid] for alert_uuid in uuids]
+        return sorted(alerts, key=_received, reverse=True)
+
+    def _severity_range(
+            self,
+            severity_ge: Optional[Union[str, AlertSeverity]],
+            severity_le: Optional[Union[str, AlertSeverity]]
+    ) -> Set[str]:
+        lowest: int = AlertSeverity.parse(severity_ge) if severity_ge is not None else UNKNOWN_SEVERITY_RANK
+        highest: int = AlertSeverity.parse(severity_le) if severity_le is not None else max(AlertSeverity)
+        return set().union(*(
+            uuids for severity, uuids in self._by_severity.items() if lowest <= severity_rank(severity) <= highest
+        ))
+
+    def _fetch(self) -> Tuple[List[AlertType], bool]:
+        """Pages through the alerts and returns them, and whether no page was shifted by changes on the server
+
+        Every page after the first also fetches the last alert of the previous page. When the server inserted or
+        deleted alerts before it in the meantime, the page starts with another alert, and alerts may have been
+        skipped. Alerts that a shifted page repeats are only returned once.
+        """
+        alerts: List[AlertType] = self._client.get_alerts(
+            limit=self._page_size,
+            offset=0,
+            rawdata_mode=self._rawdata_mode,
+            **self._filters
+        )
+        seen: Set[str] = {alert['uuid'] for alert in alerts}
+        stable: bool = True
+        received: int = len(alerts)
+        offset: int = received
+        last_uuid: Optional[str] = alerts[-1]['uuid'] if alerts else None
+        while received == self._page_size:
+            page: List[AlertType] = self._client.get_alerts(
+                limit=self._page_size + 1,
+                offset=offset - 1,
+                rawdata_mode=self._rawdata_mode,
+                **self._filters
+            )
+            if not page:
+                stable = False
+                break
+            if page[0]['uuid'] != last_uuid:
+                stable = False
+            received = len(page) - 1
+            offset += received
+            last_uuid = page[-1]['uuid']
+            for alert in page:
+                if alert['uuid'] not in seen:
+                    seen.add(alert['uuid'])
+                    alerts.append(alert)
+        return alerts, stable
+
+    def _index(self, alert: AlertType) -> None:
+        self._by_status.setdefault(alert.get('status'), set()).add(alert['uuid'])
+        self._by_severity.setdefault(alert.get('severity'), set()).add(alert['uuid'])
+        for tag in alert.get('tags') or []:
+            self._by_tag.setdefault(tag, set()).add(alert['uuid'])
+
+    def _unindex(self, alert: AlertType) -> None:
+        for index, values in (
+                (self._by_status, [alert.get('status')]),
+                (self._by_severity, [alert.get('severity')]),
+                (self._by_tag, alert.get('tags') or []),
+        ):
+            for value in values:
+                uuids: Set[str] = index.get(value, set())
+                uuids.discard(alert['uuid'])
+                if not uuids:
+                    index.pop(value, None)
+
+
+def _received(alert: AlertType) -> datetime.datetime:
+    return alert.get('last_receive_time') or alert.get('created') or datetime.datetime.min.replace(
+        tzinfo=datetime.timezone.utc
+    )
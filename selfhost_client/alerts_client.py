@@ -1,4 +1,5 @@
-from typing import List, Optional
+import base64
+from typing import Any, Dict, List, Optional, Union
 from warnings import filterwarnings
 
 import pyrfc3339
@@ -7,12 +8,61 @@ from beartype import beartype
 from beartype.roar import BeartypeDecorHintPep585DeprecationWarning
 
 from .base_client import BaseClient
+from .tracing import traced
+from .types.batch_types import BatchResultType
 from .types.alert_types import AlertType, CreatedAlertResponse, AlertResponse
 from .utils import filter_none_values_from_dict
 
 filterwarnings("ignore", category=BeartypeDecorHintPep585DeprecationWarning)
 Response = requests.models.Response
 
+RAWDATA_MODES = ('encoded', 'lazy', 'omit')
+
+
+class LazyRawData:
+    """
+    The base64 encoded rawdata of an alert, decoded to bytes on first access
+
+    Example::
+
+        alert['rawdata'].encoded  # 'aGVsbG8sIHdvcmxkIQ=='
+        bytes(alert['rawdata'])  # b'hello, world!', decoded once and memoized
+    """
+
+    __slots__ = ('encoded', '_decoded')
+
+    def __init__(self, encoded: str) -> None:
+        self.encoded: str = encoded
+        self._decoded: Optional[bytes] = None
+
+    @property
+    def decoded(self) -> bytes:
+        """The decoded rawdata"""
+        if self._decoded is None:
+            self._decoded = base64.b64decode(self.encoded)
+        return self._decoded
+
+    def __bytes__(self) -> bytes:
+        return self.decoded
+
+    def __str__(self) -> str:
+        return self.encoded
+
+    def __repr__(self) -> str:
+        return f'LazyRawData({self.encoded!r})'
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, LazyRawData) and other.encoded == self.encoded
+
+    def __hash__(self) -> int:
+        return hash(self.encoded)
+
+
+def _rawdata(encoded: Optional[str], mode: str) -> Union[None, str, LazyRawData]:
+    if encoded is None or mode == 'omit':
+        return None
+    return LazyRawData(encoded) if mode == 'lazy' else encoded
+
 
 class AlertsClient(BaseClient):
     """
@@ -28,6 +78,7 @@ class AlertsClient(BaseClient):
         super().__init__(base_url, username, password)
         self._alerts_api_path = 'alerts'
 
+    @traced
     @beartype
     def get_alerts(self,
                    limit: Optional[int] = None,
@@ -41,7 +92,8 @@ class AlertsClient(BaseClient):
                    severity_ge: Optional[str] = None,
                    severity: Optional[str] = None,
                    tags: Optional[List[str]] = None,
-                   service: Optional[List[str]] = None
+                   service: Optional[List[str]] = None,
+                   rawdata_mode: str = 'encoded'
                    ) -> List[AlertType]:
         """Fetches alerts from NODA Self-host API
 
@@ -92,11 +144,19 @@ class AlertsClient(BaseClient):
 
             tags (Optional[List[str]]): List of tags pinned to the alert.
             service (Optional[List[str]]): Array of services to match on.
+            rawdata_mode (str): How the rawdata of the alerts is returned.
+
+                -   encoded: The base64 encoded string, the default.
+
+                -   lazy: A :class:`LazyRawData`, decoded to bytes on first access.
+
+                -   omit: None, e.g. for listings that do not show the rawdata.
 
         Returns:
             List[:class:`.AlertType`]
 
         Raises:
+            ValueError: Unknown rawdata_mode.
             :class:`.SelfHostBadRequestException`: Sent request had insufficient data or invalid options.
             :class:`.SelfHostUnauthorizedException`: Request was refused due to lacking authentication credentials.
             :class:`.SelfHostForbiddenException`: Server understands the request but refuses to authorize it.
@@ -104,6 +164,9 @@ class AlertsClient(BaseClient):
             :class:`.SelfHostInternalServerException`: Server encountered an unexpected condition that prevented it
                 from fulfilling the request.
         """
+        if rawdata_mode not in RAWDATA_MODES:
+            raise ValueError(f'rawdata_mode must be one of {", ".join(RAWDATA_MODES)}, got {rawdata_mode}')
+
         response: Response = self._session.get(
             url=f'{self._base_url}/{self._api_version}/{self._alerts_api_path}',
             params=filter_none_values_from_dict({
@@ -135,13 +198,14 @@ class AlertsClient(BaseClient):
             'origin': alert.get('origin'),
             'tags': alert.get('tags'),
             'timeout': alert.get('timeout'),
-            'rawdata': alert.get('rawdata'),
+            'rawdata': _rawdata(alert.get('rawdata'), rawdata_mode),
             'duplicate': alert.get('duplicate'),
             'previous_severity': alert.get('previous_severity'),
             'created': pyrfc3339.parse(alert.get('created')),
             'last_receive_time': pyrfc3339.parse(alert.get('last_receive_time')),
         } for alert in alerts]
 
+    @traced
     @beartype
     def create_alert(self,
                      resource: str,
@@ -235,6 +299,7 @@ class AlertsClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def get_alert(self, alert_uuid: str) -> AlertType:
         """Returns an alert from NODA Self-host API by UUID
@@ -279,6 +344,7 @@ class AlertsClient(BaseClient):
             'last_receive_time': pyrfc3339.parse(alert.get('last_receive_time')),
         }
 
+    @traced
     @beartype
     def update_alert(self,
                      alert_uuid: str,
@@ -374,6 +440,7 @@ class AlertsClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def delete_alert(self, alert_uuid: str) -> None:
         """Deletes an alert from NODA Self-host API
@@ -394,3 +461,65 @@ class AlertsClient(BaseClient):
             url=f'{self._base_url}/{self._api_version}/{self._alerts_api_path}/{alert_uuid}'
         )
         return self._process_response(response)
+
+    @traced
+    @beartype
+    def create_alerts_many(self,
+                           alerts: List[Dict[str, Any]],
+                           max_workers: int = 8
+                           ) -> List[BatchResultType]:
+        """Adds many alerts to the NODA Self-host API concurrently
+
+        Calls :meth:`create_alert` for every item, at most max_workers at a time.
+        A failing call does not stop the others.
+
+        Args:
+            alerts (List[Dict[str, Any]]): The keyword arguments of :meth:`create_alert` for every item.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            List[:class:`.BatchResultType`]: The created alert or the raised exception of every item,
+            in the order of alerts.
+        """
+        return self._run_many(self.create_alert, alerts, max_workers)
+
+    @traced
+    @beartype
+    def update_alerts_many(self,
+                           alerts: List[Dict[str, Any]],
+                           max_workers: int = 8
+                           ) -> List[BatchResultType]:
+        """Updates many alerts in the NODA Self-host API concurrently
+
+        Calls :meth:`update_alert` for every item, at most max_workers at a time.
+        A failing call does not stop the others.
+
+        Args:
+            alerts (List[Dict[str, Any]]): The keyword arguments of :meth:`update_alert` for every item,
+                including alert_uuid.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            List[:class:`.BatchResultType`]: The outcome of every item, in the order of alerts.
+        """
+        return self._run_many(self.update_alert, alerts, max_workers)
+
+    @traced
+    @beartype
+    def delete_alerts_many(self,
+                           alert_uuids: List[str],
+                           max_workers: int = 8
+                           ) -> List[BatchResultType]:
+        """Deletes many alerts from the NODA Self-host API concurrently
+
+        Calls :meth:`delete_alert` for every UUID, at most max_workers at a time.
+        A failing call does not stop the others.
+
+        Args:
+            alert_uuids (List[str]): UUIDs of the alerts to delete.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            List[:class:`.BatchResultType`]: The outcome of every UUID, in the order of alert_uuids.
+        """
+        return self._run_many(self.delete_alert, alert_uuids, max_workers)
@@ -0,0 +1,177 @@
+from operator import itemgetter
+from typing import Any, Iterator, List, Optional, Tuple, Union
+from warnings import filterwarnings
+
+from beartype import beartype
+from beartype.roar import BeartypeDecorHintPep585DeprecationWarning
+
+from .types.timeseries_types import TimeseriesDataPointResponse, TimeseriesDataResponse, TimeseriesDataType
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pc = None
+    pq = None
+
+filterwarnings("ignore", category=BeartypeDecorHintPep585DeprecationWarning)
+
+_get_ts = itemgetter('ts')
+_get_v = itemgetter('v')
+
+
+def require_pyarrow() -> None:
+    """Makes sure that the optional pyarrow dependency is installed
+
+    Raises:
+        ImportError: pyarrow is not installed.
+    """
+    if pa is None:
+        raise ImportError(
+            'pyarrow is required for Arrow and Parquet support, install it with: pip install selfhost_client[arrow]'
+        )
+
+
+def timeseries_schema() -> Any:
+    """Returns the Arrow schema used for timeseries data
+
+    The schema is in long format with one row per data point:
+
+        -   uuid: dictionary encoded UUID of the timeseries.
+
+        -   ts: timestamp in microseconds, UTC.
+
+        -   v: value of the data point.
+
+    Returns:
+        pyarrow.Schema
+
+    Raises:
+        ImportError: pyarrow is not installed.
+    """
+    require_pyarrow()
+    return pa.schema([
+        ('uuid', pa.dictionary(pa.int32(), pa.string())),
+        ('ts', pa.timestamp('us', tz='UTC')),
+        ('v', pa.float64()),
+    ])
+
+
+def _to_timestamp_array(timestamps: List[Any]) -> Any:
+    if timestamps and isinstance(timestamps[0], str):
+        # Arrow parses RFC 3339 strings, including offsets and fractional seconds, in a single cast.
+        return pc.cast(pa.array(timestamps, type=pa.string()), pa.timestamp('us', tz='UTC'))
+    return pa.array(timestamps, type=pa.timestamp('us', tz='UTC'))
+
+
+@beartype
+def timeseries_data_to_arrow(
+        timeseries_data: List[Union[TimeseriesDataType, TimeseriesDataResponse]]
+) -> Any:
+    """Converts the data of multiple timeseries into an Arrow table
+
+    The conversion works on both the decoded output of
+    :meth:`.TimeseriesClient.get_multiple_timeseries_data` and the undecoded response from the API.
+    See :func:`timeseries_schema` for the layout of the table.
+
+    Args:
+        timeseries_data (List[Union[TimeseriesDataType, TimeseriesDataResponse]]): Data of one or more timeseries.
+
+    Returns:
+        pyarrow.Table
+
+    Raises:
+        ImportError: pyarrow is not installed.
+    """
+    require_pyarrow()
+    uuids: List[str] = []
+    counts: List[int] = []
+    timestamps: List[Any] = []
+    values: List[float] = []
+    for series in timeseries_data:
+        data_points = series.get('data') or []
+        uuids.append(series.get('uuid'))
+        counts.append(len(data_points))
+        timestamps.extend(map(_get_ts, data_points))
+        values.extend(map(_get_v, data_points))
+
+    indices: List[int] = []
+    for index, count in enumerate(counts):
+        indices.extend([index] * count)
+
+    return pa.Table.from_arrays(
+        [
+            pa.DictionaryArray.from_arrays(pa.array(indices, type=pa.int32()), pa.array(uuids, type=pa.string())),
+            _to_timestamp_array(timestamps),
+            pa.array(values, type=pa.float64()),
+        ],
+        schema=timeseries_schema()
+    )
+
+
+def arrow_to_data_points(timestamps: Any, values: Any) -> List[TimeseriesDataPointResponse]:
+    """Converts arrays of timestamps and values to data points ready to be sent to the API
+
+    Args:
+        timestamps (pyarrow.Array): Timestamps, taken as UTC without a time zone, or RFC 3339 strings.
+        values (pyarrow.Array): Numeric values.
+
+    Returns:
+        List[:class:`.TimeseriesDataPointResponse`]
+    """
+    if pa.types.is_timestamp(timestamps.type):
+        if timestamps.type.tz is None:
+            timestamps = pc.assume_timezone(timestamps, 'UTC')
+        timestamps = pc.strftime(pc.cast(timestamps, pa.timestamp('us', tz='UTC')), format='%Y-%m-%dT%H:%M:%SZ')
+    return [
+        {'v': v, 'ts': ts}
+        for ts, v in zip(timestamps.to_pylist(), pc.cast(values, pa.float64()).to_pylist())
+    ]
+
+
+@beartype
+def read_timeseries_batches(
+        source: Any,
+        timeseries_uuid: Optional[str] = None,
+        batch_size: int = 10000
+) -> Iterator[Tuple[str, List[TimeseriesDataPointResponse]]]:
+    """Reads timeseries data points in batches from Parquet or Arrow
+
+    Only one batch is held in memory at a time when reading from a Parquet file.
+
+    Args:
+        source (Any): Path to a Parquet file, a pyarrow.Table or a pyarrow.RecordBatch
+            with the columns ts and v, and uuid unless timeseries_uuid is given.
+        timeseries_uuid (Optional[str]): UUID of the timeseries that all rows belong to.
+            Overrides the uuid column of the source.
+        batch_size (int): The maximum number of rows to read at a time.
+
+    Yields:
+        Tuple[str, List[:class:`.TimeseriesDataPointResponse`]]: The UUID of a timeseries
+        and a batch of its data points ready to be sent to the API.
+
+    Raises:
+        ImportError: pyarrow is not installed.
+    """
+    require_pyarrow()
+    if isinstance(source, pa.RecordBatch):
+        source = pa.Table.from_batches([source])
+
+    if isinstance(source, pa.Table):
+        batches = source.to_batches(max_chunksize=batch_size)
+    else:
+        batches = pq.ParquetFile(source).iter_batches(batch_size=batch_size)
+
+    for batch in batches:
+        if timeseries_uuid is not None:
+            yield timeseries_uuid, arrow_to_data_points(batch.column('ts'), batch.column('v'))
+            continue
+
+        uuids = batch.column('uuid')
+        if pa.types.is_dictionary(uuids.type):
+            uuids = uuids.cast(uuids.type.value_type)
+        for uuid in pc.unique(uuids).to_pylist():
+            rows = batch.filter(pc.equal(uuids, uuid))
+            yield uuid, arrow_to_data_points(rows.column('ts'), rows.column('v'))
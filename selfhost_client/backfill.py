@@ -0,0 +1,274 @@
+import datetime
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+from warnings import filterwarnings
+
+from beartype import beartype
+from beartype.roar import BeartypeDecorHintPep585DeprecationWarning
+
+from .timeseries_client import TimeseriesClient
+from .types.timeseries_types import BackfillProgressType, TimeseriesDataPointType
+
+filterwarnings("ignore", category=BeartypeDecorHintPep585DeprecationWarning)
+
+BACKFILL_EXECUTORS = ('thread', 'process')
+
+BackfillSource = Callable[[str, datetime.datetime, datetime.datetime], List[TimeseriesDataPointType]]
+
+# The clients of the worker processes, created once per process.
+_process_clients: Dict[Tuple[type, str, Tuple[str, str]], TimeseriesClient] = {}
+
+
+def _upload_window(
+        client: TimeseriesClient,
+        source: BackfillSource,
+        timeseries_uuid: str,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        upload: Dict[str, Any]
+) -> int:
+    data_points: List[TimeseriesDataPointType] = source(timeseries_uuid, start, end)
+    if data_points:
+        client.create_timeseries_data(timeseries_uuid, data_points, **upload)
+    return len(data_points)
+
+
+def _upload_window_in_process(
+        client_type: type,
+        base_url: str,
+        auth: Tuple[str, str],
+        source: BackfillSource,
+        timeseries_uuid: str,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        upload: Dict[str, Any]
+) -> int:
+    key = (client_type, base_url, auth)
+    if key not in _process_clients:
+        _process_clients[key] = client_type(base_url, *auth)
+    return _upload_window(_process_clients[key], source, timeseries_uuid, start, end, upload)
+
+
+class Backfill:
+    """
+    Copies the history of many timeseries from another source into NODA Self-host API
+
+    The work is split into one task per timeseries and time window. Every task reads the data points of its window
+    from the source and adds them with :meth:`.TimeseriesClient.create_timeseries_data`, up to max_workers tasks at
+    a time. Finished tasks are appended to a checkpoint file, so a backfill that is interrupted, or whose tasks
+    failed, continues with the remaining tasks when it is run again with the same checkpoint.
+
+    Example::
+
+        def read_historian(timeseries_uuid, start, end):
+            return [{'ts': row.time, 'v': row.value} for row in historian.read(tags[timeseries_uuid], start, end)]
+
+        backfill = Backfill(client, read_historian, list(tags), start, end, checkpoint='backfill.jsonl',
+                            progress=lambda p: print(f"{p['data_points_per_second']:.0f} points/s, eta {p['eta']}"))
+        result = backfill.run()
+    """
+
+    @beartype
+    def __init__(
+            self,
+            client: TimeseriesClient,
+            source: BackfillSource,
+            uuids: List[str],
+            start: datetime.datetime,
+            end: datetime.datetime,
+            window: datetime.timedelta = datetime.timedelta(days=1),
+            checkpoint: Optional[str] = None,
+            max_workers: int = 4,
+            executor: str = 'thread',
+            unit: Optional[str] = None,
+            bounds: Optional[str] = None,
+            progress: Optional[Callable[[BackfillProgressType], None]] = None
+    ) -> None:
+        """Backfill constructor
+
+        Args:
+            client (:class:`.TimeseriesClient`): The client used to add the data points.
+            source (Callable[[str, datetime, datetime], List[TimeseriesDataPointType]]): Returns the data points of a
+                timeseries from start (>=) to end (<). Must be picklable, e.g. a module level function, when the
+                executor is process.
+            uuids (List[str]): UUIDs of the timeseries to backfill.
+            start (datetime): Start (>=) of the time period to backfill.
+            end (datetime): End (<) of the time period to backfill.
+            window (timedelta): The length of the time period of every task.
+            checkpoint (Optional[str]): Path of the file recording the finished tasks. No checkpoint is kept if None.
+            max_workers (int): The maximum number of tasks run concurrently.
+            executor (str): Where the tasks run.
+
+                -   thread: In threads of this process, sharing the client.
+
+                -   process: In worker processes, each with a client with the base url and credentials of the
+                    given client. Request hooks, tracers and other settings of the client are not used.
+
+            unit (Optional[str]): The unit of the data points, see :meth:`.TimeseriesClient.create_timeseries_data`.
+            bounds (Optional[str]): Validates the data points, see :meth:`.TimeseriesClient.create_timeseries_data`.
+            progress (Optional[Callable[[BackfillProgressType], None]]): Called whenever a task is done.
+
+        Raises:
+            ValueError: Unknown executor, or a window that is not positive.
+        """
+        if executor not in BACKFILL_EXECUTORS:
+            raise ValueError(f'executor must be one of {", ".join(BACKFILL_EXECUTORS)}, got {executor}')
+        if window <= datetime.timedelta(0):
+            raise ValueError('window must be positive')
+        self._client = client
+        self._source = source
+        self._uuids = uuids
+        self._start = start
+        self._end = end
+        self._window = window
+        self._checkpoint = checkpoint
+        self._max_workers = max_workers
+        self._executor = executor
+        self._upload: Dict[str, Any] = {'unit': unit, 'bounds': bounds}
+        self._progress = progress
+
+    def tasks(self) -> Iterator[Tuple[str, datetime.datetime, datetime.datetime]]:
+        """Yields the timeseries UUID, start and end of every task, windows of a timeseries in order"""
+        for timeseries_uuid in self._uuids:
+            start: datetime.datetime = self._start
+            while start < self._end:
+                end: datetime.datetime = min(start + self._window, self._end)
+                yield timeseries_uuid, start, end
+                start = end
+
+    def run(self) -> BackfillProgressType:
+        """Runs the tasks that are not recorded as finished in the checkpoint
+
+        A failing task does not stop the others. It is reported in the result and run again by the next run.
+
+        Returns:
+            :class:`.BackfillProgressType`: The progress when all tasks are done.
+        """
+        finished: Set[str] = self._read_checkpoint()
+        uuids: Set[str] = set(self._uuids)
+        # The tasks are generated as they are submitted, a backfill can consist of millions of tasks.
+        pending: Iterator[Tuple[str, datetime.datetime, datetime.datetime]] = (
+            task for task in self.tasks() if self._key(*task) not in finished
+        )
+        progress: BackfillProgressType = {
+            'completed': sum(1 for key in finished if self._is_task(key, uuids)),
+            'total': len(self._uuids) * self._windows(),
+            'failed': {},
+            'data_points': 0,
+            'elapsed': 0.0,
+            'data_points_per_second': 0.0,
+            'eta': None,
+        }
+        started: float = time.monotonic()
+        completed_before: int = progress['completed']
+
+        with self._create_executor() as executor:
+            running: Dict[Future, Tuple[str, datetime.datetime, datetime.datetime]] = {}
+            while True:
+                # Only a few tasks are queued ahead of the workers.
+                for task in pending:
+                    running[self._submit(executor, *task)] = task
+                    if len(running) >= 2 * self._max_workers:
+                        break
+                if not running:
+                    return progress
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = running.pop(future)
+                    self._finish(task, future, progress)
+                self._report(progress, started, completed_before)
+
+    def _create_executor(self) -> Executor:
+        if self._executor == 'process':
+            return ProcessPoolExecutor(self._max_workers)
+        return ThreadPoolExecutor(self._max_workers, thread_name_prefix='backfill')
+
+    def _submit(
+            self,
+            executor: Executor,
+            timeseries_uuid: str,
+            start: datetime.datetime,
+            end: datetime.datetime
+    ) -> Future:
+        if self._executor == 'process':
+            return executor.submit(
+                _upload_window_in_process, type(self._client), self._client._base_url, self._client._session.auth,
+                self._source, timeseries_uuid, start, end, self._upload
+            )
+        return executor.submit(_upload_window, self._client, self._source, timeseries_uuid, start, end, self._upload)
+
+    def _finish(
+            self,
+            task: Tuple[str, datetime.datetime, datetime.datetime],
+            future: Future,
+            progress: BackfillProgressType
+    ) -> None:
+        if future.exception() is not None:
+            progress['failed'][f'{task[0]}/{task[1].isoformat()}'] = future.exception()
+            return
+        progress['completed'] += 1
+        progress['data_points'] += future.result()
+        if self._checkpoint is not None:
+            with open(self._checkpoint, 'a') as file:
+                file.write(json.dumps({
+                    'uuid': task[0],
+                    'start': task[1].isoformat(),
+                    'end': task[2].isoformat(),
+                    'data_points': future.result(),
+                }) + '\n')
+
+    def _report(self, progress: BackfillProgressType, started: float, completed_before: int) -> None:
+        progress['elapsed'] = time.monotonic() - started
+        if progress['elapsed'] > 0:
+            progress['data_points_per_second'] = progress['data_points'] / progress['elapsed']
+        completed: int = progress['completed'] - completed_before
+        if completed:
+            remaining: int = progress['total'] - progress['completed'] - len(progress['failed'])
+            progress['eta'] = progress['elapsed'] / completed * remaining
+        if self._progress is not None:
+            self._progress(progress)
+
+    def _read_checkpoint(self) -> Set[str]:
+        if self._checkpoint is None or not os.path.isfile(self._checkpoint):
+            return set()
+        finished: Set[str] = set()
+        line: str = '\n'
+        with open(self._checkpoint) as file:
+            for line in file:
+                try:
+                    record: Any = json.loads(line)
+                    finished.add(f"{record['uuid']}/{record['start']}/{record['end']}")
+                except (ValueError, KeyError, TypeError):
+                    continue
+        if not line.endswith('\n'):
+            # The last line is incomplete when the process was killed while writing it.
+            with open(self._checkpoint, 'a') as file:
+                file.write('\n')
+        return finished
+
+    def _windows(self) -> int:
+        """Returns the number of windows of every timeseries"""
+        if self._end <= self._start:
+            return 0
+        return -((self._start - self._end) // self._window)
+
+    def _is_task(self, key: str, uuids: Set[str]) -> bool:
+        """Tells whether a key of the checkpoint is one of the tasks, which may belong to another backfill"""
+        timeseries_uuid, _, period = key.partition('/')
+        start, _, end = period.partition('/')
+        if timeseries_uuid not in uuids:
+            return False
+        try:
+            task_start: datetime.datetime = datetime.datetime.fromisoformat(start)
+            windows: int = (task_start - self._start) // self._window
+        except (ValueError, TypeError):
+            return False
+        return 0 <= windows and task_start == self._start + windows * self._window and task_start < self._end \
+            and end == min(task_start + self._window, self._end).isoformat()
+
+    @staticmethod
+    def _key(timeseries_uuid: str, start: datetime.datetime, end: datetime.datetime) -> str:
+        return f'{timeseries_uuid}/{start.isoformat()}/{end.isoformat()}'
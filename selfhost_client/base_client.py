@@ -1,7 +1,11 @@
+import contextlib
 import json.decoder
 import logging
 import os
-from typing import Any, Dict, Optional, Type
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Type, Union
 from warnings import filterwarnings
 
 import requests
@@ -16,14 +20,33 @@ from .exceptions import (
     SelfHostInternalServerException,
     SelfHostMethodNotAllowedException,
     SelfHostNotFoundException,
+    SelfHostRangeNotSatisfiableException,
     SelfHostTooManyRequestsException,
     SelfHostUnauthorizedException,
 )
+from .session import RequestHook, SelfHostSession
+from .tracing import Tracer
+from .types.batch_types import BatchResultType
 
 filterwarnings("ignore", category=BeartypeDecorHintPep585DeprecationWarning)
 logger = logging.getLogger(__name__)
 Response = requests.models.Response
-Session = requests.sessions.Session
+_DECODED_CONTENT = "single_flight_content"
+
+
+class _LoggedBody:
+    """Formats a request body for the debug log only when the log record is emitted"""
+
+    __slots__ = ("body", "limit")
+
+    def __init__(self, body: Any, limit: Optional[int]) -> None:
+        self.body = body
+        self.limit = limit
+
+    def __str__(self) -> str:
+        if self.limit is None or not isinstance(self.body, (bytes, str)) or len(self.body) <= self.limit:
+            return str(self.body)
+        return f"{self.body[:self.limit]!s}... ({len(self.body) - self.limit} more bytes)"
 
 
 class BaseClient:
@@ -70,7 +93,8 @@ class BaseClient:
         else:
             raise SelfHostFatalErrorException("No base_url provided to client")
 
-        self._session: Session = requests.Session()
+        self._session: SelfHostSession = SelfHostSession()
+        self._session.api_url = f"{self._base_url}/{self._api_version}"
         if username and password:
             self._session.auth = (username, password)
         elif os.environ.get("SELF_HOST_USERNAME") and os.environ.get(
@@ -83,6 +107,103 @@ class BaseClient:
         else:
             raise SelfHostFatalErrorException("No credentials provided to client")
 
+        self._debug_body_limit: Optional[int] = 1000
+        self._debug_sample_rate: float = 1.0
+
+    @beartype
+    def enable_single_flight(self, enabled: bool = True) -> None:
+        """Enables or disables single flight for GET requests
+
+        With single flight enabled, concurrent calls that send identical GET requests, e.g. many threads calling
+        :meth:`.TimeseriesClient.get_timeseries_data` with the same arguments, share one HTTP request
+        and the decoded response body. Callers must treat the returned data as read-only since it is shared.
+
+        Args:
+            enabled (bool): Whether single flight should be enabled.
+        """
+        self._session.single_flight = enabled
+
+    @beartype
+    def add_request_hook(self, hook: RequestHook) -> None:
+        """Adds a hook that is called with the metrics of every request sent by the client
+
+        The hook receives a :class:`.RequestMetricsType` with the method, endpoint template, status code,
+        transferred bytes, timings, retries and raised exception of the request. Hooks are called in the thread that
+        sent the request, exceptions raised by a hook are logged and otherwise ignored.
+        Requests are only measured while at least one hook is added.
+
+        Args:
+            hook (Callable[[RequestMetricsType], None]): The hook to add.
+        """
+        self._session.request_hooks.append(hook)
+
+    @beartype
+    def remove_request_hook(self, hook: RequestHook) -> None:
+        """Removes a hook added with :meth:`add_request_hook`
+
+        Args:
+            hook (Callable[[RequestMetricsType], None]): The hook to remove.
+        """
+        self._session.request_hooks.remove(hook)
+
+    @beartype
+    def set_tracer(self, tracer: Optional[Tracer]) -> None:
+        """Sets the tracer that creates spans of the calls made by the client
+
+        Every public method gets a span named after it, e.g. TimeseriesClient.get_timeseries_data, with child spans
+        for the HTTP requests and for decoding the response bodies. The requests carry the headers propagating the
+        trace context. Tracing is disabled by default.
+
+        Args:
+            tracer (Optional[:class:`.Tracer`]): The tracer, e.g. an :class:`.OpenTelemetryTracer`,
+                or None to disable tracing.
+        """
+        self._session.tracer = tracer
+
+    @beartype
+    def configure_debug_logging(self, body_limit: Optional[int] = 1000, sample_rate: float = 1.0) -> None:
+        """Configures the debug log record of every processed response
+
+        The record is only built when the selfhost_client logger is enabled for DEBUG, and the request body is only
+        formatted when a handler emits the record.
+
+        Args:
+            body_limit (Optional[int]): The maximum number of characters of the request body to log.
+                Defaults to 1000, None logs the whole body.
+            sample_rate (float): The fraction of responses to log, between 0 and 1. Defaults to 1.
+
+        Raises:
+            ValueError: sample_rate is not between 0 and 1.
+        """
+        if not 0 <= sample_rate <= 1:
+            raise ValueError(f"sample_rate must be between 0 and 1, got {sample_rate}")
+        self._debug_body_limit = body_limit
+        self._debug_sample_rate = sample_rate
+
+    def _run_many(
+        self,
+        function: Callable[..., Any],
+        arguments: List[Union[Dict[str, Any], str]],
+        max_workers: int,
+    ) -> List[BatchResultType]:
+        """Calls a client method for every item concurrently, with the keyword arguments of dict items or
+        the positional argument of other items, and collects the outcome of every call in the order of the items
+        """
+
+        def call(argument: Union[Dict[str, Any], str]) -> BatchResultType:
+            try:
+                result: Any = function(**argument) if isinstance(argument, dict) else function(argument)
+            except Exception as e:
+                return {"result": None, "exception": e}
+            return {"result": result, "exception": None}
+
+        if not arguments:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(arguments)), thread_name_prefix="selfhost-batch"
+        ) as executor:
+            return list(executor.map(call, arguments))
+
     @beartype
     def _process_response(self, response: Response) -> Optional[Any]:
         """Process the response from EnergyView API
@@ -101,16 +222,27 @@ class BaseClient:
             :class:`.SelfHostMethodNotAllowedException`: The server knows the request method
                 but the target resource doesn't support this method.
             :class:`.SelfHostConflictException`: The request conflicts with the current state of the target resource.
+            :class:`.SelfHostRangeNotSatisfiableException`: The requested range lies outside of the resource.
             :class:`.SelfHostTooManyRequestsException`: Sent too many requests in a given amount of time.
             :class:`.SelfHostInternalServerException`: Server encountered an unexpected condition that prevented it
                 from fulfilling the request.
         """
-        logger.debug(
-            f"API Request sent:\n"
-            f"Url: {response.request.url}\n"
-            f"Body: {response.request.body}\n"
-            f"Status Code: {response.status_code}"
-        )
+        if logger.isEnabledFor(logging.DEBUG) and (
+            self._debug_sample_rate >= 1 or random.random() < self._debug_sample_rate
+        ):
+            body: Any = response.request.body
+            logger.debug(
+                "API Request sent:\nUrl: %s\nBody: %s\nStatus Code: %s",
+                response.request.url,
+                _LoggedBody(body, self._debug_body_limit),
+                response.status_code,
+                extra={
+                    "request_method": response.request.method,
+                    "request_url": response.request.url,
+                    "request_body_size": len(body) if isinstance(body, (bytes, str)) else None,
+                    "status_code": response.status_code,
+                },
+            )
         responses: Dict[int, Type[Exception]] = {
             400: SelfHostBadRequestException,
             401: SelfHostUnauthorizedException,
@@ -118,15 +250,35 @@ class BaseClient:
             404: SelfHostNotFoundException,
             405: SelfHostMethodNotAllowedException,
             409: SelfHostConflictException,
+            416: SelfHostRangeNotSatisfiableException,
             429: SelfHostTooManyRequestsException,
         }
 
         if response.status_code < 400:
-            try:
-                return response.json()
-            except json.decoder.JSONDecodeError:
-                return response.content or None
+            single_flight_lock = getattr(response, "single_flight_lock", None)
+            if single_flight_lock is None:
+                return self._decode_content(response)
+            with single_flight_lock:
+                if not hasattr(response, _DECODED_CONTENT):
+                    setattr(response, _DECODED_CONTENT, self._decode_content(response))
+                return getattr(response, _DECODED_CONTENT)
         elif 400 <= response.status_code < 500:
-            raise responses[response.status_code]
+            exception: Type[Exception] = responses[response.status_code]
         else:
-            raise SelfHostInternalServerException
+            exception = SelfHostInternalServerException
+        self._session.report_request(response, exception=exception.__name__)
+        raise exception
+
+    def _decode_content(self, response: Response) -> Optional[Any]:
+        tracer: Optional[Tracer] = self._session.tracer
+        span: Any = contextlib.nullcontext() if tracer is None else tracer.span(
+            "decode", {"http.response_content_length": len(response.content or b"")}
+        )
+        started: float = time.perf_counter()
+        with span:
+            try:
+                content: Optional[Any] = response.json()
+            except json.decoder.JSONDecodeError:
+                content = response.content or None
+        self._session.report_request(response, decode=time.perf_counter() - started)
+        return content
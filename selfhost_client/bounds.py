@@ -0,0 +1,99 @@
+from itertools import compress
+from operator import itemgetter
+from typing import Any, List, Optional, Tuple, Union
+
+from .exceptions import SelfHostOutOfBoundsException
+from .types.timeseries_types import TimeseriesDataPointResponse
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+BOUNDS_MODES = ('filter', 'clip', 'raise')
+
+Number = Union[int, float]
+
+# Below this number of data points, converting the values to an array costs more than comparing them one by one.
+_VECTORIZE_THRESHOLD = 64
+
+_get_v = itemgetter('v')
+
+
+def _within(data_points: List[TimeseriesDataPointResponse], lower: Number, upper: Number) -> Tuple[Any, int]:
+    """Returns whether the value of every data point is within the bounds, NaN and None are not, and how many are"""
+    if np is None or len(data_points) < _VECTORIZE_THRESHOLD:
+        within: Any = [
+            data_point['v'] is not None and lower <= data_point['v'] <= upper for data_point in data_points
+        ]
+        return within, sum(within)
+    # numpy reads None as NaN.
+    values: Any = np.fromiter(map(_get_v, data_points), dtype=np.float64, count=len(data_points))
+    within = (values >= lower) & (values <= upper)
+    return within, int(np.count_nonzero(within))
+
+
+def _is_number(value: Optional[Number]) -> bool:
+    """Returns whether a value is neither None nor NaN"""
+    return value is not None and value == value
+
+
+def apply_bounds(
+        data_points: List[TimeseriesDataPointResponse],
+        lower_bound: Optional[Number],
+        upper_bound: Optional[Number],
+        mode: str
+) -> Tuple[List[TimeseriesDataPointResponse], int]:
+    """Validates data points against the bounds of a timeseries
+
+    The values of many data points are compared with the bounds as one array when numpy is installed, and one by
+    one otherwise. Data points of which the value is NaN or None are out of bounds.
+
+    Args:
+        data_points (List[TimeseriesDataPointResponse]): The data points to validate.
+        lower_bound (Optional[Union[int, float]]): The lower bound, None for no lower bound.
+        upper_bound (Optional[Union[int, float]]): The upper bound, None for no upper bound.
+        mode (str): What to do with data points out of bounds.
+
+            -   filter: Leave them out.
+
+            -   clip: Replace their values with the nearest bound. Data points of which the value is NaN or None
+                have no nearest bound and are left out.
+
+            -   raise: Raise :class:`.SelfHostOutOfBoundsException`.
+
+    Returns:
+        Tuple[List[TimeseriesDataPointResponse], int]: The data points to upload and the number of data points that
+        were out of bounds. The given list is returned as is when all data points are within bounds.
+
+    Raises:
+        ValueError: Unknown mode.
+        :class:`.SelfHostOutOfBoundsException`: A data point is out of bounds and mode is raise.
+    """
+    if mode not in BOUNDS_MODES:
+        raise ValueError(f'mode must be one of {", ".join(BOUNDS_MODES)}, got {mode}')
+    if lower_bound is None and upper_bound is None:
+        return data_points, 0
+
+    lower: Number = float('-inf') if lower_bound is None else lower_bound
+    upper: Number = float('inf') if upper_bound is None else upper_bound
+    within, count = _within(data_points, lower, upper)
+    out_of_bounds: int = len(data_points) - count
+    if out_of_bounds == 0:
+        return data_points, 0
+    if not isinstance(within, list):
+        within = within.tolist()
+
+    if mode == 'raise':
+        first: TimeseriesDataPointResponse = data_points[within.index(False)]
+        raise SelfHostOutOfBoundsException(
+            f'{out_of_bounds} data points are out of the bounds [{lower_bound}, {upper_bound}], '
+            f'the first is {first["v"]} at {first["ts"]}'
+        )
+    if mode == 'filter':
+        return list(compress(data_points, within)), out_of_bounds
+    return [
+        data_point if valid else {'v': min(max(data_point['v'], lower), upper), 'ts': data_point['ts']}
+        for data_point, valid in zip(data_points, within)
+        if valid or _is_number(data_point['v'])
+    ], out_of_bounds
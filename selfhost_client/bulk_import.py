@@ -0,0 +1,330 @@
+import csv
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from warnings import filterwarnings
+
+import requests
+from beartype import beartype
+from beartype.roar import BeartypeDecorHintPep585DeprecationWarning
+
+from .arrow import arrow_to_data_points, pa, pc, pq, require_pyarrow
+from .exceptions import SelfHostImportFailedException, SelfHostInternalServerException, SelfHostTooManyRequestsException
+from .export import EXPORT_FORMATS, file_format_of
+from .timeseries_client import TimeseriesClient
+from .types.timeseries_types import ImportProgressType, TimeseriesDataPointResponse
+
+filterwarnings("ignore", category=BeartypeDecorHintPep585DeprecationWarning)
+
+logger = logging.getLogger(__name__)
+
+IMPORT_FORMATS = EXPORT_FORMATS
+
+# Failures that are worth sending a request again for.
+RETRYABLE_EXCEPTIONS = (
+    SelfHostTooManyRequestsException,
+    SelfHostInternalServerException,
+    requests.ConnectionError,
+    requests.Timeout,
+)
+
+Batch = Tuple[str, List[TimeseriesDataPointResponse]]
+
+
+def _read_columns(path: str, file_format: str) -> List[str]:
+    if file_format == 'parquet':
+        require_pyarrow()
+        return pq.ParquetFile(path).schema_arrow.names
+    with open(path, newline='') as file:
+        return next(csv.reader(file), [])
+
+
+def _check_columns(
+        names: List[str],
+        ts_column: str,
+        columns: Optional[Dict[str, str]],
+        create_si_unit: Optional[str]
+) -> Tuple[Optional[Dict[str, str]], List[str]]:
+    """Returns the UUID of every column to import, or None for a file in the long layout, and the columns to create
+    timeseries for"""
+    if ts_column not in names:
+        raise ValueError(f'The file has no {ts_column} column')
+    if columns is None and create_si_unit is None:
+        if 'uuid' not in names or 'v' not in names:
+            raise ValueError('Give the UUIDs of the columns to import, or create_si_unit to create timeseries for them')
+        return None, []
+    unknown: List[str] = [name for name in columns or {} if name not in names]
+    if unknown:
+        raise ValueError(f'The file has no {", ".join(unknown)} column')
+
+    mapping: Dict[str, str] = {
+        name: (columns or {})[name] for name in names if name != ts_column and name in (columns or {})
+    }
+    missing: List[str] = [name for name in names if name != ts_column and name not in mapping]
+    if create_si_unit is None:
+        missing = []
+    if not mapping and not missing:
+        raise ValueError('None of the columns of the file are imported')
+    return mapping, missing
+
+
+def _create_timeseries(
+        client: TimeseriesClient,
+        names: List[str],
+        si_unit: str,
+        mapping: Dict[str, str],
+        created: Dict[str, str]
+) -> None:
+    results = client.create_timeseries_many([{'name': name, 'si_unit': si_unit} for name in names])
+    for name, result in zip(names, results):
+        if result['exception'] is None:
+            created[name] = mapping[name] = result['result']['uuid']
+            logger.info('Created timeseries %s for column %s', created[name], name)
+    failed = [result['exception'] for result in results if result['exception'] is not None]
+    if failed:
+        raise failed[0]
+
+
+def _csv_rows(path: str, reader: Any, columns: int, chunk_size: int) -> List[List[str]]:
+    """Reads up to chunk_size rows, skipping empty lines"""
+    rows: List[List[str]] = []
+    for row in reader:
+        if not row:
+            continue
+        if len(row) < columns:
+            raise ValueError(f'{path}, line {reader.line_num}: expected {columns} columns, got {len(row)}')
+        rows.append(row)
+        if len(rows) == chunk_size:
+            break
+    return rows
+
+
+def _csv_chunks(
+        path: str,
+        ts_column: str,
+        mapping: Optional[Dict[str, str]],
+        chunk_size: int
+) -> Iterator[Tuple[int, List[Batch]]]:
+    with open(path, newline='') as file:
+        reader = csv.reader(file)
+        header: List[str] = next(reader)
+        ts: int = header.index(ts_column)
+        if mapping is None:
+            uuid, v = header.index('uuid'), header.index('v')
+        else:
+            targets: List[Tuple[int, str]] = [(header.index(name), mapping[name]) for name in mapping]
+        while True:
+            rows: List[List[str]] = _csv_rows(path, reader, len(header), chunk_size)
+            if not rows:
+                return
+            batches: Dict[str, List[TimeseriesDataPointResponse]] = {}
+            if mapping is None:
+                for row in rows:
+                    batches.setdefault(row[uuid], []).append({'v': float(row[v]), 'ts': row[ts]})
+            else:
+                for index, target in targets:
+                    # Empty cells have no data point.
+                    batches[target] = [{'v': float(row[index]), 'ts': row[ts]} for row in rows if row[index]]
+            yield len(rows), list(batches.items())
+
+
+def _parquet_chunks(
+        path: str,
+        ts_column: str,
+        mapping: Optional[Dict[str, str]],
+        chunk_size: int
+) -> Iterator[Tuple[int, List[Batch]]]:
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+        timestamps: Any = batch.column(ts_column)
+        if mapping is None:
+            uuids: Any = batch.column('uuid')
+            if pa.types.is_dictionary(uuids.type):
+                uuids = uuids.cast(uuids.type.value_type)
+            selections: List[Tuple[str, Any, Any]] = [
+                (uuid, batch.column('v'), pc.equal(uuids, uuid)) for uuid in pc.unique(uuids).to_pylist()
+            ]
+        else:
+            # Nulls have no data point.
+            selections = [(mapping[name], batch.column(name), pc.is_valid(batch.column(name))) for name in mapping]
+        yield batch.num_rows, [
+            (uuid, arrow_to_data_points(pc.filter(timestamps, mask), pc.filter(values, mask)))
+            for uuid, values, mask in selections
+        ]
+
+
+def _post(
+        client: TimeseriesClient,
+        batch: Batch,
+        unit: Optional[str],
+        bounds: Optional[str],
+        retries: int,
+        backoff: float
+) -> Tuple[int, int]:
+    """Sends the data points of a batch, retrying transient failures, and returns the number sent and of retries"""
+    uuid, data_points = batch
+    for attempt in range(retries + 1):
+        try:
+            return client.create_timeseries_data_raw(uuid, data_points, unit, bounds), attempt
+        except RETRYABLE_EXCEPTIONS as e:
+            if attempt == retries:
+                raise
+            logger.warning('Retrying %d data points of timeseries %s: %r', len(data_points), uuid, e)
+            time.sleep(backoff * 2 ** attempt)
+
+
+def _upload_chunk(
+        client: TimeseriesClient,
+        batches: List[Batch],
+        unit: Optional[str],
+        bounds: Optional[str],
+        retries: int,
+        backoff: float
+) -> Tuple[int, int]:
+    data_points: int = 0
+    retried: int = 0
+    for batch in batches:
+        sent, attempts = _post(client, batch, unit, bounds, retries, backoff)
+        data_points += sent
+        retried += attempts
+    return data_points, retried
+
+
+def _upload_chunks(
+        client: TimeseriesClient,
+        chunks: Iterator[Tuple[int, List[Batch]]],
+        result: ImportProgressType,
+        max_workers: int,
+        unit: Optional[str],
+        bounds: Optional[str],
+        retries: int,
+        backoff: float,
+        progress: Optional[Callable[[ImportProgressType], None]]
+) -> ImportProgressType:
+    started: float = time.monotonic()
+    with ThreadPoolExecutor(max_workers, thread_name_prefix='timeseries-import') as executor:
+        running: Dict[Future, int] = {}
+        try:
+            while True:
+                for rows, batches in chunks:
+                    running[executor.submit(_upload_chunk, client, batches, unit, bounds, retries, backoff)] = rows
+                    if len(running) >= 2 * max_workers:
+                        break
+                if not running:
+                    return result
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    rows = running.pop(future)
+                    data_points, retried = future.result()
+                    result['rows'] += rows
+                    result['data_points'] += data_points
+                    result['retries'] += retried
+                result['elapsed'] = time.monotonic() - started
+                if result['elapsed'] > 0:
+                    result['rows_per_second'] = result['rows'] / result['elapsed']
+                if progress is not None:
+                    progress(result)
+        finally:
+            for future in running:
+                future.cancel()
+
+
+@beartype
+def import_timeseries(
+        client: TimeseriesClient,
+        path: str,
+        columns: Optional[Dict[str, str]] = None,
+        file_format: Optional[str] = None,
+        ts_column: str = 'ts',
+        create_si_unit: Optional[str] = None,
+        chunk_size: int = 10000,
+        max_workers: int = 4,
+        retries: int = 3,
+        backoff: Union[int, float] = 1.0,
+        unit: Optional[str] = None,
+        bounds: Optional[str] = None,
+        progress: Optional[Callable[[ImportProgressType], None]] = None
+) -> ImportProgressType:
+    """Imports timeseries data from a CSV or Parquet file
+
+    The file is read in chunks of chunk_size rows. The data points of every chunk are added with one request per
+    timeseries, up to max_workers chunks at a time, and only a few chunks are read ahead of the uploads, so the size
+    of an import is not limited by memory. Requests that fail with 429 Too Many Requests, 500 Internal Server Error
+    or a connection error are sent again after backoff, 2 * backoff, 4 * backoff, ... seconds.
+
+    The file is in one of two layouts:
+
+        -   long: The columns uuid, ts and v, with one row per data point, as written by
+            :func:`selfhost_client.export.export_timeseries`. Used when neither columns nor create_si_unit are given.
+
+        -   wide: A ts column and one column of values per timeseries. Empty cells and nulls are skipped.
+
+    Timestamps of CSV files are sent as they are and must be RFC 3339 strings.
+
+    Example::
+
+        result = import_timeseries(client, 'meters.csv', columns={'meter_1': meter_1_uuid},
+                                   create_si_unit='kWh', progress=lambda p: print(f"{p['rows_per_second']:.0f} rows/s"))
+        result['created']  # The UUIDs of the timeseries created for the other columns
+
+    Args:
+        client (:class:`.TimeseriesClient`): The client used to add the data points.
+        path (str): The file to read.
+        columns (Optional[Dict[str, str]]): UUIDs of the timeseries of the columns to import in the wide layout,
+            keyed by column. Other columns are not imported unless create_si_unit is given.
+        file_format (Optional[str]): csv or parquet. Defaults to the format of the extension of path.
+        ts_column (str): The column with the timestamps.
+        create_si_unit (Optional[str]): Creates a timeseries with this SI unit for every column of the wide layout
+            that is not in columns, named after the column.
+        chunk_size (int): The number of rows read at a time, and the maximum number of data points per request.
+        max_workers (int): The maximum number of chunks uploaded concurrently.
+        retries (int): The maximum number of times a request is sent again.
+        backoff (Union[int, float]): Seconds to wait before the first retry of a request.
+        unit (Optional[str]): The SI unit of the data. A cast will occur if the base unit differs.
+        bounds (Optional[str]): Validates the data points, see :meth:`.TimeseriesClient.create_timeseries_data`.
+        progress (Optional[Callable[[ImportProgressType], None]]): Called whenever a chunk is uploaded.
+
+    Returns:
+        :class:`.ImportProgressType`: The progress when all chunks are uploaded.
+
+    Raises:
+        ImportError: pyarrow is not installed and file_format is parquet.
+        ValueError: Unknown file_format, a chunk_size or max_workers that is not positive, negative retries, or a
+            missing column.
+        :class:`.SelfHostImportFailedException`: Creating a timeseries or a request failed after all retries, or a
+            row of the file has too few columns or a value that is not a number. The exception is chained as the
+            cause. The chunks uploaded so far are kept. The created attribute maps the columns to the timeseries
+            created so far, so that importing again can use them instead of creating others.
+    """
+    file_format = file_format or file_format_of(path)
+    if file_format not in IMPORT_FORMATS:
+        raise ValueError(f'file_format must be one of {", ".join(IMPORT_FORMATS)}, got {file_format}')
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be positive')
+    if max_workers < 1:
+        raise ValueError('max_workers must be positive')
+    if retries < 0:
+        raise ValueError('retries must not be negative')
+
+    result: ImportProgressType = {
+        'rows': 0,
+        'data_points': 0,
+        'retries': 0,
+        'created': {},
+        'elapsed': 0.0,
+        'rows_per_second': 0.0,
+    }
+    mapping, missing = _check_columns(_read_columns(path, file_format), ts_column, columns, create_si_unit)
+    try:
+        if missing:
+            _create_timeseries(client, missing, create_si_unit, mapping, result['created'])
+        read_chunks = _parquet_chunks if file_format == 'parquet' else _csv_chunks
+        return _upload_chunks(
+            client, read_chunks(path, ts_column, mapping, chunk_size), result, max_workers, unit, bounds, retries,
+            backoff, progress
+        )
+    except Exception as e:
+        # Without them, importing the file again would create other timeseries for the same columns.
+        raise SelfHostImportFailedException(
+            f'Importing {path} failed after {result["rows"]} rows: {e}', dict(result['created'])
+        ) from e
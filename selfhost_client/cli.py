@@ -0,0 +1,199 @@
+import argparse
+import datetime
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pyrfc3339
+
+from .bounds import BOUNDS_MODES
+from .bulk_import import IMPORT_FORMATS, import_timeseries
+from .client import SelfHostClient
+from .exceptions import SelfHostImportFailedException
+from .export import EXPORT_FORMATS, export_timeseries
+from .types.timeseries_types import ImportProgressType
+
+
+def _datetime(value: str) -> datetime.datetime:
+    """Parses an RFC 3339 timestamp or an ISO 8601 date or time, which is taken as UTC without a time zone"""
+    parsed: datetime.datetime
+    try:
+        parsed = pyrfc3339.parse(value)
+    except ValueError:
+        try:
+            parsed = datetime.datetime.fromisoformat(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f'invalid timestamp: {value}') from None
+    # pyrfc3339 2 parses dates without a time zone, like fromisoformat.
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=datetime.timezone.utc)
+
+
+def _column(value: str) -> Tuple[str, str]:
+    """Parses a COLUMN=UUID mapping"""
+    name, separator, uuid = value.rpartition('=')
+    if not separator or not name or not uuid:
+        raise argparse.ArgumentTypeError(f'expected COLUMN=UUID, got {value}')
+    return name, uuid
+
+
+def _positive_int(value: str) -> int:
+    number: int = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'expected a positive integer, got {value}')
+    return number
+
+
+def _positive_float(value: str) -> float:
+    number: float = float(value)
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f'expected a positive number, got {value}')
+    return number
+
+
+def _non_negative_int(value: str) -> int:
+    number: int = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f'expected a non-negative integer, got {value}')
+    return number
+
+
+def _uuids(arguments: argparse.Namespace) -> List[str]:
+    uuids: List[str] = list(arguments.uuid or [])
+    if arguments.uuids_file is not None:
+        with open(arguments.uuids_file) as file:
+            uuids.extend(line.strip() for line in file if line.strip())
+    if not uuids:
+        raise SystemExit('error: no timeseries given, use --uuid or --uuids-file')
+    return uuids
+
+
+def _client(arguments: argparse.Namespace) -> SelfHostClient:
+    return SelfHostClient(arguments.base_url, arguments.username, arguments.password)
+
+
+def _rows_reporter(quiet: bool) -> Optional[Callable[[int], None]]:
+    if quiet:
+        return None
+    started: float = time.monotonic()
+
+    def report(rows: int) -> None:
+        elapsed: float = time.monotonic() - started
+        print(f'\r{rows} rows, {rows / elapsed if elapsed > 0 else 0:.0f} rows/s', end='', file=sys.stderr)
+
+    return report
+
+
+def _export(arguments: argparse.Namespace) -> int:
+    rows: int = export_timeseries(
+        _client(arguments),
+        _uuids(arguments),
+        arguments.start,
+        arguments.end,
+        arguments.output,
+        file_format=arguments.format,
+        window=datetime.timedelta(days=arguments.window_days),
+        uuids_per_request=arguments.uuids_per_request,
+        max_workers=arguments.max_workers,
+        unit=arguments.unit,
+        progress=_rows_reporter(arguments.quiet)
+    )
+    if not arguments.quiet:
+        print(f'\rExported {rows} rows to {arguments.output}', file=sys.stderr)
+    return 0
+
+
+def _import(arguments: argparse.Namespace) -> int:
+    def report(progress: ImportProgressType) -> None:
+        print(f"\r{progress['rows']} rows, {progress['rows_per_second']:.0f} rows/s", end='', file=sys.stderr)
+
+    def print_created(created: Dict[str, str]) -> None:
+        # The created timeseries are printed as mappings, so that importing more data uses them instead of new ones.
+        for name, uuid in created.items():
+            print(f'{name}={uuid}')
+
+    columns: Optional[Dict[str, str]] = dict(arguments.column) if arguments.column else None
+    try:
+        result: ImportProgressType = import_timeseries(
+            _client(arguments),
+            arguments.input,
+            columns=columns,
+            file_format=arguments.format,
+            ts_column=arguments.ts_column,
+            create_si_unit=arguments.create_si_unit,
+            chunk_size=arguments.chunk_size,
+            max_workers=arguments.max_workers,
+            retries=arguments.retries,
+            unit=arguments.unit,
+            bounds=arguments.bounds,
+            progress=None if arguments.quiet else report
+        )
+    except SelfHostImportFailedException as e:
+        print_created(e.created)
+        raise
+    print_created(result['created'])
+    if not arguments.quiet:
+        print(f"\rImported {result['rows']} rows, {result['data_points']} data points in {result['elapsed']:.1f} s, "
+              f"{result['rows_per_second']:.0f} rows/s, {result['retries']} retries", file=sys.stderr)
+    return 0
+
+
+def _add_connection_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_argument_group('connection', 'Default to the SELF_HOST_* environment variables')
+    group.add_argument('--base-url', help='base url of the NODA Self-host API')
+    group.add_argument('--username', help='username for the NODA Self-host API')
+    group.add_argument('--password', help='password for the NODA Self-host API')
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m selfhost_client', description='NODA Self-host API tools')
+    commands = parser.add_subparsers(dest='command', metavar='command')
+    commands.required = True
+
+    export = commands.add_parser('export', help='export timeseries data to a CSV or Parquet file')
+    export.add_argument('--uuid', action='append', help='UUID of a timeseries to export, can be repeated')
+    export.add_argument('--uuids-file', help='file with the UUIDs of the timeseries to export, one per line')
+    export.add_argument('--start', type=_datetime, required=True, help='start (>=) of the time period')
+    export.add_argument('--end', type=_datetime, required=True, help='end (<=) of the time period')
+    export.add_argument('--output', '-o', required=True, help='the file to write, .parquet or .pq for Parquet')
+    export.add_argument('--format', choices=EXPORT_FORMATS, help='defaults to the format of the output extension')
+    export.add_argument('--unit', help='SI unit of the exported values')
+    export.add_argument('--window-days', type=_positive_float, default=7,
+                        help='days fetched per request (default: 7)')
+    export.add_argument('--uuids-per-request', type=_positive_int, default=50,
+                        help='timeseries fetched per request (default: 50)')
+    export.add_argument('--max-workers', type=_positive_int, default=4, help='concurrent requests (default: 4)')
+    export.add_argument('--quiet', '-q', action='store_true', help='do not report progress')
+    _add_connection_arguments(export)
+    export.set_defaults(run=_export)
+
+    import_ = commands.add_parser('import', help='import timeseries data from a CSV or Parquet file')
+    import_.add_argument('input', help='the file to read, .parquet or .pq for Parquet')
+    import_.add_argument('--column', '-c', type=_column, action='append', metavar='COLUMN=UUID',
+                         help='import a column into a timeseries, can be repeated. Without any, the file must have '
+                              'the columns uuid, ts and v')
+    import_.add_argument('--create-si-unit', help='create timeseries with this SI unit for the other columns')
+    import_.add_argument('--ts-column', default='ts', help='the column with the timestamps (default: ts)')
+    import_.add_argument('--format', choices=IMPORT_FORMATS, help='defaults to the format of the input extension')
+    import_.add_argument('--unit', help='SI unit of the imported values')
+    import_.add_argument('--bounds', choices=BOUNDS_MODES, help='validate values against the timeseries bounds')
+    import_.add_argument('--chunk-size', type=_positive_int, default=10000, help='rows read at a time (default: 10000)')
+    import_.add_argument('--max-workers', type=_positive_int, default=4,
+                         help='chunks uploaded concurrently (default: 4)')
+    import_.add_argument('--retries', type=_non_negative_int, default=3, help='retries of failed requests (default: 3)')
+    import_.add_argument('--quiet', '-q', action='store_true', help='do not report progress')
+    _add_connection_arguments(import_)
+    import_.set_defaults(run=_import)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Runs the command line interface, python -m selfhost_client
+
+    Args:
+        argv (Optional[List[str]]): The arguments, defaults to those of the process.
+
+    Returns:
+        int: The exit status.
+    """
+    arguments: argparse.Namespace = _parser().parse_args(argv)
+    return arguments.run(arguments)
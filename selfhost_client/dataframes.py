@@ -0,0 +1,98 @@
+from operator import itemgetter
+from typing import Any, List, Union
+from warnings import filterwarnings
+
+from beartype import beartype
+from beartype.roar import BeartypeDecorHintPep585DeprecationWarning
+
+from .types.timeseries_types import TimeseriesDataResponse, TimeseriesDataType
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:
+    np = None
+    pd = None
+
+filterwarnings("ignore", category=BeartypeDecorHintPep585DeprecationWarning)
+
+DATAFRAME_LAYOUTS = ('wide', 'long')
+
+_get_ts = itemgetter('ts')
+_get_v = itemgetter('v')
+
+
+def require_pandas() -> None:
+    """Makes sure that the optional pandas dependency is installed
+
+    Raises:
+        ImportError: pandas is not installed.
+    """
+    if pd is None:
+        raise ImportError(
+            'pandas is required for DataFrame support, install it with: pip install selfhost_client[pandas]'
+        )
+
+
+def _to_datetime_index(timestamps: List[Any]) -> Any:
+    # pandas >= 2.0 infers a single format from the first element unless told that the strings are ISO 8601,
+    # which would break on a mix of timestamps with and without fractional seconds.
+    if int(pd.__version__.split('.')[0]) >= 2:
+        return pd.to_datetime(timestamps, utc=True, format='ISO8601')
+    return pd.to_datetime(timestamps, utc=True)
+
+
+@beartype
+def timeseries_data_to_dataframe(
+        timeseries_data: List[Union[TimeseriesDataType, TimeseriesDataResponse]],
+        layout: str = 'wide'
+) -> Any:
+    """Converts the data of multiple timeseries into a pandas DataFrame
+
+    The conversion works on both the decoded output of
+    :meth:`.TimeseriesClient.get_multiple_timeseries_data` and the undecoded response from the API, timestamps are
+    parsed in one vectorized pass instead of once per data point.
+
+    Args:
+        timeseries_data (List[Union[TimeseriesDataType, TimeseriesDataResponse]]): Data of one or more timeseries.
+        layout (str): Layout of the resulting DataFrame.
+
+            -   wide: One row per timestamp and one column per timeseries UUID.
+
+            -   long: One row per data point with the columns uuid, ts and v.
+
+    Returns:
+        pandas.DataFrame
+
+    Raises:
+        ImportError: pandas is not installed.
+        ValueError: Unknown layout.
+    """
+    require_pandas()
+    if layout not in DATAFRAME_LAYOUTS:
+        raise ValueError(f'layout must be one of {", ".join(DATAFRAME_LAYOUTS)}, got {layout}')
+
+    uuids: List[str] = []
+    counts: List[int] = []
+    timestamps: List[Any] = []
+    values: List[float] = []
+    for series in timeseries_data:
+        data_points = series.get('data') or []
+        uuids.append(series.get('uuid'))
+        counts.append(len(data_points))
+        timestamps.extend(map(_get_ts, data_points))
+        values.extend(map(_get_v, data_points))
+
+    categories = pd.Index(uuids, dtype=object).unique()
+    long_frame = pd.DataFrame({
+        'uuid': pd.Categorical.from_codes(np.repeat(categories.get_indexer(uuids), counts), categories=categories),
+        'ts': _to_datetime_index(timestamps),
+        'v': np.asarray(values, dtype='float64'),
+    })
+
+    if layout == 'long':
+        return long_frame
+
+    wide_frame = long_frame.pivot(index='ts', columns='uuid', values='v')
+    wide_frame.columns = pd.Index(wide_frame.columns.astype(object), name='uuid')
+    return wide_frame.reindex(columns=pd.Index(categories, name='uuid')).sort_index()
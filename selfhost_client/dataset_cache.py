@@ -0,0 +1,285 @@
+import contextlib
+import mmap
+import os
+import re
+import threading
+from typing import Any, Iterator, List, Tuple
+from warnings import filterwarnings
+
+from beartype import beartype
+from beartype.roar import BeartypeDecorHintPep585DeprecationWarning
+
+from .datasets_client import DatasetsClient
+from .downloads import file_sha256
+from .types.dataset_types import DatasetType
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+filterwarnings("ignore", category=BeartypeDecorHintPep585DeprecationWarning)
+
+_CHECKSUM = re.compile(r'[0-9a-f]{64}')
+_MARKER_SUFFIX = '.sha256'
+
+
+def _lock(file: Any, blocking: bool) -> bool:
+    if fcntl is not None:
+        try:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        return True
+    file.seek(0)
+    # LK_LOCK retries for 10 seconds before it raises, so it is retried until the lock is acquired.
+    while True:
+        try:
+            msvcrt.locking(file.fileno(), msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            if not blocking:
+                return False
+
+
+def _unlock(file: Any) -> None:
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+    else:
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class _LockFile:
+    def __init__(self, acquired: bool) -> None:
+        self.acquired = acquired
+        # Set by the holder to remove the lock file when it is released.
+        self.remove: bool = False
+
+
+@contextlib.contextmanager
+def _file_lock(path: str, blocking: bool = True) -> Iterator[_LockFile]:
+    """Holds an exclusive lock on a lock file, shared by threads and processes
+
+    Blocks until the lock is acquired, or yields whether it was acquired when not blocking. A lock acquired on a
+    lock file that its previous holder removed in the meantime is taken again on the current file.
+    """
+    while True:
+        lock_file = _LockFile(False)
+        with open(path, 'a+b') as file:
+            if not _lock(file, blocking):
+                yield lock_file
+                return
+            try:
+                lock_file.acquired = os.path.samestat(os.fstat(file.fileno()), os.stat(path))
+            except FileNotFoundError:
+                pass
+            if not lock_file.acquired:
+                _unlock(file)
+                continue
+            try:
+                yield lock_file
+            finally:
+                # Removed while it is locked, so that waiting threads and processes find it replaced, except on
+                # Windows, where open files can not be removed.
+                if lock_file.remove and fcntl is not None:
+                    _remove(path)
+                _unlock(file)
+        if lock_file.remove and fcntl is None:
+            _remove(path)
+        return
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except PermissionError:  # Windows, the file is open in another process
+        pass
+
+
+class DatasetCache:
+    """
+    A content addressed cache of dataset content on disk
+
+    Content is stored under its sha256 checksum, so datasets with identical content share one file and a dataset is
+    only downloaded again when its checksum changes. Every access fetches the metadata of the dataset to compare
+    checksums, which is cheap compared to the content.
+
+    Once the cache grows beyond max_size bytes the least recently used files are removed. Recency is recorded in the
+    modification time of the files, and downloads, accesses and evictions of a checksum are serialized with a lock
+    file, so several processes can share a cache directory. Content in use by another process is not evicted.
+
+    Example::
+
+        cache = DatasetCache(client, '/var/cache/models', max_size=10 * 1024 ** 3)
+        with cache.open(dataset_uuid) as content:
+            model = load(content)
+    """
+
+    @beartype
+    def __init__(self, client: DatasetsClient, directory: str, max_size: int = 1024 ** 3) -> None:
+        """DatasetCache constructor
+
+        Args:
+            client (:class:`.DatasetsClient`): The client used to fetch datasets.
+            directory (str): The directory to store the content in, created if missing.
+            max_size (int): The size in bytes the cache is kept below, except for the most recently used file.
+        """
+        self._client = client
+        self._directory = directory
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    @beartype
+    def path(self, dataset_uuid: str) -> str:
+        """Returns the path of the cached content of a dataset, downloading it if it is not cached
+
+        Another process sharing the cache directory may evict the content once it is returned, use :meth:`open` or
+        :meth:`read` to access the content safely.
+
+        Args:
+            dataset_uuid (str): UUID of the dataset.
+
+        Returns:
+            str: The path of the content. The file must not be modified.
+
+        Raises:
+            :class:`.SelfHostChecksumMismatchException`: The downloaded content does not match the checksum of the
+                dataset.
+            The exceptions of :meth:`.DatasetsClient.get_dataset` and :meth:`.DatasetsClient.download_dataset`.
+        """
+        with self._entry(dataset_uuid) as path:
+            return path
+
+    @beartype
+    def open(self, dataset_uuid: str) -> mmap.mmap:
+        """Returns the cached content of a dataset as a read-only memory map, downloading it if it is not cached
+
+        Args:
+            dataset_uuid (str): UUID of the dataset.
+
+        Returns:
+            mmap.mmap: The content, to be closed by the caller, e.g. by using it as a context manager.
+
+        Raises:
+            ValueError: The dataset is empty, empty files can not be memory mapped.
+            The exceptions of :meth:`path`.
+        """
+        with self._entry(dataset_uuid) as path, open(path, 'rb') as file:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @beartype
+    def read(self, dataset_uuid: str) -> bytes:
+        """Returns the cached content of a dataset, downloading it if it is not cached
+
+        Args:
+            dataset_uuid (str): UUID of the dataset.
+
+        Returns:
+            bytes: The content.
+
+        Raises:
+            The exceptions of :meth:`path`.
+        """
+        with self._entry(dataset_uuid) as path, open(path, 'rb') as file:
+            return file.read()
+
+    def size(self) -> int:
+        """Returns the total size in bytes of the cached content"""
+        return sum(size for _, size, _ in self._entries())
+
+    def clear(self) -> None:
+        """Removes all cached content, waiting for downloads and accesses in progress"""
+        with self._lock:
+            for path, _, _ in self._entries():
+                with _file_lock(f'{path}.lock') as lock_file:
+                    self._remove_entry(path, lock_file)
+
+    @contextlib.contextmanager
+    def _entry(self, dataset_uuid: str) -> Iterator[str]:
+        """Holds the lock of the cached content of a dataset, which is downloaded if it is not cached
+
+        The content is not evicted while the lock is held, and least recently used content is evicted after.
+        """
+        dataset: DatasetType = self._client.get_dataset(dataset_uuid)
+        checksum: str = dataset['checksum'].lower()
+        path: str = os.path.join(self._directory, checksum)
+        # Only one thread or process downloads the content, the others wait for it and find it cached.
+        with _file_lock(f'{path}.lock') as lock_file:
+            if not self._cached(path, dataset['size'], checksum):
+                try:
+                    self._client.download_dataset_content(dataset_uuid, path, dataset['size'], checksum)
+                except BaseException:
+                    lock_file.remove = not os.path.exists(path)
+                    raise
+                self._mark(path, checksum)
+            yield path
+        with self._lock:
+            self._evict(keep=path)
+
+    @classmethod
+    def _cached(cls, path: str, size: int, checksum: str) -> bool:
+        if not os.path.isfile(path) or os.path.getsize(path) != size:
+            return False
+        try:
+            with open(f'{path}{_MARKER_SUFFIX}') as file:
+                marked: bool = file.read() == checksum
+        except FileNotFoundError:
+            marked = False
+        if not marked:
+            # Content that was not downloaded by the cache, or is left from an interrupted one, is verified once.
+            if file_sha256(path) != checksum:
+                _remove(path)
+                return False
+            cls._mark(path, checksum)
+        os.utime(path)
+        return True
+
+    @staticmethod
+    def _mark(path: str, checksum: str) -> None:
+        """Records that the content of path has been verified against its checksum"""
+        temporary_path: str = f'{path}{_MARKER_SUFFIX}.tmp'
+        with open(temporary_path, 'w') as file:
+            file.write(checksum)
+        os.replace(temporary_path, f'{path}{_MARKER_SUFFIX}')
+
+    @staticmethod
+    def _remove_entry(path: str, lock_file: _LockFile) -> None:
+        _remove(path)
+        _remove(f'{path}{_MARKER_SUFFIX}')
+        lock_file.remove = True
+
+    def _entries(self) -> List[Tuple[str, int, float]]:
+        entries: List[Tuple[str, int, float]] = []
+        with os.scandir(self._directory) as iterator:
+            for entry in iterator:
+                # Partial downloads, lock files and markers are named <checksum>.<suffix> and are not content.
+                if entry.is_file() and _CHECKSUM.fullmatch(entry.name):
+                    stat = entry.stat()
+                    entries.append((entry.path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _evict(self, keep: str) -> None:
+        entries: List[Tuple[str, int, float]] = sorted(self._entries(), key=lambda entry: entry[2])
+        total: int = sum(size for _, size, _ in entries)
+        for path, size, modified in entries:
+            if total <= self._max_size:
+                return
+            if path == keep:
+                continue
+            # Content being downloaded or accessed by another thread or process is kept.
+            with _file_lock(f'{path}.lock', blocking=False) as lock_file:
+                if not lock_file.acquired:
+                    continue
+                try:
+                    if os.path.getmtime(path) != modified:
+                        # Used since the entries were listed.
+                        continue
+                except FileNotFoundError:
+                    pass
+                self._remove_entry(path, lock_file)
+            total -= size
@@ -0,0 +1,130 @@
+import json
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set
+from warnings import filterwarnings
+
+from beartype import beartype
+from beartype.roar import BeartypeDecorHintPep585DeprecationWarning
+
+from .client import SelfHostClient
+from .types.dataset_types import DatasetResponse, DatasetSyncResultType
+
+filterwarnings("ignore", category=BeartypeDecorHintPep585DeprecationWarning)
+
+MANIFEST_NAME = '.selfhost-manifest.json'
+
+
+def default_dataset_filename(dataset: DatasetResponse) -> str:
+    """Names a local copy of a dataset after its UUID and format, e.g. 5e029cdf-4fee-42d2-9196-afbdfbdb9d8f.ini"""
+    return f"{dataset['uuid']}.{dataset['format']}" if dataset.get('format') else dataset['uuid']
+
+
+def _read_manifest(path: str) -> Dict[str, Dict[str, Any]]:
+    try:
+        with open(path) as file:
+            manifest: Any = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def _write_manifest(path: str, manifest: Dict[str, Dict[str, Any]]) -> None:
+    temporary_path = f'{path}.tmp'
+    with open(temporary_path, 'w') as file:
+        json.dump(manifest, file, indent=2, sort_keys=True)
+    os.replace(temporary_path, path)
+
+
+def _remove(directory: str, name: Optional[str]) -> None:
+    if not name:
+        return
+    try:
+        os.remove(os.path.join(directory, name))
+    except FileNotFoundError:
+        pass
+
+
+def _is_current(directory: str, entry: Optional[Dict[str, Any]], dataset: DatasetResponse, filename: str) -> bool:
+    if entry is None or entry.get('checksum') != dataset['checksum'] or entry.get('file') != filename:
+        return False
+    path: str = os.path.join(directory, filename)
+    return os.path.isfile(path) and os.path.getsize(path) == dataset['size']
+
+
+@beartype
+def sync_thing_datasets(
+        client: SelfHostClient,
+        thing_uuid: str,
+        directory: str,
+        max_workers: int = 4,
+        delete: bool = True,
+        filename: Callable[[DatasetResponse], str] = default_dataset_filename
+) -> DatasetSyncResultType:
+    """Mirrors the datasets of a thing to a local directory
+
+    The checksums of the datasets are compared with a manifest kept in the directory, and only new and changed
+    datasets are downloaded, up to max_workers at a time. Every file is downloaded next to its destination,
+    verified against its checksum and then moved into place, so readers never see partially written files.
+    A failed download does not stop the others and keeps the previous local copy.
+
+    Args:
+        client (:class:`.SelfHostClient`): The client used to list and download the datasets.
+        thing_uuid (str): UUID of the thing whose datasets to mirror.
+        directory (str): The local directory, created if missing.
+        max_workers (int): The maximum number of datasets downloaded concurrently.
+        delete (bool): Whether to remove local copies of datasets that no longer belong to the thing.
+        filename (Callable[[DatasetResponse], str]): Returns the file name of the local copy of a dataset.
+            Defaults to the UUID and format of the dataset.
+
+    Returns:
+        :class:`.DatasetSyncResultType`: The outcome for every dataset.
+
+    Raises:
+        The exceptions of :meth:`.ThingsClient.get_thing_datasets`. Exceptions raised while downloading a dataset
+        are returned in the result instead.
+    """
+    os.makedirs(directory, exist_ok=True)
+    manifest_path: str = os.path.join(directory, MANIFEST_NAME)
+    manifest: Dict[str, Dict[str, Any]] = _read_manifest(manifest_path)
+    datasets: List[DatasetResponse] = client.get_thing_datasets(thing_uuid)
+    result: DatasetSyncResultType = {'downloaded': [], 'unchanged': [], 'removed': [], 'failed': {}}
+
+    futures: Dict[str, Future] = {}
+    with ThreadPoolExecutor(max_workers, thread_name_prefix='dataset-sync') as executor:
+        for dataset in datasets:
+            name: str = filename(dataset)
+            if _is_current(directory, manifest.get(dataset['uuid']), dataset, name):
+                result['unchanged'].append(dataset['uuid'])
+                continue
+            futures[dataset['uuid']] = executor.submit(
+                client.download_dataset_content,
+                dataset['uuid'],
+                os.path.join(directory, name),
+                dataset['size'],
+                dataset['checksum'],
+                max_workers=1
+            )
+
+    for dataset in datasets:
+        future: Optional[Future] = futures.get(dataset['uuid'])
+        if future is None:
+            continue
+        if future.exception() is not None:
+            result['failed'][dataset['uuid']] = future.exception()
+            continue
+        # The local file may match even though the manifest did not, e.g. after the manifest was removed.
+        result['downloaded' if future.result() else 'unchanged'].append(dataset['uuid'])
+        previous: Optional[Dict[str, Any]] = manifest.get(dataset['uuid'])
+        manifest[dataset['uuid']] = {'file': filename(dataset), 'checksum': dataset['checksum']}
+        if previous is not None and previous.get('file') != filename(dataset):
+            _remove(directory, previous.get('file'))
+
+    if delete:
+        remote: Set[str] = {dataset['uuid'] for dataset in datasets}
+        for dataset_uuid in [dataset_uuid for dataset_uuid in manifest if dataset_uuid not in remote]:
+            _remove(directory, manifest.pop(dataset_uuid).get('file'))
+            result['removed'].append(dataset_uuid)
+
+    _write_manifest(manifest_path, manifest)
+    return result
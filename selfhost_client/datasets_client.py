@@ -1,4 +1,4 @@
-from typing import List, Any, Optional
+from typing import Any, Dict, List, Optional
 from warnings import filterwarnings
 
 import pyrfc3339
@@ -7,6 +7,17 @@ from beartype import beartype
 from beartype.roar import BeartypeDecorHintPep585DeprecationWarning
 
 from .base_client import BaseClient
+from .downloads import DEFAULT_RANGE_SIZE, RangedDownload, file_matches
+from .streaming import (
+    DEFAULT_CHUNK_SIZE,
+    ProgressCallback,
+    StreamDestination,
+    StreamSource,
+    streamed_json_body,
+    write_response_content
+)
+from .tracing import traced
+from .types.batch_types import BatchResultType
 from .types.dataset_types import DatasetType, DatasetResponse
 from .utils import filter_none_values_from_dict
 
@@ -28,6 +39,7 @@ class DatasetsClient(BaseClient):
         super().__init__(base_url, username, password)
         self._datasets_api_path = 'datasets'
 
+    @traced
     @beartype
     def get_datasets(self,
                      limit: Optional[int] = None,
@@ -72,6 +84,7 @@ class DatasetsClient(BaseClient):
             'updated': pyrfc3339.parse(dataset.get('updated')),
         } for dataset in datasets]
 
+    @traced
     @beartype
     def create_dataset(self,
                        name: str,
@@ -112,6 +125,7 @@ class DatasetsClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def get_dataset(self, dataset_uuid: str) -> DatasetType:
         """Returns a dataset from NODA Self-host API by UUID
@@ -149,6 +163,7 @@ class DatasetsClient(BaseClient):
             'updated': pyrfc3339.parse(dataset.get('updated')),
         }
 
+    @traced
     @beartype
     def update_dataset(self,
                        dataset_uuid: str,
@@ -191,6 +206,7 @@ class DatasetsClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def delete_dataset(self, dataset_uuid: str) -> None:
         """Deletes a dataset from NODA Self-host API
@@ -212,6 +228,7 @@ class DatasetsClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def get_dataset_raw_content(self, dataset_uuid: str) -> Any:
         """Returns the raw content from a dataset from NODA Self-host API by UUID
@@ -232,3 +249,315 @@ class DatasetsClient(BaseClient):
             url=f'{self._base_url}/{self._api_version}/{self._datasets_api_path}/{dataset_uuid}/raw'
         )
         return self._process_response(response)
+
+    @traced
+    @beartype
+    def create_dataset_from_stream(self,
+                                   name: str,
+                                   dataset_format: str,
+                                   content: StreamSource,
+                                   thing_uuid: Optional[str] = None,
+                                   tags: Optional[List[str]] = None,
+                                   chunk_size: int = DEFAULT_CHUNK_SIZE,
+                                   progress: Optional[ProgressCallback] = None
+                                   ) -> DatasetType:
+        """Add a new dataset to the NODA Self-host API, streaming its content
+
+        The request body is sent with chunked transfer encoding while the content is read, so memory use is bounded
+        by chunk_size regardless of the size of the content.
+
+        Args:
+            name (str): The name of the dataset.
+            dataset_format (str): File format of the data set.
+            content (Union[str, bytes, IO, Iterable[Union[str, bytes]]]): The content of the resource, e.g. a file
+                opened in binary mode or a generator of chunks. Binary content is base64 encoded while it is sent,
+                text content is sent as it is, like the content of :meth:`create_dataset`.
+            thing_uuid (Optional[str]): A UUID reference to a Thing as a way to track data-sets to things.
+            tags (Optional[List[str]]): A list of tags pinned on the dataset.
+            chunk_size (int): The maximum number of bytes or characters read from the content at a time.
+            progress (Optional[Callable[[int, Optional[int]], None]]): Called with the amount of content sent so far
+                and the total amount, if known.
+
+        Returns:
+            :class:`.DatasetType`
+
+        Raises:
+            :class:`.SelfHostBadRequestException`: Sent request had insufficient data or invalid options.
+            :class:`.SelfHostUnauthorizedException`: Request was refused due to lacking authentication credentials.
+            :class:`.SelfHostForbiddenException`: Server understands the request but refuses to authorize it.
+            :class:`.SelfHostTooManyRequestsException`: Sent too many requests in a given amount of time.
+            :class:`.SelfHostInternalServerException`: Server encountered an unexpected condition that prevented it
+                from fulfilling the request.
+        """
+        response: Response = self._session.post(
+            url=f'{self._base_url}/{self._api_version}/{self._datasets_api_path}',
+            data=streamed_json_body(
+                filter_none_values_from_dict({
+                    'name': name,
+                    'format': dataset_format,
+                    'thing_uuid': thing_uuid,
+                    'tags': tags
+                }),
+                content,
+                chunk_size,
+                progress
+            ),
+            headers={'Content-Type': 'application/json'}
+        )
+        return self._process_response(response)
+
+    @traced
+    @beartype
+    def update_dataset_from_stream(self,
+                                   dataset_uuid: str,
+                                   content: StreamSource,
+                                   name: Optional[str] = None,
+                                   dataset_format: Optional[str] = None,
+                                   thing_uuid: Optional[str] = None,
+                                   tags: Optional[List[str]] = None,
+                                   chunk_size: int = DEFAULT_CHUNK_SIZE,
+                                   progress: Optional[ProgressCallback] = None
+                                   ) -> None:
+        """Updates a dataset from NODA Self-host API, streaming its new content
+
+        See :meth:`create_dataset_from_stream` for how the content is sent.
+
+        Args:
+            dataset_uuid (str): UUID of dataset to update.
+            content (Union[str, bytes, IO, Iterable[Union[str, bytes]]]): The new content of the resource.
+            name (Optional[str]): The name of the dataset.
+            dataset_format (Optional[str]): File format of the data set.
+            thing_uuid (Optional[str]): A UUID reference to a Thing as a way to track data-sets to things.
+            tags (Optional[List[str]]): A list of tags pinned on the dataset.
+            chunk_size (int): The maximum number of bytes or characters read from the content at a time.
+            progress (Optional[Callable[[int, Optional[int]], None]]): Called with the amount of content sent so far
+                and the total amount, if known.
+
+        Raises:
+            :class:`.SelfHostBadRequestException`: Sent request had insufficient data or invalid options.
+            :class:`.SelfHostUnauthorizedException`: Request was refused due to lacking authentication credentials.
+            :class:`.SelfHostForbiddenException`: Server understands the request but refuses to authorize it.
+            :class:`.SelfHostNotFoundException`: The requested resource was not found.
+            :class:`.SelfHostMethodNotAllowedException`: The server knows the request method
+                                          but the target resource doesn't support this method.
+            :class:`.SelfHostTooManyRequestsException`: Sent too many requests in a given amount of time.
+            :class:`.SelfHostInternalServerException`: Server encountered an unexpected condition that prevented
+                it from fulfilling the request.
+        """
+        response: Response = self._session.put(
+            url=f'{self._base_url}/{self._api_version}/{self._datasets_api_path}/{dataset_uuid}',
+            data=streamed_json_body(
+                filter_none_values_from_dict({
+                    'name': name,
+                    'format': dataset_format,
+                    'thing_uuid': thing_uuid,
+                    'tags': tags
+                }),
+                content,
+                chunk_size,
+                progress
+            ),
+            headers={'Content-Type': 'application/json'}
+        )
+        return self._process_response(response)
+
+    @traced
+    @beartype
+    def download_dataset_raw_content(self,
+                                     dataset_uuid: str,
+                                     destination: StreamDestination,
+                                     chunk_size: int = DEFAULT_CHUNK_SIZE,
+                                     progress: Optional[ProgressCallback] = None
+                                     ) -> int:
+        """Streams the raw content of a dataset from NODA Self-host API to a file or a writable stream
+
+        Unlike :meth:`get_dataset_raw_content`, the content is never held in memory as a whole.
+
+        Args:
+            dataset_uuid (str): UUID of the dataset to download.
+            destination (Union[str, os.PathLike, IO[bytes]]): A path to write the content to, replacing an existing
+                file, or a stream opened for writing bytes.
+            chunk_size (int): The maximum number of bytes held in memory at a time.
+            progress (Optional[Callable[[int, Optional[int]], None]]): Called with the number of bytes written so far
+                and the total size, if known.
+
+        Returns:
+            int: The number of bytes written.
+
+        Raises:
+            :class:`.SelfHostBadRequestException`: Sent request had insufficient data or invalid options.
+            :class:`.SelfHostUnauthorizedException`: Request was refused due to lacking authentication credentials.
+            :class:`.SelfHostForbiddenException`: Server understands the request but refuses to authorize it.
+            :class:`.SelfHostNotFoundException`: The requested resource was not found.
+            :class:`.SelfHostTooManyRequestsException`: Sent too many requests in a given amount of time.
+            :class:`.SelfHostInternalServerException`: Server encountered an unexpected condition that prevented it
+                from fulfilling the request.
+        """
+        response: Response = self._session.get(
+            url=f'{self._base_url}/{self._api_version}/{self._datasets_api_path}/{dataset_uuid}/raw',
+            stream=True
+        )
+        with response:
+            if response.status_code >= 400:
+                self._process_response(response)
+            written: int = write_response_content(response, destination, chunk_size, progress)
+        self._session.report_request(response, bytes_received=written)
+        return written
+
+    @traced
+    @beartype
+    def download_dataset(self,
+                         dataset_uuid: str,
+                         path: str,
+                         range_size: int = DEFAULT_RANGE_SIZE,
+                         max_workers: int = 4,
+                         progress: Optional[ProgressCallback] = None
+                         ) -> bool:
+        """Downloads the raw content of a dataset to a file, verified against the checksum of the dataset
+
+        Nothing is downloaded if the file already has the size and sha256 checksum of the dataset. Otherwise the
+        content is fetched in ranges of range_size bytes, max_workers at a time, and written to <path>.part.
+        An interrupted download is resumed with the missing ranges when called again. The checksum is computed while
+        the ranges arrive and the file is only moved to its path once verified.
+
+        Args:
+            dataset_uuid (str): UUID of the dataset to download.
+            path (str): The path to write the content to.
+            range_size (int): The number of bytes requested at a time.
+            max_workers (int): The maximum number of ranges requested concurrently.
+            progress (Optional[Callable[[int, Optional[int]], None]]): Called with the number of bytes downloaded so
+                far, including those of a resumed download, and the size of the dataset.
+
+        Returns:
+            bool: False if the file already matched the dataset, True if it was downloaded.
+
+        Raises:
+            :class:`.SelfHostChecksumMismatchException`: The downloaded content does not match the checksum of the
+                dataset. The partial download is removed.
+            :class:`.SelfHostBadRequestException`: Sent request had insufficient data or invalid options.
+            :class:`.SelfHostUnauthorizedException`: Request was refused due to lacking authentication credentials.
+            :class:`.SelfHostForbiddenException`: Server understands the request but refuses to authorize it.
+            :class:`.SelfHostNotFoundException`: The requested resource was not found.
+            :class:`.SelfHostTooManyRequestsException`: Sent too many requests in a given amount of time.
+            :class:`.SelfHostInternalServerException`: Server encountered an unexpected condition that prevented it
+                from fulfilling the request.
+        """
+        dataset: DatasetType = self.get_dataset(dataset_uuid)
+        return self.download_dataset_content(
+            dataset_uuid, path, dataset['size'], dataset['checksum'], range_size, max_workers, progress
+        )
+
+    @traced
+    @beartype
+    def download_dataset_content(self,
+                                 dataset_uuid: str,
+                                 path: str,
+                                 size: int,
+                                 checksum: str,
+                                 range_size: int = DEFAULT_RANGE_SIZE,
+                                 max_workers: int = 4,
+                                 progress: Optional[ProgressCallback] = None
+                                 ) -> bool:
+        """Downloads the raw content of a dataset of which the size and checksum are known to a file
+
+        Works like :meth:`download_dataset` without fetching the dataset first, for callers that already have it.
+
+        Args:
+            dataset_uuid (str): UUID of the dataset to download.
+            path (str): The path to write the content to.
+            size (int): The size of the dataset in bytes.
+            checksum (str): The sha256 checksum of the dataset.
+            range_size (int): The number of bytes requested at a time.
+            max_workers (int): The maximum number of ranges requested concurrently.
+            progress (Optional[Callable[[int, Optional[int]], None]]): Called with the number of bytes downloaded so
+                far, including those of a resumed download, and the size of the dataset.
+
+        Returns:
+            bool: False if the file already matched the dataset, True if it was downloaded.
+
+        Raises:
+            :class:`.SelfHostChecksumMismatchException`: The downloaded content does not match the checksum. The
+                partial download is removed.
+            :class:`.SelfHostBadRequestException`: Sent request had insufficient data or invalid options.
+            :class:`.SelfHostUnauthorizedException`: Request was refused due to lacking authentication credentials.
+            :class:`.SelfHostForbiddenException`: Server understands the request but refuses to authorize it.
+            :class:`.SelfHostNotFoundException`: The requested resource was not found.
+            :class:`.SelfHostTooManyRequestsException`: Sent too many requests in a given amount of time.
+            :class:`.SelfHostInternalServerException`: Server encountered an unexpected condition that prevented it
+                from fulfilling the request.
+        """
+        if file_matches(path, size, checksum):
+            return False
+        RangedDownload(
+            self,
+            f'{self._base_url}/{self._api_version}/{self._datasets_api_path}/{dataset_uuid}/raw',
+            path,
+            size,
+            checksum,
+            range_size,
+            max_workers,
+            progress
+        ).run()
+        return True
+
+    @traced
+    @beartype
+    def create_datasets_many(self,
+                             datasets: List[Dict[str, Any]],
+                             max_workers: int = 8
+                             ) -> List[BatchResultType]:
+        """Adds many datasets to the NODA Self-host API concurrently
+
+        Calls :meth:`create_dataset` for every item, at most max_workers at a time.
+        A failing call does not stop the others.
+
+        Args:
+            datasets (List[Dict[str, Any]]): The keyword arguments of :meth:`create_dataset` for every item.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            List[:class:`.BatchResultType`]: The created dataset or the raised exception of every item,
+            in the order of datasets.
+        """
+        return self._run_many(self.create_dataset, datasets, max_workers)
+
+    @traced
+    @beartype
+    def update_datasets_many(self,
+                             datasets: List[Dict[str, Any]],
+                             max_workers: int = 8
+                             ) -> List[BatchResultType]:
+        """Updates many datasets in the NODA Self-host API concurrently
+
+        Calls :meth:`update_dataset` for every item, at most max_workers at a time.
+        A failing call does not stop the others.
+
+        Args:
+            datasets (List[Dict[str, Any]]): The keyword arguments of :meth:`update_dataset` for every item,
+                including dataset_uuid.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            List[:class:`.BatchResultType`]: The outcome of every item, in the order of datasets.
+        """
+        return self._run_many(self.update_dataset, datasets, max_workers)
+
+    @traced
+    @beartype
+    def delete_datasets_many(self,
+                             dataset_uuids: List[str],
+                             max_workers: int = 8
+                             ) -> List[BatchResultType]:
+        """Deletes many datasets from the NODA Self-host API concurrently
+
+        Calls :meth:`delete_dataset` for every UUID, at most max_workers at a time.
+        A failing call does not stop the others.
+
+        Args:
+            dataset_uuids (List[str]): UUIDs of the datasets to delete.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            List[:class:`.BatchResultType`]: The outcome of every UUID, in the order of dataset_uuids.
+        """
+        return self._run_many(self.delete_dataset, dataset_uuids, max_workers)
@@ -0,0 +1,250 @@
+import hashlib
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Match, Optional, Set
+
+import requests
+
+from .exceptions import SelfHostChecksumMismatchException, SelfHostRangeNotSatisfiableException
+from .streaming import DEFAULT_CHUNK_SIZE, ProgressCallback
+
+Response = requests.models.Response
+
+DEFAULT_RANGE_SIZE = 8 * 1024 * 1024
+
+_CONTENT_RANGE = re.compile(r'bytes\s+(\d+)-(\d+)/(?:\d+|\*)')
+
+
+def file_sha256(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    """Returns the hex encoded sha256 checksum of a file"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_matches(path: str, size: int, checksum: str) -> bool:
+    """Returns whether a file exists with the given size and sha256 checksum"""
+    return os.path.isfile(path) and os.path.getsize(path) == size and file_sha256(path) == checksum.lower()
+
+
+class _OrderedDigest:
+    """Hashes the finished ranges of a partial file as soon as all ranges before them are finished"""
+
+    def __init__(self, path: str, range_size: int) -> None:
+        self._path = path
+        self._range_size = range_size
+        self._digest = hashlib.sha256()
+        self._next: int = 0
+
+    def advance(self, finished: Set[int]) -> None:
+        if self._next not in finished:
+            return
+        with open(self._path, 'rb') as file:
+            file.seek(self._next * self._range_size)
+            while self._next in finished:
+                self._digest.update(file.read(self._range_size))
+                self._next += 1
+
+    def hexdigest(self) -> str:
+        return self._digest.hexdigest()
+
+
+class RangedDownload:
+    """
+    Downloads a resource in ranges, in parallel, resumable and verified against its sha256 checksum
+
+    The content is written to <path>.part and the finished ranges are recorded in <path>.part.json, so an
+    interrupted download continues with the missing ranges when it is started again with the same checksum.
+    The checksum is computed while the download proceeds and the file is moved to its path once verified.
+    When the server ignores the Range header, the whole content of its response is used instead, and the file is
+    hashed once all requests finished.
+    """
+
+    def __init__(
+            self,
+            client: Any,
+            url: str,
+            path: str,
+            size: int,
+            checksum: str,
+            range_size: int = DEFAULT_RANGE_SIZE,
+            max_workers: int = 4,
+            progress: Optional[ProgressCallback] = None
+    ) -> None:
+        """RangedDownload constructor
+
+        Args:
+            client (:class:`.BaseClient`): The client used to send the requests.
+            url (str): The url of the resource.
+            path (str): The path to write the resource to.
+            size (int): The size of the resource in bytes.
+            checksum (str): The hex encoded sha256 checksum of the resource.
+            range_size (int): The number of bytes requested at a time.
+            max_workers (int): The maximum number of ranges requested concurrently.
+            progress (Optional[Callable[[int, Optional[int]], None]]): Called with the number of bytes downloaded
+                so far, including those of a resumed download, and the size of the resource.
+        """
+        self._client = client
+        self._url = url
+        self._path = path
+        self._part_path = f'{path}.part'
+        self._state_path = f'{path}.part.json'
+        self._size = size
+        self._checksum = checksum.lower()
+        self._range_size = range_size
+        self._max_workers = max_workers
+        self._progress = progress
+        self._lock = threading.Lock()
+        self._finished: Set[int] = set()
+        self._digest = _OrderedDigest(self._part_path, range_size)
+        self._whole: bool = False
+        self._fetched: int = 0
+        self._done: int = 0
+
+    @property
+    def _ranges(self) -> int:
+        return -(-self._size // self._range_size)
+
+    def run(self) -> int:
+        """Downloads the missing ranges, verifies the checksum and moves the file to its path
+
+        Returns:
+            int: The number of bytes fetched from the server.
+
+        Raises:
+            :class:`.SelfHostChecksumMismatchException`: The downloaded content does not match the checksum.
+                The partial download is removed.
+            :class:`.SelfHostRangeNotSatisfiableException`: The server answered a range request with another range,
+                or refused it since the resource is shorter than its size. The partial download is kept.
+            The exceptions of :meth:`.BaseClient._process_response` for failed requests. The partial download is
+            kept, to be resumed.
+        """
+        self._resume()
+        missing = [index for index in range(self._ranges) if index not in self._finished]
+        # The first range is requested alone to find out whether the server supports ranges.
+        if missing and self._fetch_range(missing[0]):
+            with ThreadPoolExecutor(self._max_workers, thread_name_prefix='ranged-download') as executor:
+                # Raises the first exception raised by any range.
+                list(executor.map(self._fetch_range, missing[1:]))
+
+        # Other ranges may have been written while the whole content was, so their order is unknown.
+        checksum: str = file_sha256(self._part_path) if self._whole else self._digest.hexdigest()
+        if checksum != self._checksum:
+            self._remove(self._part_path)
+            self._remove(self._state_path)
+            raise SelfHostChecksumMismatchException(f'sha256 of {self._url} is {checksum}, expected {self._checksum}')
+        os.replace(self._part_path, self._path)
+        self._remove(self._state_path)
+        return self._fetched
+
+    def _resume(self) -> None:
+        state: Any = None
+        if os.path.isfile(self._part_path) and os.path.getsize(self._part_path) == self._size:
+            try:
+                with open(self._state_path) as file:
+                    state = json.load(file)
+            except (OSError, ValueError):
+                state = None
+
+        if isinstance(state, dict) and state.get('checksum') == self._checksum \
+                and state.get('range_size') == self._range_size:
+            self._finished = {index for index in state.get('finished', []) if index < self._ranges}
+        else:
+            with open(self._part_path, 'wb') as file:
+                file.truncate(self._size)
+            self._finished = set()
+            self._save()
+        self._digest.advance(self._finished)
+        self._report(0, sum(self._range_length(index) for index in self._finished))
+
+    def _save(self) -> None:
+        temporary_path = f'{self._state_path}.tmp'
+        with open(temporary_path, 'w') as file:
+            json.dump({
+                'checksum': self._checksum,
+                'range_size': self._range_size,
+                'finished': sorted(self._finished),
+            }, file)
+        os.replace(temporary_path, self._state_path)
+
+    def _range_length(self, index: int) -> int:
+        return min(self._range_size, self._size - index * self._range_size)
+
+    def _report(self, fetched: int, done: int) -> None:
+        self._fetched += fetched
+        self._done += done
+        if self._progress is not None:
+            self._progress(self._done, self._size)
+
+    def _fetch_range(self, index: int) -> bool:
+        if self._whole:
+            return False
+        start: int = index * self._range_size
+        end: int = min(start + self._range_size, self._size) - 1
+        response: Response = self._client._session.get(
+            url=self._url,
+            headers={'Range': f'bytes={start}-{end}'},
+            stream=True
+        )
+        with response:
+            if response.status_code == 200:
+                self._write_whole(response)
+                return False
+            if response.status_code != 206:
+                self._client._process_response(response)
+            content_range: Optional[Match[str]] = _CONTENT_RANGE.fullmatch(response.headers.get('Content-Range', ''))
+            if content_range is None or (int(content_range[1]), int(content_range[2])) != (start, end):
+                raise SelfHostRangeNotSatisfiableException(
+                    f'Received the range {response.headers.get("Content-Range")} of {self._url}, '
+                    f'expected bytes {start}-{end}'
+                )
+            length: int = end + 1 - start
+            written = 0
+            with open(self._part_path, 'r+b') as file:
+                file.seek(start)
+                # Stops at the end of the range, so that a server sending more never overwrites the next range.
+                for chunk in response.iter_content(DEFAULT_CHUNK_SIZE):
+                    chunk = chunk[:length - written]
+                    file.write(chunk)
+                    written += len(chunk)
+                    if written == length:
+                        break
+        self._client._session.report_request(response, bytes_received=written)
+        if written < length:
+            raise requests.exceptions.ChunkedEncodingError(
+                f'Received {written} bytes of the range {start}-{end} of {self._url}'
+            )
+
+        with self._lock:
+            self._finished.add(index)
+            self._save()
+            self._digest.advance(self._finished)
+            self._report(written, 0 if self._whole else length)
+        return True
+
+    def _write_whole(self, response: Response) -> None:
+        # The server ignored the Range header and sent all content. The ranges still being fetched write the same
+        # bytes, and no more ranges are requested.
+        with self._lock:
+            self._whole = True
+            self._done = 0
+        written = 0
+        with open(self._part_path, 'r+b') as file:
+            for chunk in response.iter_content(DEFAULT_CHUNK_SIZE):
+                file.write(chunk)
+                written += len(chunk)
+                with self._lock:
+                    self._report(len(chunk), len(chunk))
+        self._client._session.report_request(response, bytes_received=written)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -29,6 +29,11 @@ class SelfHostConflictException(Exception):
         self.message = message
 
 
+class SelfHostRangeNotSatisfiableException(Exception):
+    def __init__(self, message='Range Not Satisfiable'):
+        self.message = message
+
+
 class SelfHostTooManyRequestsException(Exception):
     def __init__(self, message='Too Many Requests'):
         self.message = message
@@ -42,3 +47,24 @@ class SelfHostInternalServerException(Exception):
 class SelfHostFatalErrorException(Exception):
     def __init__(self, message='A fatal error occurred'):
         self.message = message
+
+
+class SelfHostChecksumMismatchException(Exception):
+    def __init__(self, message='Checksum Mismatch'):
+        self.message = message
+
+
+class SelfHostOutOfBoundsException(Exception):
+    def __init__(self, message='Out Of Bounds'):
+        self.message = message
+
+
+class SelfHostImportFailedException(Exception):
+    """
+    Attributes:
+        message: Describes the failure.
+        created: The timeseries created for columns of the file before the import failed, keyed by column.
+    """
+    def __init__(self, message='Import Failed', created=None):
+        self.message = message
+        self.created = created or {}
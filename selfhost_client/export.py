@@ -0,0 +1,165 @@
+import collections
+import csv
+import datetime
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional, Tuple, TypeVar
+from warnings import filterwarnings
+
+from beartype import beartype
+from beartype.roar import BeartypeDecorHintPep585DeprecationWarning
+
+from .arrow import pq, require_pyarrow, timeseries_data_to_arrow, timeseries_schema
+from .timeseries_client import TimeseriesClient
+from .types.timeseries_types import TimeseriesDataResponse
+
+filterwarnings("ignore", category=BeartypeDecorHintPep585DeprecationWarning)
+
+EXPORT_FORMATS = ('csv', 'parquet')
+
+_Item = TypeVar('_Item')
+_Result = TypeVar('_Result')
+
+
+def file_format_of(path: str) -> str:
+    """Returns the format of a file from its extension, parquet for .parquet and .pq, otherwise csv"""
+    return 'parquet' if path.lower().endswith(('.parquet', '.pq')) else 'csv'
+
+
+def _ordered_map(
+        executor: Executor,
+        function: Callable[[_Item], _Result],
+        items: Iterable[_Item],
+        ahead: int
+) -> Iterator[_Result]:
+    """Like :meth:`concurrent.futures.Executor.map`, but runs at most ahead calls before their results are consumed"""
+    running: Deque[Future] = collections.deque()
+    for item in items:
+        running.append(executor.submit(function, item))
+        if len(running) >= ahead:
+            yield running.popleft().result()
+    while running:
+        yield running.popleft().result()
+
+
+class _CsvWriter:
+    def __init__(self, path: str) -> None:
+        self._file = open(path, 'w', newline='')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(['uuid', 'ts', 'v'])
+
+    def write(self, timeseries_data: List[TimeseriesDataResponse]) -> int:
+        rows: int = 0
+        for series in timeseries_data:
+            data_points = series.get('data') or []
+            uuid: str = series['uuid']
+            self._writer.writerows((uuid, data_point['ts'], data_point['v']) for data_point in data_points)
+            rows += len(data_points)
+        return rows
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetWriter:
+    def __init__(self, path: str) -> None:
+        require_pyarrow()
+        self._writer = pq.ParquetWriter(path, timeseries_schema())
+
+    def write(self, timeseries_data: List[TimeseriesDataResponse]) -> int:
+        table: Any = timeseries_data_to_arrow(timeseries_data)
+        if table.num_rows:
+            self._writer.write_table(table)
+        return table.num_rows
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+def _windows(
+        start: datetime.datetime,
+        end: datetime.datetime,
+        window: datetime.timedelta
+) -> Iterator[Tuple[datetime.datetime, datetime.datetime]]:
+    # The API includes both ends of a period, so every window but the last ends just before the next one starts.
+    while start + window < end:
+        yield start, start + window - datetime.timedelta(microseconds=1)
+        start += window
+    yield start, end
+
+
+@beartype
+def export_timeseries(
+        client: TimeseriesClient,
+        uuids: List[str],
+        start: datetime.datetime,
+        end: datetime.datetime,
+        path: str,
+        file_format: Optional[str] = None,
+        window: datetime.timedelta = datetime.timedelta(days=7),
+        uuids_per_request: int = 50,
+        max_workers: int = 4,
+        unit: Optional[str] = None,
+        progress: Optional[Callable[[int], None]] = None
+) -> int:
+    """Exports the data of many timeseries over a time period to a CSV or Parquet file
+
+    The period is split into windows that are fetched concurrently with
+    :meth:`.TimeseriesClient.get_multiple_timeseries_data_raw`, and written in order as soon as they arrive. Only a few
+    windows are held in memory at a time, so the size of an export is not limited by memory.
+
+    The file has one row per data point with the columns uuid, ts and v, see
+    :func:`selfhost_client.arrow.timeseries_schema` for the Parquet schema. Rows are ordered by group of
+    uuids_per_request timeseries, then by window.
+
+    Args:
+        client (:class:`.TimeseriesClient`): The client used to fetch the data.
+        uuids (List[str]): UUIDs of the timeseries to export.
+        start (datetime): Start (>=) of the time period.
+        end (datetime): End (<=) of the time period.
+        path (str): The file to write.
+        file_format (Optional[str]): csv or parquet. Defaults to the format of the extension of path.
+        window (timedelta): The length of the time period fetched per request, at most a year.
+        uuids_per_request (int): The maximum number of timeseries fetched per request.
+        max_workers (int): The maximum number of concurrent requests.
+        unit (Optional[str]): The SI unit of the exported values. A cast will occur if the base unit differs.
+        progress (Optional[Callable[[int], None]]): Called with the number of rows written so far after every
+            request.
+
+    Returns:
+        int: The number of rows written.
+
+    Raises:
+        ImportError: pyarrow is not installed and file_format is parquet.
+        ValueError: Unknown file_format, or a window, uuids_per_request or max_workers that is not positive.
+        The exceptions of :meth:`.TimeseriesClient.get_multiple_timeseries_data_raw`. The rows written so far are kept.
+    """
+    file_format = file_format or file_format_of(path)
+    if file_format not in EXPORT_FORMATS:
+        raise ValueError(f'file_format must be one of {", ".join(EXPORT_FORMATS)}, got {file_format}')
+    if window <= datetime.timedelta(0):
+        raise ValueError('window must be positive')
+    if uuids_per_request < 1:
+        raise ValueError('uuids_per_request must be positive')
+    if max_workers < 1:
+        raise ValueError('max_workers must be positive')
+
+    queries: List[Tuple[List[str], datetime.datetime, datetime.datetime]] = [
+        (uuids[index:index + uuids_per_request], window_start, window_end)
+        for index in range(0, len(uuids), uuids_per_request)
+        for window_start, window_end in _windows(start, end, window)
+    ]
+
+    def fetch(query: Tuple[List[str], datetime.datetime, datetime.datetime]) -> List[TimeseriesDataResponse]:
+        return client.get_multiple_timeseries_data_raw(query[0], query[1], query[2], unit)
+
+    writer = _ParquetWriter(path) if file_format == 'parquet' else _CsvWriter(path)
+    rows: int = 0
+    try:
+        with ThreadPoolExecutor(max_workers, thread_name_prefix='timeseries-export') as executor:
+            for timeseries_data in _ordered_map(executor, fetch, queries, 2 * max_workers):
+                rows += writer.write(timeseries_data)
+                if progress is not None:
+                    progress(rows)
+    finally:
+        writer.close()
+    return rows
@@ -1,11 +1,13 @@
 import requests
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from warnings import filterwarnings
 
 from beartype import beartype
 from beartype.roar import BeartypeDecorHintPep585DeprecationWarning
 
 from .base_client import BaseClient
+from .tracing import traced
+from .types.batch_types import BatchResultType
 from .types.group_types import GroupType
 from .types.policy_types import PolicyType
 from .utils import filter_none_values_from_dict
@@ -28,6 +30,7 @@ class GroupsClient(BaseClient):
         super().__init__(base_url, username, password)
         self._groups_api_path = 'groups'
 
+    @traced
     @beartype
     def get_groups(self,
                    limit: Optional[int] = None,
@@ -59,6 +62,7 @@ class GroupsClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def create_group(self, name: str) -> GroupType:
         """Add a new group to the NODA Self-host API
@@ -83,6 +87,7 @@ class GroupsClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def get_group(self, group_uuid: str) -> GroupType:
         """Fetches a specific group from NODA Self-host API by UUID
@@ -107,6 +112,7 @@ class GroupsClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def update_group(self, group_uuid: str, name: str) -> None:
         """Updates a group from NODA Self-host API
@@ -130,6 +136,7 @@ class GroupsClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def delete_group(self, group_uuid: str) -> None:
         """Deletes a group from NODA Self-host API
@@ -151,6 +158,7 @@ class GroupsClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def get_group_policies(self, group_uuid: str) -> List[PolicyType]:
         """Fetches a list of policies associated with the specified group from NODA Self-host API
@@ -174,3 +182,65 @@ class GroupsClient(BaseClient):
             url=f'{self._base_url}/{self._api_version}/{self._groups_api_path}/{group_uuid}/policies'
         )
         return self._process_response(response)
+
+    @traced
+    @beartype
+    def create_groups_many(self,
+                           groups: List[Dict[str, Any]],
+                           max_workers: int = 8
+                           ) -> List[BatchResultType]:
+        """Adds many groups to the NODA Self-host API concurrently
+
+        Calls :meth:`create_group` for every item, at most max_workers at a time.
+        A failing call does not stop the others.
+
+        Args:
+            groups (List[Dict[str, Any]]): The keyword arguments of :meth:`create_group` for every item.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            List[:class:`.BatchResultType`]: The created group or the raised exception of every item,
+            in the order of groups.
+        """
+        return self._run_many(self.create_group, groups, max_workers)
+
+    @traced
+    @beartype
+    def update_groups_many(self,
+                           groups: List[Dict[str, Any]],
+                           max_workers: int = 8
+                           ) -> List[BatchResultType]:
+        """Updates many groups in the NODA Self-host API concurrently
+
+        Calls :meth:`update_group` for every item, at most max_workers at a time.
+        A failing call does not stop the others.
+
+        Args:
+            groups (List[Dict[str, Any]]): The keyword arguments of :meth:`update_group` for every item,
+                including group_uuid.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            List[:class:`.BatchResultType`]: The outcome of every item, in the order of groups.
+        """
+        return self._run_many(self.update_group, groups, max_workers)
+
+    @traced
+    @beartype
+    def delete_groups_many(self,
+                           group_uuids: List[str],
+                           max_workers: int = 8
+                           ) -> List[BatchResultType]:
+        """Deletes many groups from the NODA Self-host API concurrently
+
+        Calls :meth:`delete_group` for every UUID, at most max_workers at a time.
+        A failing call does not stop the others.
+
+        Args:
+            group_uuids (List[str]): UUIDs of the groups to delete.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            List[:class:`.BatchResultType`]: The outcome of every UUID, in the order of group_uuids.
+        """
+        return self._run_many(self.delete_group, group_uuids, max_workers)
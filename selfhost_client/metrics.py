@@ -0,0 +1,188 @@
+import bisect
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+from warnings import filterwarnings
+
+from beartype import beartype
+from beartype.roar import BeartypeDecorHintPep585DeprecationWarning
+
+from .base_client import BaseClient
+from .types.request_types import RequestMetricsType
+
+filterwarnings("ignore", category=BeartypeDecorHintPep585DeprecationWarning)
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels) + '}'
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Histogram:
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.counts: List[int] = [0] * len(buckets)
+        self.count: int = 0
+        self.sum: float = 0.0
+
+    def observe(self, buckets: Tuple[float, ...], value: float) -> None:
+        index = bisect.bisect_left(buckets, value)
+        if index < len(buckets):
+            self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+
+
+class MetricsCollector:
+    """
+    Collects metrics about the requests sent by clients of NODA Self-host API
+
+    The collector is a request hook, see :meth:`.BaseClient.add_request_hook`. It keeps a latency histogram per
+    endpoint, counters of status codes, exceptions by class and transferred bytes, and reports the connection pool
+    utilization of the attached clients. :meth:`expose` renders everything in the OpenMetrics text format, ready to be
+    served from any HTTP endpoint or pushed to a gateway.
+
+    Example::
+
+        collector = MetricsCollector()
+        collector.attach(client)
+        ...
+        text = collector.expose()
+    """
+
+    @beartype
+    def __init__(self, prefix: str = 'selfhost_client', buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """MetricsCollector constructor
+
+        Args:
+            prefix (str): Prefix of all metric names.
+            buckets (Tuple[float, ...]): Upper bounds in seconds of the latency histogram buckets.
+        """
+        self._prefix = prefix
+        self._buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._clients: List[BaseClient] = []
+        self._latencies: Dict[Labels, _Histogram] = {}
+        self._responses: Dict[Labels, int] = {}
+        self._exceptions: Dict[Labels, int] = {}
+        self._bytes_sent: Dict[Labels, int] = {}
+        self._bytes_received: Dict[Labels, int] = {}
+
+    @beartype
+    def attach(self, client: BaseClient) -> None:
+        """Starts collecting the metrics of a client
+
+        Args:
+            client (:class:`.BaseClient`): The client to collect metrics from.
+        """
+        client.add_request_hook(self)
+        with self._lock:
+            self._clients.append(client)
+
+    @beartype
+    def detach(self, client: BaseClient) -> None:
+        """Stops collecting the metrics of a client
+
+        Args:
+            client (:class:`.BaseClient`): A client passed to :meth:`attach`.
+        """
+        client.remove_request_hook(self)
+        with self._lock:
+            self._clients.remove(client)
+
+    def __call__(self, metrics: RequestMetricsType) -> None:
+        endpoint: Labels = (('endpoint', metrics['endpoint']), ('method', metrics['method']))
+        with self._lock:
+            histogram: Optional[_Histogram] = self._latencies.get(endpoint)
+            if histogram is None:
+                histogram = self._latencies[endpoint] = _Histogram(self._buckets)
+            histogram.observe(self._buckets, metrics['total'])
+
+            if metrics['status_code'] is not None:
+                status: Labels = endpoint + (('code', str(metrics['status_code'])),)
+                self._responses[status] = self._responses.get(status, 0) + 1
+            if metrics['exception'] is not None:
+                exception: Labels = endpoint + (('exception', metrics['exception']),)
+                self._exceptions[exception] = self._exceptions.get(exception, 0) + 1
+            if metrics['bytes_sent']:
+                self._bytes_sent[endpoint] = self._bytes_sent.get(endpoint, 0) + metrics['bytes_sent']
+            if metrics['bytes_received']:
+                self._bytes_received[endpoint] = self._bytes_received.get(endpoint, 0) + metrics['bytes_received']
+
+    def expose(self) -> str:
+        """Renders the collected metrics in the OpenMetrics text format
+
+        Returns:
+            str: The metrics, terminated by # EOF.
+        """
+        with self._lock:
+            lines: List[str] = list(self._histogram_lines())
+            lines.extend(self._counter_lines('responses', 'Responses received by status code.', self._responses))
+            lines.extend(self._counter_lines('exceptions', 'Exceptions raised by class.', self._exceptions))
+            lines.extend(self._counter_lines('request_bytes', 'Bytes sent in request bodies.', self._bytes_sent))
+            lines.extend(
+                self._counter_lines('response_bytes', 'Bytes received in response bodies.', self._bytes_received)
+            )
+            lines.extend(self._pool_lines())
+        lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+
+    def _histogram_lines(self) -> Iterator[str]:
+        name = f'{self._prefix}_request_duration_seconds'
+        yield f'# TYPE {name} histogram'
+        yield f'# UNIT {name} seconds'
+        yield f'# HELP {name} Duration of requests until their response was decoded.'
+        for labels, histogram in sorted(self._latencies.items()):
+            cumulative = 0
+            for bound, count in zip(self._buckets, histogram.counts):
+                cumulative += count
+                yield f'{name}_bucket{_format_labels(labels + (("le", repr(float(bound))),))} {cumulative}'
+            yield f'{name}_bucket{_format_labels(labels + (("le", "+Inf"),))} {histogram.count}'
+            yield f'{name}_count{_format_labels(labels)} {histogram.count}'
+            yield f'{name}_sum{_format_labels(labels)} {_format_value(histogram.sum)}'
+
+    def _counter_lines(self, metric: str, description: str, values: Dict[Labels, int]) -> Iterator[str]:
+        name = f'{self._prefix}_{metric}'
+        yield f'# TYPE {name} counter'
+        yield f'# HELP {name} {description}'
+        for labels, value in sorted(values.items()):
+            yield f'{name}_total{_format_labels(labels)} {value}'
+
+    def _pool_lines(self) -> Iterator[str]:
+        # Clients of the same host have a pool each, which are summed up so that every host is a single series.
+        gauges: Dict[str, Dict[str, int]] = {'in_use': {}, 'idle': {}, 'max': {}}
+        descriptions: Dict[str, str] = {
+            'in_use': 'Connections currently used by requests.',
+            'idle': 'Open connections waiting to be reused.',
+            'max': 'Maximum number of connections kept per host.',
+        }
+        adapters = {id(adapter): adapter for client in self._clients for adapter in client._session.adapters.values()}
+        for adapter in adapters.values():
+            for pool_key in adapter.poolmanager.pools.keys():
+                pool = adapter.poolmanager.pools.get(pool_key)
+                queue = getattr(pool, 'pool', None)
+                if queue is None:
+                    continue
+                host: str = f'{pool.scheme}://{pool.host}:{pool.port}'
+                # The queue of a urllib3 pool starts filled with None placeholders, one per allowed connection.
+                idle = sum(1 for connection in list(queue.queue) if connection is not None)
+                for gauge, value in (('in_use', queue.maxsize - queue.qsize()), ('idle', idle), ('max', queue.maxsize)):
+                    gauges[gauge][host] = gauges[gauge].get(host, 0) + value
+
+        for gauge, samples in gauges.items():
+            name = f'{self._prefix}_pool_{gauge}_connections'
+            yield f'# TYPE {name} gauge'
+            yield f'# HELP {name} {descriptions[gauge]}'
+            for host, value in sorted(samples.items()):
+                yield f'{name}{_format_labels((("host", host),))} {value}'
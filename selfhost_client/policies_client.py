@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from warnings import filterwarnings
 
 import requests
@@ -6,6 +6,8 @@ from beartype import beartype
 from beartype.roar import BeartypeDecorHintPep585DeprecationWarning
 
 from .base_client import BaseClient
+from .tracing import traced
+from .types.batch_types import BatchResultType
 from .types.policy_types import PolicyType
 from .utils import filter_none_values_from_dict
 
@@ -27,6 +29,7 @@ class PoliciesClient(BaseClient):
         super().__init__(base_url, username, password)
         self._policies_api_path = 'policies'
 
+    @traced
     @beartype
     def get_policies(self,
                      limit: Optional[int] = None,
@@ -61,6 +64,7 @@ class PoliciesClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def create_policy(self,
                       group_uuid: str,
@@ -115,6 +119,7 @@ class PoliciesClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def get_policy(self, policy_uuid: str) -> PolicyType:
         """Returns a policy from NODA Self-host API by UUID
@@ -139,6 +144,7 @@ class PoliciesClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def update_policy(self,
                       policy_uuid: str,
@@ -195,6 +201,7 @@ class PoliciesClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def delete_policy(self, policy_uuid: str) -> None:
         """Deletes a policy from NODA Self-host API
@@ -215,3 +222,65 @@ class PoliciesClient(BaseClient):
             url=f'{self._base_url}/{self._api_version}/{self._policies_api_path}/{policy_uuid}'
         )
         return self._process_response(response)
+
+    @traced
+    @beartype
+    def create_policies_many(self,
+                             policies: List[Dict[str, Any]],
+                             max_workers: int = 8
+                             ) -> List[BatchResultType]:
+        """Adds many policies to the NODA Self-host API concurrently
+
+        Calls :meth:`create_policy` for every item, at most max_workers at a time.
+        A failing call does not stop the others.
+
+        Args:
+            policies (List[Dict[str, Any]]): The keyword arguments of :meth:`create_policy` for every item.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            List[:class:`.BatchResultType`]: The created policy or the raised exception of every item,
+            in the order of policies.
+        """
+        return self._run_many(self.create_policy, policies, max_workers)
+
+    @traced
+    @beartype
+    def update_policies_many(self,
+                             policies: List[Dict[str, Any]],
+                             max_workers: int = 8
+                             ) -> List[BatchResultType]:
+        """Updates many policies in the NODA Self-host API concurrently
+
+        Calls :meth:`update_policy` for every item, at most max_workers at a time.
+        A failing call does not stop the others.
+
+        Args:
+            policies (List[Dict[str, Any]]): The keyword arguments of :meth:`update_policy` for every item,
+                including policy_uuid.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            List[:class:`.BatchResultType`]: The outcome of every item, in the order of policies.
+        """
+        return self._run_many(self.update_policy, policies, max_workers)
+
+    @traced
+    @beartype
+    def delete_policies_many(self,
+                             policy_uuids: List[str],
+                             max_workers: int = 8
+                             ) -> List[BatchResultType]:
+        """Deletes many policies from the NODA Self-host API concurrently
+
+        Calls :meth:`delete_policy` for every UUID, at most max_workers at a time.
+        A failing call does not stop the others.
+
+        Args:
+            policy_uuids (List[str]): UUIDs of the policies to delete.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            List[:class:`.BatchResultType`]: The outcome of every UUID, in the order of policy_uuids.
+        """
+        return self._run_many(self.delete_policy, policy_uuids, max_workers)
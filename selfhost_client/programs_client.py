@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from warnings import filterwarnings
 
 import requests
@@ -6,6 +6,8 @@ from beartype import beartype
 from beartype.roar import BeartypeDecorHintPep585DeprecationWarning
 
 from .base_client import BaseClient
+from .tracing import traced
+from .types.batch_types import BatchResultType
 from .types.program_types import ProgramType
 from .utils import filter_none_values_from_dict
 
@@ -27,6 +29,7 @@ class ProgramsClient(BaseClient):
         super().__init__(base_url, username, password)
         self._programs_api_path = 'programs'
 
+    @traced
     @beartype
     def get_programs(self,
                      limit: Optional[int] = None,
@@ -61,6 +64,7 @@ class ProgramsClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def create_program(self,
                        name: str,
@@ -126,6 +130,7 @@ class ProgramsClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def get_program(self, program_uuid: str) -> ProgramType:
         """Returns a program from NODA Self-host API by UUID
@@ -150,6 +155,7 @@ class ProgramsClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def update_program(self,
                        program_uuid: str,
@@ -215,6 +221,7 @@ class ProgramsClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def delete_program(self, program_uuid) -> None:
         """Deletes a program from NODA Self-host API
@@ -235,3 +242,65 @@ class ProgramsClient(BaseClient):
             url=f'{self._base_url}/{self._api_version}/{self._programs_api_path}/{program_uuid}'
         )
         return self._process_response(response)
+
+    @traced
+    @beartype
+    def create_programs_many(self,
+                             programs: List[Dict[str, Any]],
+                             max_workers: int = 8
+                             ) -> List[BatchResultType]:
+        """Adds many programs to the NODA Self-host API concurrently
+
+        Calls :meth:`create_program` for every item, at most max_workers at a time.
+        A failing call does not stop the others.
+
+        Args:
+            programs (List[Dict[str, Any]]): The keyword arguments of :meth:`create_program` for every item.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            List[:class:`.BatchResultType`]: The created program or the raised exception of every item,
+            in the order of programs.
+        """
+        return self._run_many(self.create_program, programs, max_workers)
+
+    @traced
+    @beartype
+    def update_programs_many(self,
+                             programs: List[Dict[str, Any]],
+                             max_workers: int = 8
+                             ) -> List[BatchResultType]:
+        """Updates many programs in the NODA Self-host API concurrently
+
+        Calls :meth:`update_program` for every item, at most max_workers at a time.
+        A failing call does not stop the others.
+
+        Args:
+            programs (List[Dict[str, Any]]): The keyword arguments of :meth:`update_program` for every item,
+                including program_uuid.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            List[:class:`.BatchResultType`]: The outcome of every item, in the order of programs.
+        """
+        return self._run_many(self.update_program, programs, max_workers)
+
+    @traced
+    @beartype
+    def delete_programs_many(self,
+                             program_uuids: List[str],
+                             max_workers: int = 8
+                             ) -> List[BatchResultType]:
+        """Deletes many programs from the NODA Self-host API concurrently
+
+        Calls :meth:`delete_program` for every UUID, at most max_workers at a time.
+        A failing call does not stop the others.
+
+        Args:
+            program_uuids (List[str]): UUIDs of the programs to delete.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            List[:class:`.BatchResultType`]: The outcome of every UUID, in the order of program_uuids.
+        """
+        return self._run_many(self.delete_program, program_uuids, max_workers)
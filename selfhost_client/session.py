@@ -0,0 +1,251 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from .tracing import Tracer
+from .types.request_types import RequestMetricsType
+
+logger = logging.getLogger(__name__)
+Response = requests.models.Response
+RequestHook = Callable[[RequestMetricsType], None]
+_SINGLE_FLIGHT_ARGUMENTS = frozenset(('params', 'headers', 'timeout', 'allow_redirects'))
+
+# Connection timings are collected per thread, since urllib3 opens connections in the thread sending the request.
+_connection_timings = threading.local()
+
+
+def _record_connection_timing(name: str, seconds: float) -> None:
+    timings: Optional[Dict[str, float]] = getattr(_connection_timings, 'current', None)
+    if timings is not None:
+        timings[name] = timings.get(name, 0.0) + seconds
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self) -> None:
+        started = time.perf_counter()
+        super().connect()
+        _record_connection_timing('connect', time.perf_counter() - started)
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def _new_conn(self) -> Any:
+        started = time.perf_counter()
+        sock = super()._new_conn()
+        self._new_conn_seconds = time.perf_counter() - started
+        return sock
+
+    def connect(self) -> None:
+        self._new_conn_seconds = 0.0
+        started = time.perf_counter()
+        super().connect()
+        _record_connection_timing('connect', self._new_conn_seconds)
+        _record_connection_timing('tls', time.perf_counter() - started - self._new_conn_seconds)
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedHTTPAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _TimedHTTPConnectionPool,
+            'https': _TimedHTTPSConnectionPool,
+        }
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.response: Optional[Response] = None
+        self.error: Optional[BaseException] = None
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def endpoint_template(api_url: str, url: str) -> str:
+    """Returns the template of an endpoint of NODA Self-host API
+
+    Args:
+        api_url (str): The base url of the API including the API version, e.g. https://example.com/v2
+        url (str): The requested url.
+
+    Returns:
+        str: The path relative to the API version with all resource identifiers replaced by {uuid},
+        e.g. timeseries/{uuid}/data
+    """
+    path: str = url.split('?', 1)[0]
+    if path.startswith(api_url):
+        path = path[len(api_url):]
+    segments: List[str] = path.strip('/').split('/')
+    # Paths alternate between resource names and identifiers, e.g. users/{uuid}/tokens/{uuid}.
+    return '/'.join(
+        '{uuid}' if index % 2 and segment != 'me' else segment
+        for index, segment in enumerate(segments)
+    )
+
+
+class SelfHostSession(requests.Session):
+    """
+    A requests session used by the clients of NODA Self-host API
+
+    With single flight enabled, concurrent identical GET requests share one HTTP request. The first caller sends
+    the request and the callers that arrive while it is in flight wait for it and receive the same response.
+
+    With request hooks added, every request is measured and reported to the hooks as a
+    :class:`.RequestMetricsType` once its response has been processed.
+
+    With a tracer set, every request is sent in a span and carries the headers propagating its trace context.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.mount('https://', _TimedHTTPAdapter())
+        self.mount('http://', _TimedHTTPAdapter())
+        self.api_url: str = ''
+        self.single_flight: bool = False
+        self.request_hooks: List[RequestHook] = []
+        self.tracer: Optional[Tracer] = None
+        self._calls_lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def request(self, method: str, url: str, *args, **kwargs) -> Response:
+        if not self.single_flight or method.upper() != 'GET' or args or not _SINGLE_FLIGHT_ARGUMENTS.issuperset(kwargs):
+            return self._traced_request(method, url, *args, **kwargs)
+
+        key: Hashable = (url, _freeze(kwargs))
+        with self._calls_lock:
+            call: Optional[_Call] = self._calls.get(key)
+            leader: bool = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.response
+
+        try:
+            call.response = self._traced_request(method, url, **kwargs)
+            # Lets the callers decode the shared response once, see BaseClient._process_response.
+            call.response.single_flight_lock = threading.Lock()
+            return call.response
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._calls_lock:
+                del self._calls[key]
+            call.done.set()
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> Response:
+        if self.tracer is not None:
+            self.tracer.inject(request.headers)
+        return super().send(request, **kwargs)
+
+    def report_request(
+            self,
+            response: Response,
+            decode: Optional[float] = None,
+            exception: Optional[str] = None,
+            bytes_received: Optional[int] = None
+    ) -> None:
+        """Completes the metrics of a measured request and reports them to the request hooks
+
+        Args:
+            response (requests.Response): The processed response.
+            decode (Optional[float]): Seconds spent decoding the response body.
+            exception (Optional[str]): Class name of the exception raised for the response.
+            bytes_received (Optional[int]): Size of the response body, required for streamed responses
+                since their content is no longer available once consumed.
+        """
+        # Popped so that a response shared by single flight is only reported once.
+        metrics: Optional[RequestMetricsType] = response.__dict__.pop('request_metrics', None)
+        if metrics is None:
+            return
+        metrics['status_code'] = response.status_code
+        metrics['bytes_received'] = len(response.content or b'') if bytes_received is None else bytes_received
+        metrics['decode'] = decode
+        metrics['total'] = time.perf_counter() - metrics['total']
+        metrics['exception'] = exception
+        self._emit(metrics)
+
+    def _traced_request(self, method: str, url: str, *args, **kwargs) -> Response:
+        if self.tracer is None:
+            return self._measured_request(method, url, *args, **kwargs)
+
+        attributes: Dict[str, Any] = {
+            'http.method': method.upper(),
+            'http.url': url,
+            'selfhost.endpoint': endpoint_template(self.api_url, url),
+        }
+        with self.tracer.span(f'HTTP {method.upper()}', attributes) as span:
+            response: Response = self._measured_request(method, url, *args, **kwargs)
+            span.set_attribute('http.status_code', response.status_code)
+            return response
+
+    def _measured_request(self, method: str, url: str, *args, **kwargs) -> Response:
+        if not self.request_hooks:
+            return super().request(method, url, *args, **kwargs)
+
+        metrics: RequestMetricsType = {
+            'method': method.upper(),
+            'url': url,
+            'endpoint': endpoint_template(self.api_url, url),
+            'status_code': None,
+            'bytes_sent': None,
+            'bytes_received': None,
+            'connect': None,
+            'tls': None,
+            'ttfb': None,
+            'decode': None,
+            # Holds the start time until the request is reported.
+            'total': time.perf_counter(),
+            'retries': 0,
+            'exception': None,
+        }
+        _connection_timings.current = timings = {}
+        try:
+            response: Response = super().request(method, url, *args, **kwargs)
+        except Exception as e:
+            metrics['total'] = time.perf_counter() - metrics['total']
+            metrics['exception'] = type(e).__name__
+            metrics.update(timings)
+            self._emit(metrics)
+            raise
+        finally:
+            _connection_timings.current = None
+
+        body: Any = response.request.body
+        metrics['url'] = response.request.url
+        metrics['bytes_sent'] = len(body) if isinstance(body, (bytes, str)) else 0 if body is None else None
+        metrics['ttfb'] = response.elapsed.total_seconds()
+        metrics['retries'] = len(getattr(getattr(response.raw, 'retries', None), 'history', None) or ())
+        metrics.update(timings)
+        response.request_metrics = metrics
+        return response
+
+    def _emit(self, metrics: RequestMetricsType) -> None:
+        for hook in list(self.request_hooks):
+            try:
+                hook(metrics)
+            except Exception:
+                logger.exception('Request hook %r failed', hook)
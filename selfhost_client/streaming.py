@@ -0,0 +1,168 @@
+import base64
+import io
+import json
+import os
+import uuid
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Union
+
+import requests
+
+Response = requests.models.Response
+ProgressCallback = Callable[[int, Optional[int]], None]
+StreamSource = Union[str, bytes, io.IOBase, Iterable[Union[str, bytes]]]
+StreamDestination = Union[str, os.PathLike, io.IOBase]
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+def source_size(source: Any) -> Optional[int]:
+    """Returns the number of bytes or characters left in a source, or None if it is unknown"""
+    if isinstance(source, (str, bytes)):
+        return len(source)
+    if isinstance(source, io.TextIOBase):
+        # Positions of text streams are opaque and do not count characters.
+        return None
+    try:
+        if not source.seekable():
+            return None
+        position: int = source.tell()
+        end: int = source.seek(0, io.SEEK_END)
+        source.seek(position)
+        return end - position
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def read_chunks(source: StreamSource, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Union[str, bytes]]:
+    """Iterates a source in chunks of at most chunk_size bytes or characters
+
+    Args:
+        source: A str, bytes, file-like object opened in text or binary mode, or an iterable of str or bytes chunks.
+        chunk_size (int): The maximum size of the chunks read from file-like objects, str and bytes.
+    """
+    if isinstance(source, (str, bytes)):
+        for start in range(0, len(source), chunk_size):
+            yield source[start:start + chunk_size]
+    elif hasattr(source, 'read'):
+        while True:
+            chunk: Union[str, bytes] = source.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        yield from source
+
+
+def _base64_chunks(chunks: Iterable[bytes]) -> Iterator[str]:
+    # Base64 encodes groups of 3 bytes, so the remainder of each chunk is carried over to the next one.
+    remainder: bytes = b''
+    for chunk in chunks:
+        data: bytes = remainder + chunk
+        cut: int = len(data) - len(data) % 3
+        remainder = data[cut:]
+        if cut:
+            yield base64.b64encode(data[:cut]).decode('ascii')
+    if remainder:
+        yield base64.b64encode(remainder).decode('ascii')
+
+
+def streamed_json_body(
+        fields: Dict[str, Any],
+        content: StreamSource,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None
+) -> Iterator[bytes]:
+    """Generates a JSON object with a content field read from a stream
+
+    Only one chunk of the content is held in memory at a time. str chunks are written as they are, like the content
+    argument of :meth:`.DatasetsClient.create_dataset`, while bytes chunks are base64 encoded.
+
+    Args:
+        fields (Dict[str, Any]): The other fields of the JSON object.
+        content: The content, see :func:`read_chunks`.
+        chunk_size (int): The maximum size of the chunks read from the content.
+        progress (Optional[Callable[[int, Optional[int]], None]]): Called after each chunk with the number of bytes or
+            characters of content read so far and the total, if known.
+    """
+    total: Optional[int] = source_size(content)
+    head: str = json.dumps(fields)
+    yield f'{head[:-1]}{", " if fields else ""}"content": "'.encode('utf-8')
+
+    read: int = 0
+
+    def counted() -> Iterator[Union[str, bytes]]:
+        nonlocal read
+        for chunk in read_chunks(content, chunk_size):
+            yield chunk
+            read += len(chunk)
+            if progress is not None:
+                progress(read, total)
+
+    chunks: Iterator[Union[str, bytes]] = counted()
+    text: bool = False
+    for chunk in chunks:
+        if isinstance(chunk, bytes):
+            if text:
+                raise TypeError('content chunks must either all be str or all be bytes')
+            for encoded in _base64_chunks(_bytes_chunks(chunk, chunks)):
+                yield encoded.encode('ascii')
+            break
+        text = True
+        # Escapes the characters of the chunk as in a JSON string, without the surrounding quotes.
+        yield json.dumps(chunk)[1:-1].encode('utf-8')
+    yield b'"}'
+
+
+def _bytes_chunks(first: bytes, rest: Iterable[Union[str, bytes]]) -> Iterator[bytes]:
+    yield first
+    for chunk in rest:
+        if not isinstance(chunk, bytes):
+            raise TypeError('content chunks must either all be str or all be bytes')
+        yield chunk
+
+
+def write_response_content(
+        response: Response,
+        destination: StreamDestination,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None
+) -> int:
+    """Writes the body of a streamed response to a path or a writable binary stream
+
+    Args:
+        response (requests.Response): A response of a request sent with stream=True.
+        destination: A path to write to, or a writable binary stream. An existing file is only replaced once the
+            whole body is written.
+        chunk_size (int): The maximum size of the chunks read from the response.
+        progress (Optional[Callable[[int, Optional[int]], None]]): Called after each chunk with the number of bytes
+            written so far and the Content-Length of the response, if known.
+
+    Returns:
+        int: The number of bytes written.
+    """
+    length: Optional[str] = response.headers.get('Content-Length')
+    total: Optional[int] = int(length) if length is not None else None
+
+    def write(stream: io.IOBase) -> int:
+        written = 0
+        for chunk in response.iter_content(chunk_size):
+            stream.write(chunk)
+            written += len(chunk)
+            if progress is not None:
+                progress(written, total)
+        return written
+
+    if isinstance(destination, (str, os.PathLike)):
+        # Written to a temporary file next to the destination, so that a failed download leaves it untouched.
+        directory, name = os.path.split(os.path.abspath(destination))
+        temporary_path: str = os.path.join(directory, f'.{name}.{uuid.uuid4().hex}.tmp')
+        file = open(temporary_path, 'xb')
+        try:
+            with file:
+                written: int = write(file)
+            os.replace(temporary_path, destination)
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+        return written
+    return write(destination)
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from warnings import filterwarnings
 
 import requests
@@ -6,6 +6,8 @@ from beartype import beartype
 from beartype.roar import BeartypeDecorHintPep585DeprecationWarning
 
 from .base_client import BaseClient
+from .tracing import traced
+from .types.batch_types import BatchResultType
 from .types.dataset_types import DatasetType
 from .types.thing_types import ThingType
 from .types.timeseries_types import TimeseriesType
@@ -29,6 +31,7 @@ class ThingsClient(BaseClient):
         super().__init__(base_url, username, password)
         self._things_api_path = 'things'
 
+    @traced
     @beartype
     def get_things(self,
                    limit: Optional[int] = None,
@@ -63,6 +66,7 @@ class ThingsClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def create_thing(self,
                      name: str,
@@ -97,6 +101,7 @@ class ThingsClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def get_thing(self, thing_uuid: str) -> ThingType:
         """Returns a thing from NODA Self-host API by UUID
@@ -121,6 +126,7 @@ class ThingsClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def update_thing(self,
                      thing_uuid: str,
@@ -167,6 +173,7 @@ class ThingsClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def delete_thing(self, thing_uuid: str) -> None:
         """Deletes a thing from NODA Self-host API
@@ -188,6 +195,7 @@ class ThingsClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def get_thing_datasets(self, thing_uuid: str) -> List[DatasetType]:
         """Returns a list of datasets associated with the specified thing from NODA Self-host API
@@ -212,6 +220,7 @@ class ThingsClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def get_thing_timeseries(self, thing_uuid: str) -> List[TimeseriesType]:
         """Returns a list of timeseries associated with the specified thing from NODA Self-host API
@@ -235,3 +244,65 @@ class ThingsClient(BaseClient):
             url=f'{self._base_url}/{self._api_version}/{self._things_api_path}/{thing_uuid}/timeseries'
         )
         return self._process_response(response)
+
+    @traced
+    @beartype
+    def create_things_many(self,
+                           things: List[Dict[str, Any]],
+                           max_workers: int = 8
+                           ) -> List[BatchResultType]:
+        """Adds many things to the NODA Self-host API concurrently
+
+        Calls :meth:`create_thing` for every item, at most max_workers at a time.
+        A failing call does not stop the others.
+
+        Args:
+            things (List[Dict[str, Any]]): The keyword arguments of :meth:`create_thing` for every item.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            List[:class:`.BatchResultType`]: The created thing or the raised exception of every item,
+            in the order of things.
+        """
+        return self._run_many(self.create_thing, things, max_workers)
+
+    @traced
+    @beartype
+    def update_things_many(self,
+                           things: List[Dict[str, Any]],
+                           max_workers: int = 8
+                           ) -> List[BatchResultType]:
+        """Updates many things in the NODA Self-host API concurrently
+
+        Calls :meth:`update_thing` for every item, at most max_workers at a time.
+        A failing call does not stop the others.
+
+        Args:
+            things (List[Dict[str, Any]]): The keyword arguments of :meth:`update_thing` for every item,
+                including thing_uuid.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            List[:class:`.BatchResultType`]: The outcome of every item, in the order of things.
+        """
+        return self._run_many(self.update_thing, things, max_workers)
+
+    @traced
+    @beartype
+    def delete_things_many(self,
+                           thing_uuids: List[str],
+                           max_workers: int = 8
+                           ) -> List[BatchResultType]:
+        """Deletes many things from the NODA Self-host API concurrently
+
+        Calls :meth:`delete_thing` for every UUID, at most max_workers at a time.
+        A failing call does not stop the others.
+
+        Args:
+            thing_uuids (List[str]): UUIDs of the things to delete.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            List[:class:`.BatchResultType`]: The outcome of every UUID, in the order of thing_uuids.
+        """
+        return self._run_many(self.delete_thing, thing_uuids, max_workers)
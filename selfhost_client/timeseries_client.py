@@ -1,5 +1,6 @@
 import datetime
-from typing import List, Optional
+import logging
+from typing import Any, Dict, List, Optional, Tuple
 from warnings import filterwarnings
 
 import pyrfc3339
@@ -7,7 +8,19 @@ import requests
 from beartype import beartype
 from beartype.roar import BeartypeDecorHintPep585DeprecationWarning
 
+from .aggregation import (
+    aggregate_timeseries_dataframe,
+    combine_bucket_aggregates,
+    source_aggregates,
+    validate_aggregation,
+)
+from .arrow import read_timeseries_batches, require_pyarrow, timeseries_data_to_arrow
 from .base_client import BaseClient
+from .bounds import BOUNDS_MODES, apply_bounds
+from .dataframes import require_pandas, timeseries_data_to_dataframe
+from .tracing import traced
+from .units import unit_registry
+from .types.batch_types import BatchResultType
 from .types.timeseries_types import (
     TimeseriesType,
     TimeseriesDataPointType,
@@ -20,6 +33,8 @@ from .utils import filter_none_values_from_dict
 filterwarnings("ignore", category=BeartypeDecorHintPep585DeprecationWarning)
 Response = requests.models.Response
 
+logger = logging.getLogger(__name__)
+
 
 class TimeseriesClient(BaseClient):
     """
@@ -35,7 +50,10 @@ class TimeseriesClient(BaseClient):
     ) -> None:
         super().__init__(base_url, username, password)
         self._timeseries_api_path = "timeseries"
+        # The lower bound, upper bound and SI unit of timeseries, fetched once for validating data points.
+        self._timeseries_bounds: Dict[str, Tuple[Optional[float], Optional[float], Optional[str]]] = {}
 
+    @traced
     @beartype
     def get_timeseries(
         self,
@@ -69,6 +87,7 @@ class TimeseriesClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def create_timeseries(
         self,
@@ -115,6 +134,7 @@ class TimeseriesClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def get_timeseries_by_uuid(self, timeseries_uuid: str) -> TimeseriesType:
         """Returns a timeseries from NODA Self-host API by UUID
@@ -139,6 +159,7 @@ class TimeseriesClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def update_timeseries(
         self,
@@ -170,6 +191,7 @@ class TimeseriesClient(BaseClient):
             :class:`.SelfHostInternalServerException`: Server encountered an unexpected condition that prevented it
                 from fulfilling the request.
         """
+        self._timeseries_bounds.pop(timeseries_uuid, None)
         response: Response = self._session.put(
             url=f"{self._base_url}/{self._api_version}/{self._timeseries_api_path}/{timeseries_uuid}",
             json=filter_none_values_from_dict(
@@ -185,6 +207,7 @@ class TimeseriesClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def delete_timeseries(self, timeseries_uuid: str) -> None:
         """Deletes a timeseries from NODA Self-host API
@@ -201,11 +224,13 @@ class TimeseriesClient(BaseClient):
             :class:`.SelfHostInternalServerException`: Server encountered an unexpected condition that prevented it
                 from fulfilling the request.
         """
+        self._timeseries_bounds.pop(timeseries_uuid, None)
         response: Response = self._session.delete(
             url=f"{self._base_url}/{self._api_version}/{self._timeseries_api_path}/{timeseries_uuid}"
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def get_timeseries_data(
         self,
@@ -261,43 +286,22 @@ class TimeseriesClient(BaseClient):
             :class:`.SelfHostInternalServerException`: Server encountered an unexpected condition that prevented it
                 from fulfilling the request.
         """
-        response: Response = self._session.get(
-            url=f"{self._base_url}/{self._api_version}/{self._timeseries_api_path}/{timeseries_uuid}/data",
-            params=filter_none_values_from_dict(
-                {
-                    "start": start.isoformat(),
-                    "end": end.isoformat(),
-                    "unit": unit,
-                    "ge": ge,
-                    "le": le,
-                    "precision": precision,
-                    "aggregate": aggregate,
-                    "timezone": timezone,
-                }
-            ),
+        timeseries_data_points: List[TimeseriesDataPointResponse] = self._query_timeseries_data(
+            timeseries_uuid, start, end, unit, ge, le, precision, aggregate, timezone
         )
-
-        if response.status_code == 204:
-            return []
-
-        timeseries_data_points: List[
-            TimeseriesDataPointResponse
-        ] = self._process_response(response)
-
-        if timeseries_data_points is None:
-            return []
-
         return [
             {"v": data_point.get("v"), "ts": pyrfc3339.parse(data_point.get("ts"))}
             for data_point in timeseries_data_points
         ]
 
+    @traced
     @beartype
     def create_timeseries_data(
         self,
         timeseries_uuid: str,
         data_points: List[TimeseriesDataPointType],
         unit: Optional[str] = None,
+        bounds: Optional[str] = None,
     ) -> None:
         """Add data points to a timeseries from NODA Self-host API
 
@@ -305,8 +309,20 @@ class TimeseriesClient(BaseClient):
             timeseries_uuid (str): UUID of timeseries to query.
             unit (Optional[str]): The SI unit of the result. A cast will occur if the base unit differs.
             data_points (List[TimeseriesDataPointType]): A list of data points.
+            bounds (Optional[str]): Validates the data points against the lower and upper bound of the timeseries
+                before they are sent. The bounds are fetched once per timeseries and cached, and converted with
+                :data:`.unit_registry` when unit differs from the SI unit of the timeseries. Data points are not
+                validated when the units can not be converted.
+
+                -   filter: Leave out data points out of bounds. Nothing is sent if all of them are.
+
+                -   clip: Replace the values out of bounds with the nearest bound, and leave out NaN and None.
+
+                -   raise: Raise :class:`.SelfHostOutOfBoundsException` without sending any data point.
 
         Raises:
+            ValueError: Unknown bounds.
+            :class:`.SelfHostOutOfBoundsException`: A data point is out of bounds and bounds is raise.
             :class:`.SelfHostBadRequestException`: Sent request had insufficient data or invalid options.
             :class:`.SelfHostUnauthorizedException`: Request was refused due to lacking authentication credentials.
             :class:`.SelfHostForbiddenException`: Server understands the request but refuses to authorize it.
@@ -319,14 +335,56 @@ class TimeseriesClient(BaseClient):
             {"v": data_point["v"], "ts": data_point["ts"].isoformat()}
             for data_point in data_points
         ]
+        if bounds is not None:
+            filtered_data_points = self._validate_bounds(timeseries_uuid, filtered_data_points, unit, bounds)
+            if not filtered_data_points:
+                # Every data point was filtered out, there is nothing to send.
+                return None
+        return self._post_timeseries_data(timeseries_uuid, filtered_data_points, unit)
+
+    @traced
+    @beartype
+    def create_timeseries_data_raw(
+        self,
+        timeseries_uuid: str,
+        data_points: List[TimeseriesDataPointResponse],
+        unit: Optional[str] = None,
+        bounds: Optional[str] = None,
+    ) -> int:
+        """Add data points to a timeseries from NODA Self-host API as they are sent to the API
 
-        response: Response = self._session.post(
-            url=f"{self._base_url}/{self._api_version}/{self._timeseries_api_path}/{timeseries_uuid}/data",
-            params=filter_none_values_from_dict({"unit": unit}),
-            json=filtered_data_points,
-        )
-        return self._process_response(response)
+        Like :meth:`create_timeseries_data`, but the timestamps are RFC 3339 strings that are sent as they are,
+        for callers that read them from files.
+
+        Args:
+            timeseries_uuid (str): UUID of timeseries to query.
+            data_points (List[:class:`.TimeseriesDataPointResponse`]): A list of data points.
+            unit (Optional[str]): The SI unit of the data. A cast will occur if the base unit differs.
+            bounds (Optional[str]): Validates the data points against the lower and upper bound of the timeseries
+                before they are sent, see :meth:`create_timeseries_data`.
 
+        Returns:
+            int: The number of data points added, after those out of bounds were filtered out.
+
+        Raises:
+            ValueError: Unknown bounds.
+            :class:`.SelfHostOutOfBoundsException`: A data point is out of bounds and bounds is raise.
+            :class:`.SelfHostBadRequestException`: Sent request had insufficient data or invalid options.
+            :class:`.SelfHostUnauthorizedException`: Request was refused due to lacking authentication credentials.
+            :class:`.SelfHostForbiddenException`: Server understands the request but refuses to authorize it.
+            :class:`.SelfHostNotFoundException`: The requested resource was not found.
+            :class:`.SelfHostTooManyRequestsException`: Sent too many requests in a given amount of time.
+            :class:`.SelfHostInternalServerException`: Server encountered an unexpected condition that prevented it
+                from fulfilling the request.
+        """
+        if bounds is not None:
+            data_points = self._validate_bounds(timeseries_uuid, data_points, unit, bounds)
+        if not data_points:
+            return 0
+        self._post_timeseries_data(timeseries_uuid, data_points, unit)
+        return len(data_points)
+
+    @traced
     @beartype
     def delete_timeseries_data(
         self,
@@ -364,6 +422,7 @@ class TimeseriesClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def get_multiple_timeseries_data(
         self,
@@ -419,6 +478,530 @@ class TimeseriesClient(BaseClient):
             :class:`.SelfHostInternalServerException`: Server encountered an unexpected condition that prevented it
                 from fulfilling the request.
         """
+        timeseries_data: List[TimeseriesDataResponse] = self._query_multiple_timeseries_data(
+            uuids, start, end, unit, ge, le, precision, aggregate, timezone
+        )
+        return [
+            {
+                "uuid": data.get("uuid"),
+                "data": [
+                    {
+                        "v": data_point.get("v"),
+                        "ts": pyrfc3339.parse(data_point.get("ts")),
+                    }
+                    for data_point in data.get("data")
+                ],
+            }
+            for data in timeseries_data
+        ]
+
+    @traced
+    @beartype
+    def get_multiple_timeseries_data_raw(
+        self,
+        uuids: List[str],
+        start: datetime.datetime,
+        end: datetime.datetime,
+        unit: Optional[str] = None,
+        ge: Optional[int] = None,
+        le: Optional[int] = None,
+        precision: Optional[str] = None,
+        aggregate: Optional[str] = None,
+        timezone: Optional[str] = None,
+    ) -> List[TimeseriesDataResponse]:
+        """Fetch multiple ranges of timeseries data from NODA Self-host API as returned by the API
+
+        Like :meth:`get_multiple_timeseries_data`, but the timestamps are left as RFC 3339 strings instead of being
+        parsed into datetimes, for callers that write them out as they are.
+
+        Args:
+            uuids (List[str]): A series of timeseries UUIDs to search for.
+            start (datetime): Start (>=) of time period. The period (start to end) can not exceed 1 year.
+                Must be in RFC 3339 compliant format, section 5.6.
+            end (datetime): End (<=) of time period. The period (start to end) can not exceed 1 year.
+                Must be in RFC 3339 compliant format, section 5.6.
+            unit (optional[str]): The SI unit of the result. A cast will occur if the base unit differs.
+            ge (optional[int]): Value should be greater or equal to (>=) this.
+            le (optional[int]): Value should be less or equal to (<=) this.
+            precision (optional[str]): Truncate all timestamps and perform aggregate operations on the grouping.
+                See :meth:`get_multiple_timeseries_data` for available values.
+            aggregate (optional[str]): When using precision. Select this aggregate function instead of the default avg
+                when computing the result. Does nothing when precision is not set.
+            timezone (optional[str]): Act as this time zone. Defaults to UTC.
+
+        Returns:
+            List[:class:`.TimeseriesDataResponse`]
+
+        Raises:
+            :class:`.SelfHostBadRequestException`: Sent request had insufficient data or invalid options.
+            :class:`.SelfHostUnauthorizedException`: Request was refused due to lacking authentication credentials.
+            :class:`.SelfHostForbiddenException`: Server understands the request but refuses to authorize it.
+            :class:`.SelfHostNotFoundException`: The requested resource was not found.
+            :class:`.SelfHostTooManyRequestsException`: Sent too many requests in a given amount of time.
+            :class:`.SelfHostInternalServerException`: Server encountered an unexpected condition that prevented it
+                from fulfilling the request.
+        """
+        return self._query_multiple_timeseries_data(uuids, start, end, unit, ge, le, precision, aggregate, timezone)
+
+    @traced
+    @beartype
+    def get_multiple_timeseries_dataframe(
+        self,
+        uuids: List[str],
+        start: datetime.datetime,
+        end: datetime.datetime,
+        unit: Optional[str] = None,
+        ge: Optional[int] = None,
+        le: Optional[int] = None,
+        precision: Optional[str] = None,
+        aggregate: Optional[str] = None,
+        timezone: Optional[str] = None,
+        layout: str = "wide",
+    ) -> Any:
+        """Fetch multiple ranges of timeseries data from NODA Self-host API as a pandas DataFrame
+
+        Builds the DataFrame straight from the API response without decoding every data point into a dict first.
+        Requires the optional pandas dependency.
+
+        Args:
+            uuids (List[str]): A series of timeseries UUIDs to search for.
+            start (datetime): Start (>=) of time period. The period (start to end) can not exceed 1 year.
+                Must be in RFC 3339 compliant format, section 5.6.
+            end (datetime): End (<=) of time period. The period (start to end) can not exceed 1 year.
+                Must be in RFC 3339 compliant format, section 5.6.
+            unit (optional[str]): The SI unit of the result. A cast will occur if the base unit differs.
+            ge (optional[int]): Value should be greater or equal to (>=) this.
+            le (optional[int]): Value should be less or equal to (<=) this.
+            precision (optional[str]): Truncate all timestamps and perform aggregate operations on the grouping.
+                See :meth:`get_multiple_timeseries_data` for available values.
+            aggregate (optional[str]): When using precision. Select this aggregate function instead of the default avg
+                when computing the result. Does nothing when precision is not set.
+            timezone (optional[str]): Act as this time zone. Defaults to UTC.
+            layout (str): Layout of the resulting DataFrame.
+
+                -   wide: One row per timestamp and one column per timeseries UUID.
+
+                -   long: One row per data point with the columns uuid, ts and v.
+
+        Returns:
+            pandas.DataFrame
+
+        Raises:
+            ImportError: pandas is not installed.
+            :class:`.SelfHostBadRequestException`: Sent request had insufficient data or invalid options.
+            :class:`.SelfHostUnauthorizedException`: Request was refused due to lacking authentication credentials.
+            :class:`.SelfHostForbiddenException`: Server understands the request but refuses to authorize it.
+            :class:`.SelfHostNotFoundException`: The requested resource was not found.
+            :class:`.SelfHostTooManyRequestsException`: Sent too many requests in a given amount of time.
+            :class:`.SelfHostInternalServerException`: Server encountered an unexpected condition that prevented it
+                from fulfilling the request.
+        """
+        require_pandas()
+        timeseries_data: List[TimeseriesDataResponse] = self._query_multiple_timeseries_data(
+            uuids, start, end, unit, ge, le, precision, aggregate, timezone
+        )
+        return timeseries_data_to_dataframe(timeseries_data, layout)
+
+    @traced
+    @beartype
+    def get_multiple_timeseries_aggregates(
+        self,
+        uuids: List[str],
+        start: datetime.datetime,
+        end: datetime.datetime,
+        precision: str,
+        aggregates: List[str],
+        unit: Optional[str] = None,
+        ge: Optional[int] = None,
+        le: Optional[int] = None,
+        timezone: Optional[str] = None,
+        source_precision: Optional[str] = None,
+    ) -> Any:
+        """Compute several aggregates of multiple timeseries from a single fetch from NODA Self-host API
+
+        The data is fetched once and bucketed locally with the same rules as the precision option of the API,
+        see :func:`selfhost_client.aggregation.aggregate_timeseries_dataframe`. This replaces one request per
+        aggregate and adds percentiles, which the API lacks. Requires the optional pandas dependency.
+
+        Args:
+            uuids (List[str]): A series of timeseries UUIDs to search for.
+            start (datetime): Start (>=) of time period. The period (start to end) can not exceed 1 year.
+                Must be in RFC 3339 compliant format, section 5.6.
+            end (datetime): End (<=) of time period. The period (start to end) can not exceed 1 year.
+                Must be in RFC 3339 compliant format, section 5.6.
+            precision (str): The size of the buckets to aggregate.
+                Available values : microseconds, milliseconds, second, minute, minute5, minute10,
+                minute15, minute20, minute30, hour, day, week, month, year, decade, century, millennia
+            aggregates (List[str]): The aggregates to compute per bucket.
+                Available values: avg, min, max, sum, count and percentiles as pNN, e.g. p95.
+            unit (optional[str]): The SI unit of the result. A cast will occur if the base unit differs.
+            ge (optional[int]): Value should be greater or equal to (>=) this.
+            le (optional[int]): Value should be less or equal to (<=) this.
+            timezone (optional[str]): Compute the buckets in this time zone. Defaults to UTC.
+            source_precision (optional[str]): Let the API aggregate the data into buckets of this precision before
+                it is fetched, to reduce the transferred data. Must be finer than precision, and precision a multiple
+                of it. One request is sent per aggregate of the source buckets, see
+                :func:`selfhost_client.aggregation.source_aggregates`. Percentiles can not be requested.
+
+        Returns:
+            pandas.DataFrame: One row per timeseries and bucket with the columns uuid, ts and one column per aggregate.
+
+        Raises:
+            ImportError: pandas is not installed.
+            ValueError: Unknown precision or aggregate, or a percentile or precision not a multiple of source_precision
+                with source_precision.
+            :class:`.SelfHostBadRequestException`: Sent request had insufficient data or invalid options.
+            :class:`.SelfHostUnauthorizedException`: Request was refused due to lacking authentication credentials.
+            :class:`.SelfHostForbiddenException`: Server understands the request but refuses to authorize it.
+            :class:`.SelfHostNotFoundException`: The requested resource was not found.
+            :class:`.SelfHostTooManyRequestsException`: Sent too many requests in a given amount of time.
+            :class:`.SelfHostInternalServerException`: Server encountered an unexpected condition that prevented it
+                from fulfilling the request.
+        """
+        require_pandas()
+        if source_precision is None:
+            # Checked before the request, so that a typo does not cost a fetch.
+            validate_aggregation(precision, aggregates)
+            timeseries_data: List[TimeseriesDataResponse] = self._query_multiple_timeseries_data(
+                uuids, start, end, unit, ge, le
+            )
+            return aggregate_timeseries_dataframe(
+                timeseries_data_to_dataframe(timeseries_data, "long"), precision, aggregates, timezone
+            )
+
+        # Averages of source buckets holding different numbers of data points can not be averaged, so the sum
+        # and count of every source bucket are fetched instead and combined into averages weighted by the count.
+        frames: Dict[str, Any] = {
+            source: timeseries_data_to_dataframe(
+                self._query_multiple_timeseries_data(
+                    uuids, start, end, unit, ge, le, source_precision, source, timezone
+                ),
+                "long",
+            )
+            for source in source_aggregates(precision, aggregates, source_precision)
+        }
+        return combine_bucket_aggregates(frames, precision, aggregates, timezone)
+
+    @traced
+    @beartype
+    def get_timeseries_data_arrow(
+        self,
+        timeseries_uuid: str,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        unit: Optional[str] = None,
+        ge: Optional[int] = None,
+        le: Optional[int] = None,
+        precision: Optional[str] = None,
+        aggregate: Optional[str] = None,
+        timezone: Optional[str] = None,
+    ) -> Any:
+        """Fetch a range of timeseries data from NODA Self-host API as an Arrow table
+
+        Builds the table straight from the API response, see :func:`selfhost_client.arrow.timeseries_schema`
+        for its layout. Requires the optional pyarrow dependency.
+
+        Args:
+            timeseries_uuid (str): UUID of timeseries to query.
+            start (datetime): Start (>=) of time period. The period (start to end) can not exceed 1 year.
+                Must be in RFC 3339 compliant format, section 5.6.
+            end (datetime): End (<=) of time period. The period (start to end) can not exceed 1 year.
+                Must be in RFC 3339 compliant format, section 5.6.
+            unit (Optional[str]): The SI unit of the result. A cast will occur if the base unit differs.
+            ge (Optional[int]): Value should be greater or equal to (>=) this.
+            le (Optional[int]): Value should be less or equal to (<=) this.
+            precision (Optional[str]): Truncate all timestamps and perform aggregate operations on the grouping.
+                See :meth:`get_timeseries_data` for available values.
+            aggregate (Optional[str]): When using precision. Select this aggregate function instead of the default avg
+                when computing the result. Does nothing when precision is not set.
+            timezone (Optional[str]): Act as this time zone. Defaults to UTC.
+
+        Returns:
+            pyarrow.Table
+
+        Raises:
+            ImportError: pyarrow is not installed.
+            :class:`.SelfHostBadRequestException`: Sent request had insufficient data or invalid options.
+            :class:`.SelfHostUnauthorizedException`: Request was refused due to lacking authentication credentials.
+            :class:`.SelfHostForbiddenException`: Server understands the request but refuses to authorize it.
+            :class:`.SelfHostNotFoundException`: The requested resource was not found.
+            :class:`.SelfHostTooManyRequestsException`: Sent too many requests in a given amount of time.
+            :class:`.SelfHostInternalServerException`: Server encountered an unexpected condition that prevented it
+                from fulfilling the request.
+        """
+        require_pyarrow()
+        timeseries_data_points: List[TimeseriesDataPointResponse] = self._query_timeseries_data(
+            timeseries_uuid, start, end, unit, ge, le, precision, aggregate, timezone
+        )
+        return timeseries_data_to_arrow([{"uuid": timeseries_uuid, "data": timeseries_data_points}])
+
+    @traced
+    @beartype
+    def get_multiple_timeseries_data_arrow(
+        self,
+        uuids: List[str],
+        start: datetime.datetime,
+        end: datetime.datetime,
+        unit: Optional[str] = None,
+        ge: Optional[int] = None,
+        le: Optional[int] = None,
+        precision: Optional[str] = None,
+        aggregate: Optional[str] = None,
+        timezone: Optional[str] = None,
+    ) -> Any:
+        """Fetch multiple ranges of timeseries data from NODA Self-host API as an Arrow table
+
+        Builds the table straight from the API response, see :func:`selfhost_client.arrow.timeseries_schema`
+        for its layout. Requires the optional pyarrow dependency.
+
+        Args:
+            uuids (List[str]): A series of timeseries UUIDs to search for.
+            start (datetime): Start (>=) of time period. The period (start to end) can not exceed 1 year.
+                Must be in RFC 3339 compliant format, section 5.6.
+            end (datetime): End (<=) of time period. The period (start to end) can not exceed 1 year.
+                Must be in RFC 3339 compliant format, section 5.6.
+            unit (optional[str]): The SI unit of the result. A cast will occur if the base unit differs.
+            ge (optional[int]): Value should be greater or equal to (>=) this.
+            le (optional[int]): Value should be less or equal to (<=) this.
+            precision (optional[str]): Truncate all timestamps and perform aggregate operations on the grouping.
+                See :meth:`get_multiple_timeseries_data` for available values.
+            aggregate (optional[str]): When using precision. Select this aggregate function instead of the default avg
+                when computing the result. Does nothing when precision is not set.
+            timezone (optional[str]): Act as this time zone. Defaults to UTC.
+
+        Returns:
+            pyarrow.Table
+
+        Raises:
+            ImportError: pyarrow is not installed.
+            :class:`.SelfHostBadRequestException`: Sent request had insufficient data or invalid options.
+            :class:`.SelfHostUnauthorizedException`: Request was refused due to lacking authentication credentials.
+            :class:`.SelfHostForbiddenException`: Server understands the request but refuses to authorize it.
+            :class:`.SelfHostNotFoundException`: The requested resource was not found.
+            :class:`.SelfHostTooManyRequestsException`: Sent too many requests in a given amount of time.
+            :class:`.SelfHostInternalServerException`: Server encountered an unexpected condition that prevented it
+                from fulfilling the request.
+        """
+        require_pyarrow()
+        timeseries_data: List[TimeseriesDataResponse] = self._query_multiple_timeseries_data(
+            uuids, start, end, unit, ge, le, precision, aggregate, timezone
+        )
+        return timeseries_data_to_arrow(timeseries_data)
+
+    @traced
+    @beartype
+    def create_timeseries_data_from_arrow(
+        self,
+        source: Any,
+        timeseries_uuid: Optional[str] = None,
+        unit: Optional[str] = None,
+        batch_size: int = 10000,
+        bounds: Optional[str] = None,
+    ) -> int:
+        """Add data points from a Parquet file or an Arrow table to timeseries in NODA Self-host API
+
+        The source is read and uploaded in batches, only one batch is held in memory at a time
+        when reading from a Parquet file. Requires the optional pyarrow dependency.
+
+        Args:
+            source (Any): Path to a Parquet file, a pyarrow.Table or a pyarrow.RecordBatch
+                with the columns ts and v, and uuid unless timeseries_uuid is given.
+                Tables written from :meth:`get_multiple_timeseries_data_arrow` can be used as is.
+            timeseries_uuid (Optional[str]): UUID of the timeseries that all rows belong to.
+                Overrides the uuid column of the source.
+            unit (Optional[str]): The SI unit of the data. A cast will occur if the base unit differs.
+            batch_size (int): The maximum number of data points to send in a single request.
+            bounds (Optional[str]): Validates the data points against the lower and upper bound of the timeseries
+                before they are sent. The bounds are fetched once per timeseries and cached, and converted with
+                :data:`.unit_registry` when unit differs from the SI unit of the timeseries. Data points are not
+                validated when the units can not be converted.
+
+                -   filter: Leave out data points out of bounds.
+
+                -   clip: Replace the values out of bounds with the nearest bound, and leave out NaN and None.
+
+                -   raise: Raise :class:`.SelfHostOutOfBoundsException` without sending the batch.
+
+        Returns:
+            int: The number of data points added.
+
+        Raises:
+            ImportError: pyarrow is not installed.
+            ValueError: Unknown bounds.
+            :class:`.SelfHostOutOfBoundsException`: A data point is out of bounds and bounds is raise.
+            :class:`.SelfHostBadRequestException`: Sent request had insufficient data or invalid options.
+            :class:`.SelfHostUnauthorizedException`: Request was refused due to lacking authentication credentials.
+            :class:`.SelfHostForbiddenException`: Server understands the request but refuses to authorize it.
+            :class:`.SelfHostNotFoundException`: The requested resource was not found.
+            :class:`.SelfHostTooManyRequestsException`: Sent too many requests in a given amount of time.
+            :class:`.SelfHostInternalServerException`: Server encountered an unexpected condition that prevented it
+                from fulfilling the request.
+        """
+        added: int = 0
+        for uuid, data_points in read_timeseries_batches(source, timeseries_uuid, batch_size):
+            if bounds is not None:
+                data_points = self._validate_bounds(uuid, data_points, unit, bounds)
+                if not data_points:
+                    continue
+            self._post_timeseries_data(uuid, data_points, unit)
+            added += len(data_points)
+        return added
+
+    @traced
+    @beartype
+    def create_timeseries_many(
+        self,
+        timeseries: List[Dict[str, Any]],
+        max_workers: int = 8
+    ) -> List[BatchResultType]:
+        """Adds many timeseries to the NODA Self-host API concurrently
+
+        Calls :meth:`create_timeseries` for every item, at most max_workers at a time.
+        A failing call does not stop the others.
+
+        Args:
+            timeseries (List[Dict[str, Any]]): The keyword arguments of :meth:`create_timeseries` for every item.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            List[:class:`.BatchResultType`]: The created timeseries or the raised exception of every item,
+            in the order of timeseries.
+        """
+        return self._run_many(self.create_timeseries, timeseries, max_workers)
+
+    @traced
+    @beartype
+    def update_timeseries_many(
+        self,
+        timeseries: List[Dict[str, Any]],
+        max_workers: int = 8
+    ) -> List[BatchResultType]:
+        """Updates many timeseries in the NODA Self-host API concurrently
+
+        Calls :meth:`update_timeseries` for every item, at most max_workers at a time.
+        A failing call does not stop the others.
+
+        Args:
+            timeseries (List[Dict[str, Any]]): The keyword arguments of :meth:`update_timeseries` for every item,
+                including timeseries_uuid.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            List[:class:`.BatchResultType`]: The outcome of every item, in the order of timeseries.
+        """
+        return self._run_many(self.update_timeseries, timeseries, max_workers)
+
+    @traced
+    @beartype
+    def delete_timeseries_many(
+        self,
+        timeseries_uuids: List[str],
+        max_workers: int = 8
+    ) -> List[BatchResultType]:
+        """Deletes many timeseries from the NODA Self-host API concurrently
+
+        Calls :meth:`delete_timeseries` for every UUID, at most max_workers at a time.
+        A failing call does not stop the others.
+
+        Args:
+            timeseries_uuids (List[str]): UUIDs of the timeseries to delete.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            List[:class:`.BatchResultType`]: The outcome of every UUID, in the order of timeseries_uuids.
+        """
+        return self._run_many(self.delete_timeseries, timeseries_uuids, max_workers)
+
+    def _query_timeseries_data(
+        self,
+        timeseries_uuid: str,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        unit: Optional[str] = None,
+        ge: Optional[int] = None,
+        le: Optional[int] = None,
+        precision: Optional[str] = None,
+        aggregate: Optional[str] = None,
+        timezone: Optional[str] = None,
+    ) -> List[TimeseriesDataPointResponse]:
+        response: Response = self._session.get(
+            url=f"{self._base_url}/{self._api_version}/{self._timeseries_api_path}/{timeseries_uuid}/data",
+            params=filter_none_values_from_dict(
+                {
+                    "start": start.isoformat(),
+                    "end": end.isoformat(),
+                    "unit": unit,
+                    "ge": ge,
+                    "le": le,
+                    "precision": precision,
+                    "aggregate": aggregate,
+                    "timezone": timezone,
+                }
+            ),
+        )
+        return self._process_response(response) or []
+
+    def _validate_bounds(
+        self,
+        timeseries_uuid: str,
+        data_points: List[TimeseriesDataPointResponse],
+        unit: Optional[str],
+        bounds: str,
+    ) -> List[TimeseriesDataPointResponse]:
+        if bounds not in BOUNDS_MODES:
+            raise ValueError(f"bounds must be one of {', '.join(BOUNDS_MODES)}, got {bounds}")
+        if timeseries_uuid not in self._timeseries_bounds:
+            timeseries: TimeseriesType = self.get_timeseries_by_uuid(timeseries_uuid)
+            self._timeseries_bounds[timeseries_uuid] = (
+                timeseries.get("lower_bound"),
+                timeseries.get("upper_bound"),
+                timeseries.get("si_unit"),
+            )
+        lower_bound, upper_bound, si_unit = self._timeseries_bounds[timeseries_uuid]
+        if unit is not None and unit != si_unit:
+            if si_unit is None:
+                return data_points
+            try:
+                lower_bound, upper_bound = (
+                    None if bound is None else unit_registry.convert(bound, si_unit, unit)
+                    for bound in (lower_bound, upper_bound)
+                )
+            except ValueError:
+                return data_points
+
+        valid_data_points, out_of_bounds = apply_bounds(data_points, lower_bound, upper_bound, bounds)
+        if out_of_bounds:
+            logger.warning(
+                "%d of %d data points of timeseries %s are out of the bounds [%s, %s] (%s)",
+                out_of_bounds, len(data_points), timeseries_uuid, lower_bound, upper_bound, bounds
+            )
+        return valid_data_points
+
+    def _post_timeseries_data(
+        self,
+        timeseries_uuid: str,
+        data_points: List[TimeseriesDataPointResponse],
+        unit: Optional[str] = None,
+    ) -> None:
+        response: Response = self._session.post(
+            url=f"{self._base_url}/{self._api_version}/{self._timeseries_api_path}/{timeseries_uuid}/data",
+            params=filter_none_values_from_dict({"unit": unit}),
+            json=data_points,
+        )
+        return self._process_response(response)
+
+    def _query_multiple_timeseries_data(
+        self,
+        uuids: List[str],
+        start: datetime.datetime,
+        end: datetime.datetime,
+        unit: Optional[str] = None,
+        ge: Optional[int] = None,
+        le: Optional[int] = None,
+        precision: Optional[str] = None,
+        aggregate: Optional[str] = None,
+        timezone: Optional[str] = None,
+    ) -> List[TimeseriesDataResponse]:
         response: Response = self._session.get(
             url=f"{self._base_url}/{self._api_version}/tsquery",
             params=filter_none_values_from_dict(
@@ -435,17 +1018,4 @@ class TimeseriesClient(BaseClient):
                 }
             ),
         )
-        timeseries_data: List[TimeseriesDataResponse] = self._process_response(response)
-        return [
-            {
-                "uuid": data.get("uuid"),
-                "data": [
-                    {
-                        "v": data_point.get("v"),
-                        "ts": pyrfc3339.parse(data_point.get("ts")),
-                    }
-                    for data_point in data.get("data")
-                ],
-            }
-            for data in timeseries_data
-        ]
+        return self._process_response(response) or []
@@ -0,0 +1,145 @@
+import datetime
+import functools
+from typing import Any, Callable, List, Tuple
+
+from .dataframes import np
+
+try:
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+except ImportError:  # Python < 3.9, dateutil is installed along with pandas
+    from dateutil.tz import gettz
+
+    ZoneInfo = None
+    ZoneInfoNotFoundError = KeyError
+
+_MICROSECONDS = 10 ** 6
+# Offsets are sampled weekly, so zones may not change offset twice within a week, which none of them do.
+_SAMPLE_INTERVAL = 7 * 86400
+_MIN = -2 ** 63
+_MAX = 2 ** 63 - 1
+
+
+@functools.lru_cache(maxsize=None)
+def _zone(timezone: str) -> datetime.tzinfo:
+    try:
+        zone = ZoneInfo(timezone) if ZoneInfo is not None else gettz(timezone)
+    except (ZoneInfoNotFoundError, ValueError):
+        zone = None
+    if zone is None:
+        raise ValueError(f'Unknown time zone: {timezone}')
+    return zone
+
+
+def _offset(zone: datetime.tzinfo, seconds: int) -> int:
+    return int(datetime.datetime.fromtimestamp(seconds, zone).utcoffset().total_seconds())
+
+
+@functools.lru_cache(maxsize=4096)
+def _year_transitions(timezone: str, year: int) -> Tuple[int, List[Tuple[int, int]]]:
+    """Returns the UTC offset at the start of a year and the (instant, offset) transitions during it, in seconds"""
+    zone: datetime.tzinfo = _zone(timezone)
+    start: int = int(datetime.datetime(year, 1, 1, tzinfo=datetime.timezone.utc).timestamp())
+    end: int = int(datetime.datetime(year + 1, 1, 1, tzinfo=datetime.timezone.utc).timestamp())
+    initial: int = _offset(zone, start)
+    transitions: List[Tuple[int, int]] = []
+    previous, previous_offset = start, initial
+    for sample in list(range(start + _SAMPLE_INTERVAL, end, _SAMPLE_INTERVAL)) + [end]:
+        offset: int = _offset(zone, sample)
+        if offset != previous_offset:
+            low, high = previous, sample
+            while high - low > 1:
+                middle: int = (low + high) // 2
+                if _offset(zone, middle) == previous_offset:
+                    low = middle
+                else:
+                    high = middle
+            transitions.append((high, offset))
+        previous, previous_offset = sample, offset
+    return initial, transitions
+
+
+def _table(timezone: str, values: Any) -> Tuple[Any, Any]:
+    """Returns the UTC instants in microseconds from which each offset applies and the offsets, for the years of
+    the given microseconds. The first offset applies since the beginning of time."""
+    if len(values) == 0:
+        return np.array([_MIN], dtype=np.int64), np.array([0], dtype=np.int64)
+    # A year on either side covers wall clock values whose UTC instant is in another year.
+    first, last = (np.array([values.min(), values.max()]).astype('datetime64[us]').astype('datetime64[Y]')
+                   .astype(np.int64) + 1970)
+    first_year: int = max(int(first) - 1, datetime.MINYEAR)
+    last_year: int = min(int(last) + 1, datetime.MAXYEAR - 1)
+    initial, _ = _year_transitions(timezone, first_year)
+    starts: List[int] = [_MIN]
+    offsets: List[int] = [initial * _MICROSECONDS]
+    for year in range(first_year, last_year + 1):
+        for instant, offset in _year_transitions(timezone, year)[1]:
+            starts.append(instant * _MICROSECONDS)
+            offsets.append(offset * _MICROSECONDS)
+    return np.array(starts, dtype=np.int64), np.array(offsets, dtype=np.int64)
+
+
+def _convert(values: Any, timezone: str, convert: Callable[[Any, Any, Any], Any]) -> Any:
+    microseconds = np.asarray(values, dtype='datetime64[us]').view(np.int64)
+    missing = microseconds == _MIN
+    if missing.any():
+        result = np.full(len(microseconds), _MIN, dtype=np.int64)
+        present = microseconds[~missing]
+        result[~missing] = convert(present, *_table(timezone, present))
+    else:
+        result = convert(microseconds, *_table(timezone, microseconds))
+    return result.view('datetime64[us]')
+
+
+def _to_wall_clock(instants: Any, starts: Any, offsets: Any) -> Any:
+    if len(offsets) == 1:
+        return instants + offsets[0]
+    return instants + offsets[np.searchsorted(starts, instants, side='right') - 1]
+
+
+def _to_utc(wall_clock: Any, starts: Any, offsets: Any) -> Any:
+    # Every offset applies to a range of wall clock times. The ranges increase, but overlap when the clocks are
+    # turned back and leave gaps when they are turned forward.
+    if len(offsets) == 1:
+        return wall_clock - offsets[0]
+    wall_starts = np.concatenate(([_MIN], starts[1:] + offsets[1:]))
+    wall_ends = np.concatenate((starts[1:] + offsets[:-1], [_MAX]))
+    index = np.searchsorted(wall_ends, wall_clock, side='right')
+    return np.where(wall_clock >= wall_starts[index], wall_clock - offsets[index], starts[index])
+
+
+def utc_to_wall_clock(values: Any, timezone: str) -> Any:
+    """Converts UTC instants to the wall clock of a time zone
+
+    The UTC offsets of the time zone are looked up in a table of its transitions, which is computed once per year
+    and time zone, so converting is a single vectorized search.
+
+    Args:
+        values (numpy.ndarray): UTC instants as datetime64[us].
+        timezone (str): IANA time zone.
+
+    Returns:
+        numpy.ndarray: The wall clock times as datetime64[us].
+
+    Raises:
+        ValueError: Unknown time zone.
+    """
+    return _convert(values, timezone, _to_wall_clock)
+
+
+def wall_clock_to_utc(values: Any, timezone: str) -> Any:
+    """Converts wall clock times of a time zone to UTC instants
+
+    Wall clock times that occur twice, when the clocks are turned back, resolve to their first occurrence. Wall
+    clock times that are skipped, when the clocks are turned forward, resolve to the instant of the transition.
+
+    Args:
+        values (numpy.ndarray): Wall clock times as datetime64[us].
+        timezone (str): IANA time zone.
+
+    Returns:
+        numpy.ndarray: The UTC instants as datetime64[us].
+
+    Raises:
+        ValueError: Unknown time zone.
+    """
+    return _convert(values, timezone, _to_utc)
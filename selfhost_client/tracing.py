@@ -0,0 +1,115 @@
+import contextlib
+import functools
+from typing import Any, Callable, ContextManager, Dict, MutableMapping, Optional, TypeVar
+from warnings import filterwarnings
+
+from beartype import beartype
+from beartype.roar import BeartypeDecorHintPep585DeprecationWarning
+
+try:
+    from opentelemetry import propagate as otel_propagate
+    from opentelemetry import trace as otel_trace
+except ImportError:
+    otel_propagate = None
+    otel_trace = None
+
+filterwarnings("ignore", category=BeartypeDecorHintPep585DeprecationWarning)
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+def require_opentelemetry() -> None:
+    """Makes sure that the optional OpenTelemetry API dependency is installed
+
+    Raises:
+        ImportError: opentelemetry-api is not installed.
+    """
+    if otel_trace is None:
+        raise ImportError(
+            'opentelemetry-api is required for OpenTelemetry tracing, '
+            'install it with: pip install selfhost_client[opentelemetry]'
+        )
+
+
+class _NoOpSpan:
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+class Tracer:
+    """
+    Creates the spans of the calls made by clients of NODA Self-host API
+
+    The base class does nothing. Subclass it to report spans to a tracing backend, or use
+    :class:`OpenTelemetryTracer`. A tracer is enabled on a client with :meth:`.BaseClient.set_tracer`.
+
+    Every public client method, e.g. :meth:`.TimeseriesClient.get_timeseries_data`, gets a span named after it.
+    Within it, every HTTP request gets a child span covering the network time and every response body gets a
+    child span covering the decode time.
+    """
+
+    def span(self, name: str, attributes: Dict[str, Any]) -> ContextManager[Any]:
+        """Starts a span and makes it the current span while the context manager is entered
+
+        Args:
+            name (str): The name of the span.
+            attributes (Dict[str, Any]): Attributes to set on the span.
+
+        Returns:
+            ContextManager: Yields the span, which must provide set_attribute(key, value).
+                Exceptions raised inside the context manager should be recorded on the span.
+        """
+        return contextlib.nullcontext(_NoOpSpan())
+
+    def inject(self, headers: MutableMapping[str, str]) -> None:
+        """Adds the headers propagating the current trace context to an outgoing request
+
+        Args:
+            headers (MutableMapping[str, str]): The headers of the request.
+        """
+
+
+class OpenTelemetryTracer(Tracer):
+    """
+    A tracer reporting spans through the OpenTelemetry API
+
+    Trace context is propagated with the globally configured OpenTelemetry propagators, W3C traceparent by default.
+    """
+
+    @beartype
+    def __init__(self, tracer: Optional[Any] = None) -> None:
+        """OpenTelemetryTracer constructor
+
+        Args:
+            tracer (Optional[opentelemetry.trace.Tracer]): The tracer to create spans with.
+                Defaults to the tracer of the globally configured tracer provider.
+
+        Raises:
+            ImportError: opentelemetry-api is not installed.
+        """
+        require_opentelemetry()
+        self._tracer = tracer or otel_trace.get_tracer('selfhost_client')
+
+    def span(self, name: str, attributes: Dict[str, Any]) -> ContextManager[Any]:
+        return self._tracer.start_as_current_span(name, attributes=attributes)
+
+    def inject(self, headers: MutableMapping[str, str]) -> None:
+        otel_propagate.inject(headers)
+
+
+def traced(function: F) -> F:
+    """Decorates a public client method to run in a span named after it
+
+    Only an attribute lookup is added to the call while the client has no tracer.
+    """
+    namespace, _, name = function.__qualname__.rpartition('.')
+
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        tracer: Optional[Tracer] = self._session.tracer
+        if tracer is None:
+            return function(self, *args, **kwargs)
+        with tracer.span(function.__qualname__, {'code.namespace': namespace, 'code.function': name}):
+            return function(self, *args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,215 @@
+import copy
+import datetime
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Hashable, List, Optional, Tuple
+from warnings import filterwarnings
+
+from beartype import beartype
+from beartype.roar import BeartypeDecorHintPep585DeprecationWarning
+
+from .timeseries_client import TimeseriesClient
+from .types.timeseries_types import TimeseriesDataType
+
+filterwarnings("ignore", category=BeartypeDecorHintPep585DeprecationWarning)
+
+
+class _Batch:
+    def __init__(self, query: Dict) -> None:
+        self.query = query
+        self.futures: Dict[Optional[str], List[Future]] = {}
+
+
+class TsQueryPlanner:
+    """
+    Coalesces tsquery requests that only differ in their aggregate
+
+    Requests for the same timeseries, period and options that are submitted within window seconds of each other
+    are collected into one batch. The batch sends one request per distinct aggregate concurrently and hands a copy
+    of the result to every caller that asked for it, identical requests are only sent once. Every request waits for
+    the window before it is sent. The window is 0 by default, which sends every request right away without
+    coalescing it with others.
+
+    Example::
+
+        with TsQueryPlanner(client, window=0.01) as planner:
+            result = planner.query_aggregates(uuids, start, end, precision='hour', aggregates=['avg', 'min', 'max'])
+            result['max']
+    """
+
+    @beartype
+    def __init__(self, client: TimeseriesClient, window: float = 0, max_workers: int = 8) -> None:
+        """TsQueryPlanner constructor
+
+        Args:
+            client (:class:`.TimeseriesClient`): The client used to send the requests.
+            window (float): Seconds to wait for sibling requests after the first request of a batch. Adds as much
+                latency to every request.
+            max_workers (int): The maximum number of requests sent concurrently.
+        """
+        self._client = client
+        self._window = window
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='tsquery-planner')
+        self._lock = threading.Lock()
+        self._batches: Dict[Hashable, _Batch] = {}
+        self._closed: bool = False
+
+    def __enter__(self) -> 'TsQueryPlanner':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Sends the pending batches and waits for all requests to finish"""
+        with self._lock:
+            self._closed = True
+            keys: List[Hashable] = list(self._batches)
+        for key in keys:
+            self._dispatch(key)
+        self._executor.shutdown(wait=True)
+
+    @beartype
+    def submit(
+            self,
+            uuids: List[str],
+            start: datetime.datetime,
+            end: datetime.datetime,
+            unit: Optional[str] = None,
+            ge: Optional[int] = None,
+            le: Optional[int] = None,
+            precision: Optional[str] = None,
+            aggregate: Optional[str] = None,
+            timezone: Optional[str] = None
+    ) -> Future:
+        """Schedules a request for multiple ranges of timeseries data
+
+        Takes the same arguments as :meth:`.TimeseriesClient.get_multiple_timeseries_data`.
+
+        Returns:
+            Future[List[:class:`.TimeseriesDataType`]]: Resolves to the timeseries data, or the exception
+            raised by the request.
+
+        Raises:
+            RuntimeError: The planner is closed.
+        """
+        # The aggregate only has an effect together with precision, where it defaults to avg.
+        if precision is None:
+            aggregate = None
+        elif aggregate is None:
+            aggregate = 'avg'
+
+        query: Dict = {
+            'uuids': uuids,
+            'start': start,
+            'end': end,
+            'unit': unit,
+            'ge': ge,
+            'le': le,
+            'precision': precision,
+            'timezone': timezone,
+        }
+        key: Tuple = (tuple(uuids), start, end, unit, ge, le, precision, timezone)
+        future: Future = Future()
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError('Can not submit requests to a closed TsQueryPlanner')
+            batch: Optional[_Batch] = self._batches.get(key)
+            if batch is None:
+                batch = self._batches[key] = _Batch(query)
+                if self._window > 0:
+                    timer = threading.Timer(self._window, self._dispatch, args=(key,))
+                    timer.daemon = True
+                    timer.start()
+            batch.futures.setdefault(aggregate, []).append(future)
+        if self._window <= 0:
+            self._dispatch(key)
+        return future
+
+    @beartype
+    def get_multiple_timeseries_data(
+            self,
+            uuids: List[str],
+            start: datetime.datetime,
+            end: datetime.datetime,
+            unit: Optional[str] = None,
+            ge: Optional[int] = None,
+            le: Optional[int] = None,
+            precision: Optional[str] = None,
+            aggregate: Optional[str] = None,
+            timezone: Optional[str] = None
+    ) -> List[TimeseriesDataType]:
+        """Fetch multiple ranges of timeseries data, coalesced with concurrent sibling requests
+
+        Takes the same arguments and raises the same exceptions as
+        :meth:`.TimeseriesClient.get_multiple_timeseries_data`.
+
+        Returns:
+            List[:class:`.TimeseriesDataType`]
+        """
+        return self.submit(uuids, start, end, unit, ge, le, precision, aggregate, timezone).result()
+
+    @beartype
+    def query_aggregates(
+            self,
+            uuids: List[str],
+            start: datetime.datetime,
+            end: datetime.datetime,
+            precision: str,
+            aggregates: List[str],
+            unit: Optional[str] = None,
+            ge: Optional[int] = None,
+            le: Optional[int] = None,
+            timezone: Optional[str] = None
+    ) -> Dict[str, List[TimeseriesDataType]]:
+        """Fetch several aggregates of multiple ranges of timeseries data as one batch
+
+        Args:
+            uuids (List[str]): A series of timeseries UUIDs to search for.
+            start (datetime): Start (>=) of time period. The period (start to end) can not exceed 1 year.
+            end (datetime): End (<=) of time period. The period (start to end) can not exceed 1 year.
+            precision (str): Truncate all timestamps and perform the aggregate operations on the grouping.
+            aggregates (List[str]): The aggregate functions to fetch: avg, min, max, sum or count.
+            unit (Optional[str]): The SI unit of the result. A cast will occur if the base unit differs.
+            ge (Optional[int]): Value should be greater or equal to (>=) this.
+            le (Optional[int]): Value should be less or equal to (<=) this.
+            timezone (Optional[str]): Act as this time zone. Defaults to UTC.
+
+        Returns:
+            Dict[str, List[:class:`.TimeseriesDataType`]]: The timeseries data keyed by aggregate.
+
+        Raises:
+            The first exception raised by any of the requests, see
+            :meth:`.TimeseriesClient.get_multiple_timeseries_data`.
+        """
+        futures: Dict[str, Future] = {
+            aggregate: self.submit(uuids, start, end, unit, ge, le, precision, aggregate, timezone)
+            for aggregate in dict.fromkeys(aggregates)
+        }
+        return {aggregate: future.result() for aggregate, future in futures.items()}
+
+    def _dispatch(self, key: Hashable) -> None:
+        with self._lock:
+            batch: Optional[_Batch] = self._batches.pop(key, None)
+        if batch is None:
+            return
+        for aggregate, futures in batch.futures.items():
+            try:
+                self._executor.submit(self._run, batch.query, aggregate, futures)
+            except Exception as e:
+                # Raised in a timer thread, where nobody would see it, so the callers get it instead.
+                for future in futures:
+                    future.set_exception(e)
+
+    def _run(self, query: Dict, aggregate: Optional[str], futures: List[Future]) -> None:
+        try:
+            result: List[TimeseriesDataType] = self._client.get_multiple_timeseries_data(aggregate=aggregate, **query)
+        except Exception as e:
+            for future in futures:
+                future.set_exception(e)
+        else:
+            # Every caller gets its own copy, so that none of them sees the changes another makes to it.
+            futures[0].set_result(result)
+            for future in futures[1:]:
+                future.set_result(copy.deepcopy(result))
@@ -1,5 +1,5 @@
 import datetime
-from typing import List
+from typing import Any, Dict, List, Optional, Union
 
 try:
     from typing import TypedDict
@@ -70,7 +70,8 @@ class AlertType(TypedDict):
         tags: List of tags pinned to the alert.
         created: Date-time when created, as defined by RFC 3339, section 5.6.
         timeout: TODO
-        rawdata: Base64 encoded
+        rawdata: Base64 encoded, a :class:`.LazyRawData` or None depending on the rawdata_mode of
+            :meth:`.AlertsClient.get_alerts`
         duplicate: TODO
         previous_severity:
 
@@ -137,7 +138,8 @@ class AlertType(TypedDict):
     tags: List[str]
     created: datetime.datetime
     timeout: int
-    rawdata: str
+    # Any stands in for LazyRawData, which alerts_client defines and cannot be imported here without a cycle.
+    rawdata: Union[str, Any, None]
     duplicate: int
     previous_severity: str
     last_receive_time: datetime.datetime
@@ -262,3 +264,56 @@ class AlertResponse(TypedDict):
     duplicate: int
     previous_severity: str
     last_receive_time: str
+
+
+class FlushedAlertType(TypedDict):
+    """
+    Attributes:
+        alert: The keyword arguments of :meth:`.AlertsClient.create_alert` the alert was created with, those of the
+            last occurrence.
+        count: The number of occurrences coalesced into the alert. It is not sent to the API.
+        result: The created alert, None if creating it raised an exception.
+        exception: The exception raised while creating the alert, None on success.
+
+    Example::
+
+        {
+            'alert': {
+                'resource': 'pump-12',
+                'environment': 'production',
+                'event': 'pressure-high',
+                ...
+            },
+            'count': 1742,
+            'result': {
+                'uuid': '5d8c23d7-3a78-4159-aa40-e3ef3d9bfe55'
+            },
+            'exception': None
+        }
+
+    """
+    alert: Dict[str, Any]
+    count: int
+    result: Optional[CreatedAlertResponse]
+    exception: Optional[Exception]
+
+
+class AlertChangesType(TypedDict):
+    """
+    Attributes:
+        added: UUIDs of the alerts that were added.
+        updated: UUIDs of the alerts of which any field changed.
+        removed: UUIDs of the alerts that no longer exist.
+
+    Example::
+
+        {
+            'added': ['5d8c23d7-3a78-4159-aa40-e3ef3d9bfe55'],
+            'updated': [],
+            'removed': ['a9214980-2c89-42e4-a08d-71689af86b67'],
+        }
+
+    """
+    added: List[str]
+    updated: List[str]
+    removed: List[str]
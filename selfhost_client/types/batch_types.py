@@ -0,0 +1,28 @@
+from typing import Any, Optional
+
+try:
+    from typing import TypedDict
+except ImportError:
+    from typing_extensions import TypedDict
+
+
+class BatchResultType(TypedDict):
+    """
+    Attributes:
+        result: The value returned by the call, None if it raised an exception.
+        exception: The exception raised by the call, None on success.
+
+    Example::
+
+        {
+            'result': {
+                'uuid': '5ce5d3cd-ff99-4342-a19e-fdb1b5805178',
+                'name': 'Thing 1',
+                ...
+            },
+            'exception': None
+        }
+
+    """
+    result: Any
+    exception: Optional[Exception]
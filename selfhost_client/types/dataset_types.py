@@ -1,5 +1,5 @@
 import datetime
-from typing import List
+from typing import Dict, List
 
 try:
     from typing import TypedDict
@@ -101,3 +101,29 @@ class DatasetResponse(TypedDict):
     updated: str
     updated_by: str
     tags: List[str]
+
+
+class DatasetSyncResultType(TypedDict):
+    """
+    Attributes:
+        downloaded: UUIDs of the datasets that were downloaded.
+        unchanged: UUIDs of the datasets whose local copy already matched.
+        removed: UUIDs of the datasets whose local copy was removed since they no longer exist.
+        failed: The exceptions raised while downloading datasets, keyed by dataset UUID.
+
+    Example::
+
+        {
+            'downloaded': ['5e029cdf-4fee-42d2-9196-afbdfbdb9d8f'],
+            'unchanged': ['f36834fb-8d96-4c01-b0e4-0bd85906bc25'],
+            'removed': [],
+            'failed': {
+                'A36834fb-8d96-4c01-b0e4-0bd85906bc25': SelfHostChecksumMismatchException()
+            },
+        }
+
+    """
+    downloaded: List[str]
+    unchanged: List[str]
+    removed: List[str]
+    failed: Dict[str, Exception]
@@ -0,0 +1,58 @@
+from typing import Optional
+
+try:
+    from typing import TypedDict
+except ImportError:
+    from typing_extensions import TypedDict
+
+
+class RequestMetricsType(TypedDict):
+    """
+    Attributes:
+        method: HTTP method of the request.
+        url: The requested url, including query parameters.
+        endpoint: Template of the requested endpoint relative to the API version, with UUIDs replaced by {uuid}.
+        status_code: HTTP status code of the response, None when no response was received.
+        bytes_sent: Size of the request body in bytes, None when the body is streamed.
+        bytes_received: Size of the response body in bytes, None when no response was received.
+        connect: Seconds spent resolving the host name and opening a new connection,
+            None when an open connection was reused.
+        tls: Seconds spent on the TLS handshake of a new connection, None when no handshake was made.
+        ttfb: Seconds from sending the request until the response headers were parsed.
+        decode: Seconds spent decoding the response body.
+        total: Seconds from sending the request until the response body was decoded.
+        retries: The number of retries made by the transport.
+        exception: Class name of the exception raised for the request, None on success.
+
+    Example::
+
+        {
+            'method': 'GET',
+            'url': 'https://example.com/v2/timeseries/a21ae595-15a5-4f11-8992-9d33600cc1ee/data?start=...',
+            'endpoint': 'timeseries/{uuid}/data',
+            'status_code': 200,
+            'bytes_sent': 0,
+            'bytes_received': 35012,
+            'connect': 0.0121,
+            'tls': 0.0254,
+            'ttfb': 0.0832,
+            'decode': 0.0041,
+            'total': 0.0889,
+            'retries': 0,
+            'exception': None
+        }
+
+    """
+    method: str
+    url: str
+    endpoint: str
+    status_code: Optional[int]
+    bytes_sent: Optional[int]
+    bytes_received: Optional[int]
+    connect: Optional[float]
+    tls: Optional[float]
+    ttfb: Optional[float]
+    decode: Optional[float]
+    total: float
+    retries: int
+    exception: Optional[str]
@@ -1,5 +1,5 @@
 import datetime
-from typing import List
+from typing import Dict, List, Optional
 
 try:
     from typing import TypedDict
@@ -122,3 +122,70 @@ class TimeseriesDataType(TypedDict):
     """
     uuid: str
     data: List[TimeseriesDataPointType]
+
+
+class BackfillProgressType(TypedDict):
+    """
+    Attributes:
+        completed: The number of windows uploaded, including those of previous runs recorded in the checkpoint.
+        total: The number of windows of the backfill.
+        failed: The exceptions raised by windows of this run, keyed by timeseries UUID and window start.
+        data_points: The number of data points uploaded by this run.
+        elapsed: The number of seconds this run has taken.
+        data_points_per_second: The throughput of this run.
+        eta: The estimated number of seconds until all windows are done, None until a window is done.
+
+    Example::
+
+        {
+            'completed': 1200,
+            'total': 8760,
+            'failed': {
+                'e21ae595-15a5-4f11-8992-9d33600cc1ee/2020-01-01T00:00:00+00:00': SelfHostTooManyRequestsException()
+            },
+            'data_points': 4320000,
+            'elapsed': 310.4,
+            'data_points_per_second': 13917.5,
+            'eta': 1953.2,
+        }
+
+    """
+    completed: int
+    total: int
+    failed: Dict[str, Exception]
+    data_points: int
+    elapsed: float
+    data_points_per_second: float
+    eta: Optional[float]
+
+
+class ImportProgressType(TypedDict):
+    """
+    Attributes:
+        rows: The number of rows of the file uploaded.
+        data_points: The number of data points uploaded.
+        retries: The number of requests that were sent again after a transient failure.
+        created: The UUIDs of the timeseries created for columns of the file, keyed by column.
+        elapsed: The number of seconds the import has taken.
+        rows_per_second: The throughput of the import.
+
+    Example::
+
+        {
+            'rows': 250000,
+            'data_points': 1000000,
+            'retries': 2,
+            'created': {
+                'supply_temperature': 'e21ae595-15a5-4f11-8992-9d33600cc1ee'
+            },
+            'elapsed': 18.2,
+            'rows_per_second': 13736.3,
+        }
+
+    """
+    rows: int
+    data_points: int
+    retries: int
+    created: Dict[str, str]
+    elapsed: float
+    rows_per_second: float
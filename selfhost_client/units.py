@@ -0,0 +1,168 @@
+import threading
+from typing import Any, Dict, List, Tuple, Union
+from warnings import filterwarnings
+
+from beartype import beartype
+from beartype.roar import BeartypeDecorHintPep585DeprecationWarning
+
+from .arrow import pa, pc
+from .dataframes import np, pd
+
+filterwarnings("ignore", category=BeartypeDecorHintPep585DeprecationWarning)
+
+Number = Union[int, float]
+
+
+class UnitRegistry:
+    """
+    Converts values between units on the client, matching the si_unit values of timeseries
+
+    Every unit belongs to a dimension and is defined by an affine conversion to the base unit of its dimension,
+    base = value * scale + offset. The factors of a conversion between two units are computed once and cached, and
+    applied to whole columns at a time, so a single fetch can be expressed in several units without asking the
+    server to cast.
+
+    Example::
+
+        data = client.get_timeseries_data_arrow(timeseries_uuid, start, end)
+        fahrenheit = unit_registry.convert(data, 'C', 'F')
+    """
+
+    def __init__(self) -> None:
+        self._units: Dict[str, Tuple[str, float, float]] = {}
+        self._factors: Dict[Tuple[str, str], Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, unit: object) -> bool:
+        return unit in self._units
+
+    @beartype
+    def register(self, unit: str, dimension: str, scale: Number = 1.0, offset: Number = 0.0) -> None:
+        """Adds a unit, or redefines it
+
+        Args:
+            unit (str): The name of the unit, as used in the si_unit of timeseries.
+            dimension (str): The quantity the unit measures, e.g. 'temperature'. Only units of the same dimension can
+                be converted into each other.
+            scale (Union[int, float]): The factor a value is multiplied with to express it in the base unit.
+            offset (Union[int, float]): The term added after scaling to express a value in the base unit.
+        """
+        with self._lock:
+            self._units[unit] = (dimension, float(scale), float(offset))
+            self._factors.clear()
+
+    @beartype
+    def factors(self, from_unit: str, to_unit: str) -> Tuple[float, float]:
+        """Returns the factors a and b that convert a value x in from_unit into to_unit as x * a + b
+
+        Raises:
+            ValueError: A unit is unknown or the units measure different dimensions.
+        """
+        key: Tuple[str, str] = (from_unit, to_unit)
+        factors = self._factors.get(key)
+        if factors is None:
+            source: Tuple[str, float, float] = self._unit(from_unit)
+            target: Tuple[str, float, float] = self._unit(to_unit)
+            if source[0] != target[0]:
+                raise ValueError(f'Can not convert {from_unit} ({source[0]}) into {to_unit} ({target[0]})')
+            factors = (source[1] / target[1], (source[2] - target[2]) / target[1])
+            self._factors[key] = factors
+        return factors
+
+    def convert(self, values: Any, from_unit: str, to_unit: str) -> Any:
+        """Converts values from one unit into another
+
+        Args:
+            values (Any): A number, a list of numbers, a numpy array, a pandas Series or DataFrame, or a pyarrow
+                Array, ChunkedArray or Table. Only the v column is converted of DataFrames and Tables with one,
+                e.g. those of the long layout, otherwise all columns of a DataFrame are converted.
+            from_unit (str): The unit of the values.
+            to_unit (str): The unit to convert the values into.
+
+        Returns:
+            Any: The converted values, of the same type as the given values, even when the units are the same. Lists
+                and Tables are copied, and numbers and arrow values become floats.
+
+        Raises:
+            ValueError: A unit is unknown or the units measure different dimensions, or a Table has no v column.
+            TypeError: Values of an unsupported type.
+        """
+        # Converting into the same unit is not short-circuited, so the result has the same type either way.
+        scale, offset = self.factors(from_unit, to_unit)
+        if isinstance(values, (int, float)):
+            return values * scale + offset
+        if isinstance(values, list):
+            return [value * scale + offset for value in values]
+        if pa is not None and isinstance(values, pa.Table):
+            index: int = values.schema.get_field_index('v')
+            if index < 0:
+                raise ValueError('Tables must have a v column')
+            return values.set_column(index, 'v', self._convert_arrow(values.column(index), scale, offset))
+        if pa is not None and isinstance(values, (pa.Array, pa.ChunkedArray)):
+            return self._convert_arrow(values, scale, offset)
+        if pd is not None and isinstance(values, pd.DataFrame) and 'v' in values.columns:
+            return values.assign(v=values['v'] * scale + offset)
+        if (np is not None and isinstance(values, np.ndarray)) or (
+            pd is not None and isinstance(values, (pd.Series, pd.DataFrame))
+        ):
+            return values * scale + offset
+        raise TypeError(f'Can not convert values of type {type(values).__name__}')
+
+    def _unit(self, unit: str) -> Tuple[str, float, float]:
+        try:
+            return self._units[unit]
+        except KeyError:
+            raise ValueError(f'Unknown unit: {unit}') from None
+
+    @staticmethod
+    def _convert_arrow(values: Any, scale: float, offset: float) -> Any:
+        return pc.add(pc.multiply(pc.cast(values, pa.float64()), scale), offset)
+
+
+# unit, dimension, scale, offset
+_DEFAULT_UNITS: List[Tuple[str, str, float, float]] = [
+    ('K', 'temperature', 1, 0),
+    ('C', 'temperature', 1, 273.15),
+    ('°C', 'temperature', 1, 273.15),
+    ('F', 'temperature', 5 / 9, 273.15 - 32 * 5 / 9),
+    ('°F', 'temperature', 5 / 9, 273.15 - 32 * 5 / 9),
+    ('J', 'energy', 1, 0),
+    ('kJ', 'energy', 1e3, 0),
+    ('MJ', 'energy', 1e6, 0),
+    ('GJ', 'energy', 1e9, 0),
+    ('Wh', 'energy', 3600, 0),
+    ('kWh', 'energy', 3.6e6, 0),
+    ('MWh', 'energy', 3.6e9, 0),
+    ('GWh', 'energy', 3.6e12, 0),
+    ('W', 'power', 1, 0),
+    ('kW', 'power', 1e3, 0),
+    ('MW', 'power', 1e6, 0),
+    ('GW', 'power', 1e9, 0),
+    ('Pa', 'pressure', 1, 0),
+    ('hPa', 'pressure', 1e2, 0),
+    ('kPa', 'pressure', 1e3, 0),
+    ('MPa', 'pressure', 1e6, 0),
+    ('bar', 'pressure', 1e5, 0),
+    ('mbar', 'pressure', 1e2, 0),
+    ('m', 'length', 1, 0),
+    ('km', 'length', 1e3, 0),
+    ('cm', 'length', 1e-2, 0),
+    ('mm', 'length', 1e-3, 0),
+    ('m3', 'volume', 1, 0),
+    ('l', 'volume', 1e-3, 0),
+    ('m3/s', 'volume flow', 1, 0),
+    ('m3/h', 'volume flow', 1 / 3600, 0),
+    ('l/s', 'volume flow', 1e-3, 0),
+    ('l/h', 'volume flow', 1e-3 / 3600, 0),
+    ('s', 'time', 1, 0),
+    ('min', 'time', 60, 0),
+    ('h', 'time', 3600, 0),
+    ('m/s', 'speed', 1, 0),
+    ('km/h', 'speed', 1 / 3.6, 0),
+    ('%', 'ratio', 1e-2, 0),
+]
+
+unit_registry: UnitRegistry = UnitRegistry()
+"""The registry of the common SI units and their prefixed forms, extended with :meth:`UnitRegistry.register`"""
+for _unit, _dimension, _scale, _offset in _DEFAULT_UNITS:
+    unit_registry.register(_unit, _dimension, _scale, _offset)
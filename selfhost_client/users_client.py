@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from warnings import filterwarnings
 
 import pyrfc3339
@@ -7,6 +7,8 @@ from beartype import beartype
 from beartype.roar import BeartypeDecorHintPep585DeprecationWarning
 
 from .base_client import BaseClient
+from .tracing import traced
+from .types.batch_types import BatchResultType
 from .types.policy_types import PolicyType
 from .types.user_types import UserType, UserTokenType, CreatedUserTokenResponse, UserTokenResponse
 from .utils import filter_none_values_from_dict
@@ -29,6 +31,7 @@ class UsersClient(BaseClient):
         super().__init__(base_url, username, password)
         self._users_api_path = 'users'
 
+    @traced
     @beartype
     def get_users(self,
                   limit: Optional[int] = None,
@@ -60,6 +63,7 @@ class UsersClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def create_user(self, name: str) -> UserType:
         """Add a new user to the NODA Self-host API
@@ -84,6 +88,7 @@ class UsersClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def get_my_user(self) -> UserType:
         """Returns the current user (you) from NODA Self-host API
@@ -103,6 +108,7 @@ class UsersClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def get_user(self, user_uuid: str) -> UserType:
         """Returns a user from NODA Self-host API by UUID
@@ -127,6 +133,7 @@ class UsersClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def update_user(self,
                     user_uuid: str,
@@ -168,6 +175,7 @@ class UsersClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def delete_user(self, user_uuid: str) -> None:
         """Deletes a user from NODA Self-host API
@@ -189,6 +197,7 @@ class UsersClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def get_user_policies(self, user_uuid: str) -> List[PolicyType]:
         """Fetches a list of policies associated with the specified user from NODA Self-host API
@@ -213,6 +222,7 @@ class UsersClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def update_user_rate(self, user_uuid: str, rate: int) -> None:
         """Change the allowed request rate for a user from NODA Self-host API
@@ -236,6 +246,7 @@ class UsersClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def get_user_tokens(self, user_uuid: str) -> List[UserTokenType]:
         """Fetches a list of all secret tokens associated with a specified user from NODA Self-host API
@@ -265,6 +276,7 @@ class UsersClient(BaseClient):
             'created': pyrfc3339.parse(token.get('created'))
         } for token in user_tokens]
 
+    @traced
     @beartype
     def create_user_token(self, user_uuid: str, token_name: str) -> CreatedUserTokenResponse:
         """Generate and add a new secret token to a specified user from NODA Self-host API
@@ -291,6 +303,7 @@ class UsersClient(BaseClient):
         )
         return self._process_response(response)
 
+    @traced
     @beartype
     def delete_user_token(self, user_uuid: str, token_uuid: str) -> None:
         """Delete a secret token for a specified user from NODA Self-host API
@@ -312,3 +325,65 @@ class UsersClient(BaseClient):
             url=f'{self._base_url}/{self._api_version}/{self._users_api_path}/{user_uuid}/tokens/{token_uuid}'
         )
         return self._process_response(response)
+
+    @traced
+    @beartype
+    def create_users_many(self,
+                          users: List[Dict[str, Any]],
+                          max_workers: int = 8
+                          ) -> List[BatchResultType]:
+        """Adds many users to the NODA Self-host API concurrently
+
+        Calls :meth:`create_user` for every item, at most max_workers at a time.
+        A failing call does not stop the others.
+
+        Args:
+            users (List[Dict[str, Any]]): The keyword arguments of :meth:`create_user` for every item.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            List[:class:`.BatchResultType`]: The created user or the raised exception of every item,
+            in the order of users.
+        """
+        return self._run_many(self.create_user, users, max_workers)
+
+    @traced
+    @beartype
+    def update_users_many(self,
+                          users: List[Dict[str, Any]],
+                          max_workers: int = 8
+                          ) -> List[BatchResultType]:
+        """Updates many users in the NODA Self-host API concurrently
+
+        Calls :meth:`update_user` for every item, at most max_workers at a time.
+        A failing call does not stop the others.
+
+        Args:
+            users (List[Dict[str, Any]]): The keyword arguments of :meth:`update_user` for every item,
+                including user_uuid.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            List[:class:`.BatchResultType`]: The outcome of every item, in the order of users.
+        """
+        return self._run_many(self.update_user, users, max_workers)
+
+    @traced
+    @beartype
+    def delete_users_many(self,
+                          user_uuids: List[str],
+                          max_workers: int = 8
+                          ) -> List[BatchResultType]:
+        """Deletes many users from the NODA Self-host API concurrently
+
+        Calls :meth:`delete_user` for every UUID, at most max_workers at a time.
+        A failing call does not stop the others.
+
+        Args:
+            user_uuids (List[str]): UUIDs of the users to delete.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            List[:class:`.BatchResultType`]: The outcome of every UUID, in the order of user_uuids.
+        """
+        return self._run_many(self.delete_user, user_uuids, max_workers)
@@ -8,10 +8,16 @@ VERSION_RE = re.compile(r'''__version__ = ['"]([0-9.]+)['"]''')
 
 requires = [
     'requests',
-    'pyrfc3339',
+    'pyrfc3339<3',
     'beartype',
 ]
 
+extras_require = {
+    'pandas': ['pandas'],
+    'arrow': ['pyarrow'],
+    'opentelemetry': ['opentelemetry-api'],
+}
+
 
 def get_version():
     init = open(os.path.join(ROOT, 'selfhost_client', '__init__.py')).read()
@@ -29,6 +35,7 @@ setup(
     scripts=[],
     packages=find_packages(),
     install_requires=requires,
+    extras_require=extras_require,
     license='MIT License',
     python_requires='>= 3.7',
     classifiers=[
@@ -0,0 +1,165 @@
+import unittest
+from typing import Any, List
+
+from selfhost_client import TimeseriesDataResponse
+from selfhost_client.aggregation import (
+    aggregate_timeseries_dataframe,
+    combine_bucket_aggregates,
+    resample_timeseries_dataframe,
+    source_aggregates,
+    truncate_timestamps
+)
+from selfhost_client.dataframes import pd, timeseries_data_to_dataframe
+
+
+@unittest.skipIf(pd is None, 'pandas is not installed')
+class TestAggregation(unittest.TestCase):
+    def test_truncate_timestamps(self) -> None:
+        timestamps = pd.Series([pd.Timestamp('2024-10-26T23:37:12.345Z'), pd.Timestamp('2000-06-15T12:00:00Z')])
+
+        expected = {
+            'milliseconds': ['2024-10-26T23:37:12.345Z', '2000-06-15T12:00:00Z'],
+            'minute15': ['2024-10-26T23:30:00Z', '2000-06-15T12:00:00Z'],
+            'day': ['2024-10-26T00:00:00Z', '2000-06-15T00:00:00Z'],
+            'week': ['2024-10-21T00:00:00Z', '2000-06-12T00:00:00Z'],
+            'month': ['2024-10-01T00:00:00Z', '2000-06-01T00:00:00Z'],
+            'year': ['2024-01-01T00:00:00Z', '2000-01-01T00:00:00Z'],
+            'decade': ['2020-01-01T00:00:00Z', '2000-01-01T00:00:00Z'],
+            'century': ['2001-01-01T00:00:00Z', '1901-01-01T00:00:00Z'],
+            'millennia': ['2001-01-01T00:00:00Z', '1001-01-01T00:00:00Z'],
+        }
+        for precision, buckets in expected.items():
+            with self.subTest(f'truncate to {precision}'):
+                self.assertEqual(
+                    truncate_timestamps(timestamps, precision).tolist(),
+                    [pd.Timestamp(bucket) for bucket in buckets]
+                )
+
+        with self.subTest('buckets are computed on the wall clock of the time zone'):
+            self.assertEqual(
+                truncate_timestamps(timestamps, 'day', 'Europe/Stockholm').tolist(),
+                pd.to_datetime(['2024-10-27T00:00:00+02:00', '2000-06-15T00:00:00+02:00'], utc=True).tolist()
+            )
+
+        with self.subTest('the repeated hour of a daylight saving time transition is one bucket'):
+            transition = pd.Series(pd.to_datetime(['2024-10-27T00:30:00Z', '2024-10-27T01:30:00Z'], utc=True))
+            self.assertEqual(
+                truncate_timestamps(transition, 'hour', 'Europe/Stockholm').tolist(),
+                pd.to_datetime(['2024-10-27T02:00:00+02:00', '2024-10-27T02:00:00+02:00'], utc=True).tolist()
+            )
+
+        with self.subTest('a bucket skipped by turning the clocks forward starts at the transition'):
+            # Lord Howe Island turns its clocks forward half an hour, from 02:00 to 02:30.
+            transition = pd.Series(pd.to_datetime(['2024-10-05T15:45:00Z'], utc=True))
+            self.assertEqual(
+                truncate_timestamps(transition, 'hour', 'Australia/Lord_Howe').tolist(),
+                pd.to_datetime(['2024-10-06T02:30:00+11:00'], utc=True).tolist()
+            )
+
+        with self.subTest('unknown precision'):
+            self.assertRaises(ValueError, truncate_timestamps, timestamps, 'fortnight')
+
+        with self.subTest('unknown time zone'):
+            self.assertRaises(ValueError, truncate_timestamps, timestamps, 'day', 'Europe/Atlantis')
+
+    def test_aggregate_timeseries_dataframe(self) -> None:
+        timeseries_data: List[TimeseriesDataResponse] = [
+            {
+                'uuid': 'be7823cc-44fa-403d-853f-d5ce48a002e4',
+                'data': [
+                    {'ts': '2022-01-14T12:00:00Z', 'v': 1.0},
+                    {'ts': '2022-01-14T12:20:00Z', 'v': 2.0},
+                    {'ts': '2022-01-14T12:40:00Z', 'v': 6.0},
+                    {'ts': '2022-01-14T13:00:00Z', 'v': 4.0}
+                ]
+            },
+            {
+                'uuid': 'ze7823cc-44fa-403d-853f-d5ce48a002e4',
+                'data': [
+                    {'ts': '2022-01-14T12:30:00Z', 'v': 3.0}
+                ]
+            }
+        ]
+        frame = timeseries_data_to_dataframe(timeseries_data, 'long')
+
+        with self.subTest('multiple aggregates and percentiles per bucket'):
+            res = aggregate_timeseries_dataframe(frame, 'hour', ['avg', 'min', 'max', 'sum', 'count', 'p50'])
+
+            self.assertEqual(list(res.columns), ['uuid', 'ts', 'avg', 'min', 'max', 'sum', 'count', 'p50'])
+            self.assertEqual(res['uuid'].tolist(), [
+                'be7823cc-44fa-403d-853f-d5ce48a002e4',
+                'be7823cc-44fa-403d-853f-d5ce48a002e4',
+                'ze7823cc-44fa-403d-853f-d5ce48a002e4'
+            ])
+            self.assertEqual(res['ts'].tolist(), pd.to_datetime([
+                '2022-01-14T12:00:00Z', '2022-01-14T13:00:00Z', '2022-01-14T12:00:00Z'
+            ], utc=True).tolist())
+            self.assertEqual(res.iloc[0, 2:].tolist(), [3.0, 1.0, 6.0, 9.0, 3, 2.0])
+            self.assertEqual(res.iloc[2, 2:].tolist(), [3.0, 3.0, 3.0, 3.0, 1, 3.0])
+
+        with self.subTest('unknown aggregate'):
+            self.assertRaises(ValueError, aggregate_timeseries_dataframe, frame, 'hour', ['median'])
+            self.assertRaises(ValueError, aggregate_timeseries_dataframe, frame, 'hour', ['p101'])
+
+    def test_source_aggregates(self) -> None:
+        with self.subTest('avg is computed from sum and count'):
+            self.assertEqual(source_aggregates('hour', ['avg', 'min', 'count'], 'minute15'), ['sum', 'count', 'min'])
+            self.assertEqual(source_aggregates('week', ['max'], 'hour'), ['max'])
+            self.assertEqual(source_aggregates('millennia', ['sum'], 'century'), ['sum'])
+
+        with self.subTest('precision not a multiple of source_precision'):
+            for precision, source_precision in [
+                ('minute30', 'minute20'), ('hour', 'hour'), ('minute', 'hour'), ('month', 'week'),
+                ('century', 'decade'), ('day', 'month')
+            ]:
+                self.assertRaises(ValueError, source_aggregates, precision, ['avg'], source_precision)
+
+        with self.subTest('percentiles and unknown aggregates'):
+            self.assertRaises(ValueError, source_aggregates, 'hour', ['p95'], 'minute')
+            self.assertRaises(ValueError, source_aggregates, 'hour', ['median'], 'minute')
+
+    def test_combine_bucket_aggregates(self) -> None:
+        # Sub-buckets with one, three and two data points, the first two in the same hour.
+        def source_buckets(values: List[float]) -> Any:
+            return timeseries_data_to_dataframe([{
+                'uuid': 'be7823cc-44fa-403d-853f-d5ce48a002e4',
+                'data': [
+                    {'ts': ts, 'v': v}
+                    for ts, v in zip(['2022-01-14T12:00:00Z', '2022-01-14T12:15:00Z', '2022-01-14T13:00:00Z'], values)
+                ]
+            }], 'long')
+
+        frames = {
+            'sum': source_buckets([4.0, 3.0, 10.0]),
+            'count': source_buckets([1, 3, 2]),
+            'min': source_buckets([4.0, 0.0, 5.0]),
+            'max': source_buckets([4.0, 2.0, 5.0]),
+        }
+
+        res = combine_bucket_aggregates(frames, 'hour', ['avg', 'min', 'max', 'sum', 'count'])
+
+        self.assertEqual(list(res.columns), ['uuid', 'ts', 'avg', 'min', 'max', 'sum', 'count'])
+        self.assertEqual(res['ts'].tolist(), pd.to_datetime([
+            '2022-01-14T12:00:00Z', '2022-01-14T13:00:00Z'
+        ], utc=True).tolist())
+        # (4 + 3) / (1 + 3) data points, where averaging the averages 4.0 and 1.0 would give 2.5.
+        self.assertEqual(res.iloc[0, 2:].tolist(), [1.75, 0.0, 4.0, 7.0, 4])
+        self.assertEqual(res.iloc[1, 2:].tolist(), [5.0, 5.0, 5.0, 10.0, 2])
+
+    def test_resample_timeseries_dataframe(self) -> None:
+        frame = pd.DataFrame({
+            'uuid': ['be7823cc-44fa-403d-853f-d5ce48a002e4'] * 3,
+            'ts': pd.to_datetime(['2022-01-14T22:00:00Z', '2022-01-14T23:30:00Z', '2022-01-15T03:00:00Z'], utc=True),
+            'v': [1.0, 2.0, 6.0],
+        })
+
+        res = resample_timeseries_dataframe(frame, 'day', ['UTC', 'Europe/Stockholm', 'America/New_York'])
+
+        self.assertEqual(list(res), ['UTC', 'Europe/Stockholm', 'America/New_York'])
+        self.assertEqual(res['UTC']['avg'].tolist(), [1.5, 6.0])
+        self.assertEqual(res['Europe/Stockholm']['avg'].tolist(), [1.0, 4.0])
+        self.assertEqual(res['America/New_York']['avg'].tolist(), [3.0])
+        self.assertEqual(
+            res['Europe/Stockholm']['ts'].tolist(),
+            pd.to_datetime(['2022-01-14T00:00:00+01:00', '2022-01-15T00:00:00+01:00'], utc=True).tolist()
+        )
@@ -0,0 +1,120 @@
+import json
+import time
+from typing import List
+
+import responses
+import unittest
+
+from selfhost_client import AlertBatcher, AlertsClient, FlushedAlertType
+
+
+class TestAlertBatcher(unittest.TestCase):
+    def setUp(self) -> None:
+        self.base_url: str = 'http://example.com'
+        self.client: AlertsClient = AlertsClient(
+            base_url=self.base_url,
+            username='test',
+            password='test'
+        )
+        self.url: str = f'{self.base_url}/{self.client._api_version}/{self.client._alerts_api_path}'
+        self.now: float = 0.0
+
+    def alert(self, resource: str, value: str = 'string') -> dict:
+        return {
+            'resource': resource,
+            'environment': 'production',
+            'event': 'pressure-high',
+            'value': value,
+            'description': 'string',
+            'origin': 'string',
+            'severity': 'major'
+        }
+
+    @responses.activate
+    def test_coalesce(self) -> None:
+        responses.add(responses.POST, url=self.url, json={'uuid': '5d8c23d7-3a78-4159-aa40-e3ef3d9bfe55'}, status=201)
+        batcher: AlertBatcher = AlertBatcher(self.client, window=10, clock=lambda: self.now)
+
+        with self.subTest('duplicates within the window are coalesced'):
+            self.assertTrue(batcher.add(**self.alert('pump-1', value='1')))
+            self.now = 5.0
+            self.assertFalse(batcher.add(**self.alert('pump-1', value='2')))
+            self.assertTrue(batcher.add(**self.alert('pump-2')))
+            self.assertEqual(len(batcher), 2)
+            self.assertEqual(len(responses.calls), 0)
+
+        with self.subTest('alerts are flushed once their window has passed'):
+            self.now = 10.0
+            flushed: List[FlushedAlertType] = batcher.flush_due()
+            self.assertEqual(len(flushed), 1)
+            self.assertEqual(flushed[0]['count'], 2)
+            self.assertEqual(flushed[0]['result'], {'uuid': '5d8c23d7-3a78-4159-aa40-e3ef3d9bfe55'})
+            self.assertIsNone(flushed[0]['exception'])
+            self.assertEqual(len(responses.calls), 1)
+            self.assertEqual(json.loads(responses.calls[0].request.body)['value'], '2')
+            self.assertEqual(len(batcher), 1)
+
+        with self.subTest('adding a duplicate after the window starts a new alert'):
+            self.now = 15.0
+            self.assertTrue(batcher.add(**self.alert('pump-2')))
+            self.assertEqual(len(responses.calls), 2)
+            self.assertEqual(len(batcher), 1)
+
+        with self.subTest('close flushes the pending alerts'):
+            flushed = batcher.close()
+            self.assertEqual([(f['alert']['resource'], f['count']) for f in flushed], [('pump-2', 1)])
+            self.assertEqual(len(batcher), 0)
+
+    @responses.activate
+    def test_max_pending(self) -> None:
+        responses.add(responses.POST, url=self.url, json={'error': 'Internal Server Error'}, status=500)
+        flushes: List[List[FlushedAlertType]] = []
+        batcher: AlertBatcher = AlertBatcher(
+            self.client,
+            window=60,
+            max_pending=2,
+            on_flush=flushes.append,
+            clock=lambda: self.now
+        )
+
+        batcher.add(**self.alert('pump-1'))
+        batcher.add(**self.alert('pump-2'))
+        self.assertEqual(len(responses.calls), 0)
+        batcher.add(**self.alert('pump-3'))
+
+        self.assertEqual(len(responses.calls), 3)
+        self.assertEqual(len(batcher), 0)
+        self.assertEqual(len(flushes), 1)
+        self.assertEqual([f['alert']['resource'] for f in flushes[0]], ['pump-1', 'pump-2', 'pump-3'])
+        self.assertTrue(all(f['exception'] is not None and f['result'] is None for f in flushes[0]))
+
+    @responses.activate
+    def test_failing_on_flush(self) -> None:
+        responses.add(responses.POST, url=self.url, json={'uuid': '5d8c23d7-3a78-4159-aa40-e3ef3d9bfe55'}, status=201)
+        flushes: List[List[FlushedAlertType]] = []
+
+        def on_flush(flushed: List[FlushedAlertType]) -> None:
+            flushes.append(flushed)
+            if len(flushes) == 1:
+                raise RuntimeError('on_flush failed')
+
+        batcher: AlertBatcher = AlertBatcher(self.client, window=10, on_flush=on_flush, clock=lambda: self.now)
+        batcher.start()
+        self.addCleanup(batcher.close)
+
+        with self.assertLogs('selfhost_client.alert_batcher', level='ERROR'):
+            batcher.add(**self.alert('pump-1'))
+            self.now = 10.0
+            for _ in range(500):
+                if flushes:
+                    break
+                time.sleep(0.01)
+
+            # The background thread keeps flushing after on_flush raised.
+            batcher.add(**self.alert('pump-2'))
+            self.now = 20.0
+            for _ in range(500):
+                if len(flushes) == 2:
+                    break
+                time.sleep(0.01)
+        self.assertEqual([[f['alert']['resource'] for f in flushed] for flushed in flushes], [['pump-1'], ['pump-2']])
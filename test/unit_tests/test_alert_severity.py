@@ -0,0 +1,46 @@
+import unittest
+
+from selfhost_client import AlertSeverity, filter_alerts, sort_alerts_by_severity
+
+
+class TestAlertSeverity(unittest.TestCase):
+    def setUp(self) -> None:
+        self.alerts = [
+            {'uuid': 'a', 'severity': 'minor', 'status': 'open'},
+            {'uuid': 'b', 'severity': 'security', 'status': 'ack'},
+            {'uuid': 'c', 'severity': 'debug', 'status': 'open'},
+            {'uuid': 'd', 'severity': 'critical', 'status': 'open'},
+            {'uuid': 'e', 'severity': 'bogus', 'status': 'open'},
+            {'uuid': 'f', 'severity': 'minor', 'status': 'closed'},
+        ]
+
+    def test_parse(self) -> None:
+        with self.subTest('severities are ranked by how severe they are'):
+            self.assertGreater(AlertSeverity.parse('security'), AlertSeverity.parse('critical'))
+            self.assertLess(AlertSeverity.parse('indeterminate'), AlertSeverity.TRACE)
+            self.assertIs(AlertSeverity.parse(AlertSeverity.MAJOR), AlertSeverity.MAJOR)
+
+        with self.subTest('unknown severity'):
+            with self.assertRaises(ValueError):
+                AlertSeverity.parse('bogus')
+
+    def test_filter_alerts(self) -> None:
+        with self.subTest('at least'):
+            self.assertEqual([a['uuid'] for a in filter_alerts(self.alerts, severity_ge='major')], ['b', 'd'])
+
+        with self.subTest('range and status'):
+            res = filter_alerts(self.alerts, severity_ge=AlertSeverity.DEBUG, severity_le='minor', status=['open'])
+            self.assertEqual([a['uuid'] for a in res], ['a', 'c'])
+
+        with self.subTest('unknown severities only match without a lower bound'):
+            self.assertEqual([a['uuid'] for a in filter_alerts(self.alerts, severity_le='trace')], ['e'])
+
+    def test_sort_alerts_by_severity(self) -> None:
+        self.assertEqual(
+            [a['uuid'] for a in sort_alerts_by_severity(self.alerts)],
+            ['b', 'd', 'a', 'f', 'c', 'e']
+        )
+        self.assertEqual(
+            [a['uuid'] for a in sort_alerts_by_severity(self.alerts, descending=False)],
+            ['e', 'c', 'a', 'f', 'd', 'b']
+        )
@@ -0,0 +1,149 @@
+from typing import Any, Dict, List
+
+import responses
+import unittest
+
+from selfhost_client import AlertChangesType, AlertsClient, AlertStore, SelfHostInternalServerException
+
+
+def alert(alert_uuid: str, status: str, severity: str, tags: List[str], received: str) -> Dict[str, Any]:
+    return {
+        'uuid': alert_uuid,
+        'status': status,
+        'severity': severity,
+        'tags': tags,
+        'rawdata': 'aGVsbG8sIHdvcmxkIQ==',
+        'created': '2020-03-09T09:48:30.035+02:00',
+        'last_receive_time': received,
+    }
+
+
+class TestAlertStore(unittest.TestCase):
+    def setUp(self) -> None:
+        self.base_url: str = 'http://example.com'
+        self.client: AlertsClient = AlertsClient(
+            base_url=self.base_url,
+            username='test',
+            password='test'
+        )
+        self.url: str = f'{self.base_url}/{self.client._api_version}/{self.client._alerts_api_path}'
+
+    def add_pages(self, *pages: List[Dict[str, Any]]) -> None:
+        for page in pages:
+            responses.add(responses.GET, url=self.url, json=page, status=200)
+
+    def uuids(self, alerts: List[Dict[str, Any]]) -> List[str]:
+        return [alert['uuid'] for alert in alerts]
+
+    @responses.activate
+    def test_refresh_and_query(self) -> None:
+        store: AlertStore = AlertStore(self.client, filters={'environment': 'production'}, page_size=2)
+        self.add_pages(
+            [
+                alert('a', 'open', 'critical', ['pump'], '2020-03-09T09:48:30+02:00'),
+                alert('b', 'open', 'minor', ['pump', 'north'], '2020-03-09T09:50:30+02:00'),
+            ],
+            [
+                alert('b', 'open', 'minor', ['pump', 'north'], '2020-03-09T09:50:30+02:00'),
+                alert('c', 'ack', 'critical', ['north'], '2020-03-09T09:49:30+02:00'),
+            ]
+        )
+
+        with self.subTest('the first refresh pages through all alerts'):
+            changes: AlertChangesType = store.refresh()
+            self.assertEqual(changes, {'added': ['a', 'b', 'c'], 'updated': [], 'removed': []})
+            self.assertEqual(len(responses.calls), 2)
+            # Overlapping the previous page by one alert.
+            self.assertIn('offset=1', responses.calls[1].request.url)
+            self.assertIn('limit=3', responses.calls[1].request.url)
+            self.assertIn('environment=production', responses.calls[1].request.url)
+            self.assertEqual(len(store), 3)
+            self.assertIsNone(store.get('a')['rawdata'])
+            self.assertEqual(store.watermark.isoformat(), '2020-03-09T09:50:30+02:00')
+
+        with self.subTest('queries are answered from the indexes'):
+            self.assertEqual(self.uuids(store.query()), ['b', 'c', 'a'])
+            self.assertEqual(self.uuids(store.query(status=['open'])), ['b', 'a'])
+            self.assertEqual(self.uuids(store.query(severity=['critical'], tags=['north'])), ['c'])
+            self.assertEqual(self.uuids(store.query(tags=['pump', 'north'])), ['b'])
+            self.assertEqual(store.query(status=['closed']), [])
+            self.assertEqual(self.uuids(store.query(severity_ge='major')), ['c', 'a'])
+            self.assertEqual(self.uuids(store.query(status=['open'], severity_le='major')), ['b'])
+            self.assertEqual(len(responses.calls), 2)
+
+        with self.subTest('a refresh only re-indexes the changes'):
+            responses.reset()
+            self.add_pages(
+                [
+                    alert('a', 'open', 'critical', ['pump'], '2020-03-09T09:48:30+02:00'),
+                    alert('b', 'ack', 'minor', ['pump', 'north'], '2020-03-09T09:50:30+02:00'),
+                ],
+                [
+                    alert('b', 'ack', 'minor', ['pump', 'north'], '2020-03-09T09:50:30+02:00'),
+                    alert('d', 'open', 'major', [], '2020-03-09T09:51:30+02:00'),
+                ]
+            )
+            changes = store.refresh()
+            self.assertEqual(changes, {'added': ['d'], 'updated': ['b'], 'removed': ['c']})
+            self.assertEqual(self.uuids(store.query(status=['open'])), ['d', 'a'])
+            self.assertEqual(self.uuids(store.query(tags=['north'])), ['b'])
+            self.assertNotIn('c', store)
+            self.assertEqual(store.watermark.isoformat(), '2020-03-09T09:51:30+02:00')
+
+        with self.subTest('a change in any field updates the alert'):
+            responses.reset()
+            changed: Dict[str, Any] = alert('d', 'open', 'major', [], '2020-03-09T09:51:30+02:00')
+            changed['description'] = 'changed'
+            self.add_pages(
+                [
+                    alert('a', 'open', 'critical', ['pump'], '2020-03-09T09:48:30+02:00'),
+                    alert('b', 'ack', 'minor', ['pump', 'north'], '2020-03-09T09:50:30+02:00'),
+                ],
+                [alert('b', 'ack', 'minor', ['pump', 'north'], '2020-03-09T09:50:30+02:00'), changed]
+            )
+            changes = store.refresh()
+            self.assertEqual(changes, {'added': [], 'updated': ['d'], 'removed': []})
+            self.assertEqual(store.get('d')['description'], 'changed')
+
+    @responses.activate
+    def test_refresh_while_alerts_change(self) -> None:
+        store: AlertStore = AlertStore(self.client, page_size=2)
+        alerts: List[Dict[str, Any]] = [
+            alert(alert_uuid, 'open', 'minor', [], '2020-03-09T09:48:30+02:00') for alert_uuid in 'abcd'
+        ]
+        self.add_pages(alerts[:2], alerts[1:], alerts[3:])
+        store.refresh()
+
+        with self.subTest('no alert is removed when a deletion shifted the pages'):
+            responses.reset()
+            # a is deleted after the first page, so the second page starts at c instead of b.
+            self.add_pages(alerts[:2], alerts[2:])
+            changes: AlertChangesType = store.refresh()
+            self.assertEqual(changes, {'added': [], 'updated': [], 'removed': []})
+            self.assertEqual(len(store), 4)
+
+        with self.subTest('the next refresh removes the alerts'):
+            responses.reset()
+            self.add_pages(alerts[1:3], alerts[2:])
+            changes = store.refresh()
+            self.assertEqual(changes, {'added': [], 'updated': [], 'removed': ['a']})
+
+        with self.subTest('alerts repeated by an insertion are only fetched once'):
+            responses.reset()
+            # e is inserted before b after the first page, so the second page starts at b again.
+            self.add_pages(alerts[1:3], alerts[1:], alerts[3:])
+            changes = store.refresh()
+            self.assertEqual(changes, {'added': [], 'updated': [], 'removed': []})
+            self.assertEqual(len(store), 3)
+            self.assertIn('offset=3', responses.calls[2].request.url)
+
+    @responses.activate
+    def test_refresh_failure(self) -> None:
+        store: AlertStore = AlertStore(self.client, page_size=1)
+        self.add_pages([alert('a', 'open', 'critical', [], '2020-03-09T09:48:30+02:00')])
+        responses.add(responses.GET, url=self.url, json={'error': 'Internal Server Error'}, status=500)
+
+        with self.assertRaises(SelfHostInternalServerException):
+            store.refresh()
+        self.assertIsNone(store.watermark)
+        self.assertEqual(len(store), 0)
@@ -1,12 +1,12 @@
 import json
-from typing import List, Dict, Union
+from typing import List, Dict, Union, get_type_hints
 
 import pyrfc3339
 import responses
 import unittest
 import urllib
 
-from selfhost_client import AlertsClient, AlertType, CreatedAlertResponse
+from selfhost_client import AlertsClient, AlertType, CreatedAlertResponse, LazyRawData
 
 
 class TestThingsClient(unittest.TestCase):
@@ -122,6 +122,57 @@ class TestThingsClient(unittest.TestCase):
                 pyrfc3339.parse('2020-03-09T09:48:30.035+02:00')
             )
 
+    @responses.activate
+    def test_get_alerts_rawdata_mode(self) -> None:
+        mock_response: List[Dict[str, Union[str, None]]] = [
+            {
+                'uuid': '5d8c23d7-3a78-4159-aa40-e3ef3d9bfe55',
+                'rawdata': 'aGVsbG8sIHdvcmxkIQ==',
+                'created': '2020-03-09T09:48:30.035+02:00',
+                'last_receive_time': '2020-03-09T09:48:30.035+02:00'
+            },
+            {
+                'uuid': 'a9214980-2c89-42e4-a08d-71689af86b67',
+                'rawdata': None,
+                'created': '2020-03-09T09:48:30.035+02:00',
+                'last_receive_time': '2020-03-09T09:48:30.035+02:00'
+            }
+        ]
+        responses.add(
+            responses.GET,
+            url=f'{self.base_url}/{self.client._api_version}/{self.client._alerts_api_path}',
+            json=mock_response,
+            status=200
+        )
+
+        with self.subTest('encoded by default'):
+            res: List[AlertType] = self.client.get_alerts()
+            self.assertEqual(res[0]['rawdata'], 'aGVsbG8sIHdvcmxkIQ==')
+            self.assertIsNone(res[1]['rawdata'])
+
+        with self.subTest('decoded on first access when lazy'):
+            res = self.client.get_alerts(rawdata_mode='lazy')
+            rawdata = res[0]['rawdata']
+            self.assertIsInstance(rawdata, LazyRawData)
+            self.assertEqual(rawdata.encoded, 'aGVsbG8sIHdvcmxkIQ==')
+            self.assertIsNone(rawdata._decoded)
+            self.assertEqual(bytes(rawdata), b'hello, world!')
+            self.assertIs(rawdata.decoded, rawdata.decoded)
+            self.assertIsNone(res[1]['rawdata'])
+
+        with self.subTest('omitted'):
+            res = self.client.get_alerts(rawdata_mode='omit')
+            self.assertIsNone(res[0]['rawdata'])
+            self.assertEqual(res[0]['uuid'], '5d8c23d7-3a78-4159-aa40-e3ef3d9bfe55')
+
+        with self.subTest('unknown mode'):
+            with self.assertRaises(ValueError):
+                self.client.get_alerts(rawdata_mode='decoded')
+            self.assertEqual(len(responses.calls), 3)
+
+        with self.subTest('type hints resolve'):
+            self.assertIn('rawdata', get_type_hints(AlertType))
+
     @responses.activate
     def test_create_alert(self) -> None:
         mock_response: CreatedAlertResponse = {
@@ -0,0 +1,76 @@
+import datetime
+import os
+import tempfile
+import unittest
+from typing import List
+
+from selfhost_client import TimeseriesDataResponse
+from selfhost_client.arrow import pa, pq, read_timeseries_batches, timeseries_data_to_arrow
+
+
+@unittest.skipIf(pa is None, 'pyarrow is not installed')
+class TestArrow(unittest.TestCase):
+    def setUp(self) -> None:
+        self.timeseries_data: List[TimeseriesDataResponse] = [
+            {
+                'uuid': 'be7823cc-44fa-403d-853f-d5ce48a002e4',
+                'data': [
+                    {'ts': '2022-01-14T12:00:00Z', 'v': 1.0},
+                    {'ts': '2022-01-14T12:00:01.500Z', 'v': 2.0}
+                ]
+            },
+            {
+                'uuid': 'ze7823cc-44fa-403d-853f-d5ce48a002e4',
+                'data': [
+                    {'ts': '2022-01-14T13:00:01.500+01:00', 'v': 3.0}
+                ]
+            }
+        ]
+
+    def test_timeseries_data_to_arrow(self) -> None:
+        table = timeseries_data_to_arrow(self.timeseries_data)
+
+        self.assertEqual(table.column_names, ['uuid', 'ts', 'v'])
+        self.assertEqual(table.column('uuid').to_pylist(), [
+            'be7823cc-44fa-403d-853f-d5ce48a002e4',
+            'be7823cc-44fa-403d-853f-d5ce48a002e4',
+            'ze7823cc-44fa-403d-853f-d5ce48a002e4'
+        ])
+        self.assertEqual(table.column('v').to_pylist(), [1.0, 2.0, 3.0])
+        self.assertEqual(
+            table.column('ts').to_pylist()[2],
+            datetime.datetime(2022, 1, 14, 12, 0, 1, 500000, tzinfo=datetime.timezone.utc)
+        )
+
+    def test_read_timeseries_batches(self) -> None:
+        table = timeseries_data_to_arrow(self.timeseries_data)
+
+        with self.subTest('batches are split per timeseries'):
+            batches = list(read_timeseries_batches(table, batch_size=2))
+            self.assertEqual(batches, [
+                ('be7823cc-44fa-403d-853f-d5ce48a002e4', [
+                    {'v': 1.0, 'ts': '2022-01-14T12:00:00.000000Z'},
+                    {'v': 2.0, 'ts': '2022-01-14T12:00:01.500000Z'}
+                ]),
+                ('ze7823cc-44fa-403d-853f-d5ce48a002e4', [
+                    {'v': 3.0, 'ts': '2022-01-14T12:00:01.500000Z'}
+                ])
+            ])
+
+        with self.subTest('read from parquet file with overridden uuid'):
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, 'timeseries.parquet')
+                pq.write_table(table, path)
+                batches = list(read_timeseries_batches(path, timeseries_uuid='a21ae595', batch_size=10))
+
+            self.assertEqual(len(batches), 1)
+            self.assertEqual(batches[0][0], 'a21ae595')
+            self.assertEqual([data_point['v'] for data_point in batches[0][1]], [1.0, 2.0, 3.0])
+
+        with self.subTest('naive timestamps are treated as UTC'):
+            naive_table = pa.table({
+                'ts': pa.array([datetime.datetime(2022, 1, 14, 12)], type=pa.timestamp('ms')),
+                'v': pa.array([1], type=pa.int64())
+            })
+            batches = list(read_timeseries_batches(naive_table, timeseries_uuid='a21ae595'))
+            self.assertEqual(batches, [('a21ae595', [{'v': 1.0, 'ts': '2022-01-14T12:00:00.000000Z'}])])
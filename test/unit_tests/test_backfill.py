@@ -0,0 +1,107 @@
+import datetime
+import json
+import os
+import tempfile
+from typing import List
+
+import responses
+import unittest
+
+from selfhost_client import Backfill, BackfillProgressType, TimeseriesClient, TimeseriesDataPointType
+
+START = datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def source(timeseries_uuid: str, start: datetime.datetime, end: datetime.datetime) -> List[TimeseriesDataPointType]:
+    return [
+        {'ts': start + datetime.timedelta(hours=hour), 'v': float(hour)}
+        for hour in range(int((end - start).total_seconds() // 3600))
+    ]
+
+
+class TestBackfill(unittest.TestCase):
+    def setUp(self) -> None:
+        self.base_url: str = 'http://example.com'
+        self.client: TimeseriesClient = TimeseriesClient(
+            base_url=self.base_url,
+            username='test',
+            password='test'
+        )
+        self.url: str = f'{self.base_url}/{self.client._api_version}/{self.client._timeseries_api_path}'
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.checkpoint: str = os.path.join(directory.name, 'backfill.jsonl')
+
+    def test_tasks(self) -> None:
+        backfill: Backfill = Backfill(
+            self.client, source, ['a', 'b'], START, START + datetime.timedelta(hours=60)
+        )
+        self.assertEqual(
+            [(uuid, start.isoformat(), end.isoformat()) for uuid, start, end in backfill.tasks()],
+            [
+                ('a', '2022-01-01T00:00:00+00:00', '2022-01-02T00:00:00+00:00'),
+                ('a', '2022-01-02T00:00:00+00:00', '2022-01-03T00:00:00+00:00'),
+                ('a', '2022-01-03T00:00:00+00:00', '2022-01-03T12:00:00+00:00'),
+                ('b', '2022-01-01T00:00:00+00:00', '2022-01-02T00:00:00+00:00'),
+                ('b', '2022-01-02T00:00:00+00:00', '2022-01-03T00:00:00+00:00'),
+                ('b', '2022-01-03T00:00:00+00:00', '2022-01-03T12:00:00+00:00'),
+            ]
+        )
+        with self.assertRaises(ValueError):
+            Backfill(self.client, source, ['a'], START, START, executor='fiber')
+
+    @responses.activate
+    def test_run(self) -> None:
+        responses.add(responses.POST, url=f'{self.url}/a/data', status=201)
+        responses.add(responses.POST, url=f'{self.url}/b/data', json={'error': 'Too Many Requests'}, status=429)
+        reports: List[BackfillProgressType] = []
+        backfill: Backfill = Backfill(
+            self.client,
+            source,
+            ['a', 'b'],
+            START,
+            START + datetime.timedelta(days=3),
+            checkpoint=self.checkpoint,
+            max_workers=2,
+            progress=lambda progress: reports.append(dict(progress))
+        )
+
+        with self.subTest('failed tasks do not stop the others'):
+            res: BackfillProgressType = backfill.run()
+            self.assertEqual(res['completed'], 3)
+            self.assertEqual(res['total'], 6)
+            self.assertEqual(res['data_points'], 72)
+            self.assertEqual(sorted(res['failed']), [
+                'b/2022-01-01T00:00:00+00:00', 'b/2022-01-02T00:00:00+00:00', 'b/2022-01-03T00:00:00+00:00'
+            ])
+            self.assertLessEqual(len(reports), 6)
+            self.assertEqual(reports[-1]['completed'], 3)
+            self.assertGreater(reports[-1]['data_points_per_second'], 0)
+            self.assertEqual(reports[-1]['eta'], 0)
+            self.assertEqual(len(json.loads(responses.calls[0].request.body)), 24)
+            with open(self.checkpoint) as file:
+                self.assertEqual(len(file.readlines()), 3)
+
+        with self.subTest('a second run only runs the unfinished tasks'):
+            responses.reset()
+            responses.add(responses.POST, url=f'{self.url}/b/data', status=201)
+            with open(self.checkpoint, 'a') as file:
+                file.write('{"uuid": "b", "sta')
+            res = backfill.run()
+            self.assertEqual(res['completed'], 6)
+            self.assertEqual(res['failed'], {})
+            self.assertEqual(res['data_points'], 72)
+            self.assertEqual({call.request.url for call in responses.calls}, {f'{self.url}/b/data'})
+            self.assertEqual(len(responses.calls), 3)
+            with open(self.checkpoint) as file:
+                self.assertEqual(len([line for line in file if line.startswith('{"uuid"') and line.endswith('}\n')]), 6)
+
+        with self.subTest('only the tasks of the backfill are counted from the checkpoint'):
+            responses.reset()
+            responses.add(responses.POST, url=f'{self.url}/c/data', status=201)
+            res = Backfill(
+                self.client, source, ['a', 'c'], START, START + datetime.timedelta(days=2), checkpoint=self.checkpoint
+            ).run()
+            self.assertEqual(res['total'], 4)
+            self.assertEqual(res['completed'], 4)
+            self.assertEqual({call.request.url for call in responses.calls}, {f'{self.url}/c/data'})
@@ -1,6 +1,11 @@
 import base64
+import json
+import logging
 import os
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
 
 import requests
 import responses
@@ -15,6 +20,7 @@ from selfhost_client import (
     SelfHostNotFoundException,
     SelfHostTooManyRequestsException,
     SelfHostUnauthorizedException,
+    RequestMetricsType,
 )
 
 Response = requests.models.Response
@@ -240,3 +246,142 @@ class TestBaseClient(unittest.TestCase):
                         f"Status Code: {response.status_code}"
                     ),
                 )
+                self.assertEqual(cm.records[0].status_code, 200)
+
+    @responses.activate
+    def test_debug_logging(self) -> None:
+        client: BaseClient = BaseClient(
+            base_url=self.base_url, username=self.username, password=self.password
+        )
+        responses.add(responses.POST, url=self.base_url, status=201)
+        response: Response = requests.post(self.base_url, data="x" * 2000)
+
+        with self.subTest("long bodies are truncated"):
+            client.configure_debug_logging(body_limit=10)
+            with self.assertLogs("selfhost_client", level="DEBUG") as cm:
+                client._process_response(response)
+            self.assertIn("Body: xxxxxxxxxx... (1990 more bytes)\n", cm.output[0])
+            self.assertEqual(cm.records[0].request_body_size, 2000)
+
+        with self.subTest("whole body is logged without limit"):
+            client.configure_debug_logging(body_limit=None)
+            with self.assertLogs("selfhost_client", level="DEBUG") as cm:
+                client._process_response(response)
+            self.assertIn(f"Body: {'x' * 2000}\n", cm.output[0])
+
+        with self.subTest("sampled out responses are not logged"):
+            client.configure_debug_logging(sample_rate=0.0)
+            with self.assertLogs("selfhost_client", level="DEBUG") as cm:
+                client._process_response(response)
+                logging.getLogger("selfhost_client").debug("end")
+            self.assertEqual(cm.output, ["DEBUG:selfhost_client:end"])
+
+        with self.subTest("invalid sample rate"):
+            self.assertRaises(ValueError, client.configure_debug_logging, sample_rate=1.5)
+
+    @responses.activate
+    def test_single_flight(self) -> None:
+        client: BaseClient = BaseClient(
+            base_url=self.base_url, username=self.username, password=self.password
+        )
+
+        def slow_callback(request) -> Tuple[int, Dict, str]:
+            time.sleep(0.2)
+            return 200, {}, json.dumps([{"v": 3.14}])
+
+        responses.add_callback(responses.GET, url=self.base_url, callback=slow_callback)
+
+        def fetch(params: Dict[str, str]) -> Any:
+            return client._process_response(client._session.get(url=self.base_url, params=params))
+
+        with self.subTest("concurrent identical GET requests share one request"):
+            client.enable_single_flight()
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                results: List[Any] = list(executor.map(fetch, [{"a": "1"}] * 5))
+
+            self.assertEqual(len(responses.calls), 1)
+            self.assertEqual(results[0], [{"v": 3.14}])
+            for result in results:
+                self.assertIs(result, results[0])
+
+        responses.calls.reset()
+        with self.subTest("different GET requests are not shared"):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                list(executor.map(fetch, [{"a": "1"}, {"a": "2"}]))
+
+            self.assertEqual(len(responses.calls), 2)
+
+        responses.calls.reset()
+        with self.subTest("single flight disabled"):
+            client.enable_single_flight(False)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                list(executor.map(fetch, [{"a": "1"}] * 2))
+
+            self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_request_hooks(self) -> None:
+        client: BaseClient = BaseClient(
+            base_url=self.base_url, username=self.username, password=self.password
+        )
+        metrics: List[RequestMetricsType] = []
+        client.add_request_hook(metrics.append)
+
+        with self.subTest("successful request is reported"):
+            responses.add(
+                responses.POST,
+                url=f"{self.base_url}/v2/things/5ce5d3cd-ff99-4342-a19e-fdb1b5805178/datasets",
+                json={"uuid": "a"},
+                status=201,
+            )
+            client._process_response(
+                client._session.post(
+                    url=f"{self.base_url}/v2/things/5ce5d3cd-ff99-4342-a19e-fdb1b5805178/datasets",
+                    json={"name": "test"},
+                )
+            )
+
+            self.assertEqual(len(metrics), 1)
+            self.assertEqual(metrics[0]["method"], "POST")
+            self.assertEqual(metrics[0]["endpoint"], "things/{uuid}/datasets")
+            self.assertEqual(metrics[0]["status_code"], 201)
+            self.assertEqual(metrics[0]["bytes_sent"], len(b'{"name": "test"}'))
+            self.assertEqual(metrics[0]["bytes_received"], len(b'{"uuid": "a"}'))
+            self.assertIsNone(metrics[0]["exception"])
+            self.assertGreaterEqual(metrics[0]["decode"], 0)
+            self.assertGreaterEqual(metrics[0]["total"], metrics[0]["decode"])
+
+        metrics.clear()
+        with self.subTest("failed request is reported with the exception"):
+            responses.add(responses.GET, url=f"{self.base_url}/v2/users/me", status=429)
+            self.assertRaises(
+                SelfHostTooManyRequestsException,
+                client._process_response,
+                client._session.get(url=f"{self.base_url}/v2/users/me"),
+            )
+
+            self.assertEqual(len(metrics), 1)
+            self.assertEqual(metrics[0]["endpoint"], "users/me")
+            self.assertEqual(metrics[0]["status_code"], 429)
+            self.assertEqual(metrics[0]["exception"], "SelfHostTooManyRequestsException")
+
+        metrics.clear()
+        with self.subTest("request without response is reported with the exception"):
+            self.assertRaises(
+                requests.exceptions.ConnectionError,
+                client._session.get,
+                url=f"{self.base_url}/v2/unknown",
+            )
+
+            self.assertEqual(len(metrics), 1)
+            self.assertIsNone(metrics[0]["status_code"])
+            self.assertEqual(metrics[0]["exception"], "ConnectionError")
+
+        metrics.clear()
+        with self.subTest("removed hook is not called"):
+            client.remove_request_hook(metrics.append)
+            client._process_response(
+                client._session.post(url=f"{self.base_url}/v2/things/5ce5d3cd-ff99-4342-a19e-fdb1b5805178/datasets")
+            )
+
+            self.assertEqual(metrics, [])
@@ -0,0 +1,109 @@
+import json
+import re
+from typing import Any, Callable, Dict, List, Tuple
+
+import responses
+import unittest
+
+from selfhost_client import (
+    AlertsClient,
+    BaseClient,
+    BatchResultType,
+    DatasetsClient,
+    GroupsClient,
+    PoliciesClient,
+    ProgramsClient,
+    SelfHostBadRequestException,
+    SelfHostNotFoundException,
+    ThingsClient,
+    TimeseriesClient,
+    UsersClient
+)
+
+# client class, api path attribute, plural of the helpers, arguments of create_* for a label, uuid argument of update_*
+CLIENTS: List[Tuple[type, str, str, Callable[[str], Dict[str, Any]], str]] = [
+    (AlertsClient, '_alerts_api_path', 'alerts', lambda label: {
+        'resource': label, 'environment': 'test', 'event': 'event', 'value': '1', 'description': 'description',
+        'origin': 'test', 'severity': 'major'
+    }, 'alert_uuid'),
+    (DatasetsClient, '_datasets_api_path', 'datasets', lambda label: {
+        'name': label, 'dataset_format': 'csv', 'content': 'YQ=='
+    }, 'dataset_uuid'),
+    (GroupsClient, '_groups_api_path', 'groups', lambda label: {'name': label}, 'group_uuid'),
+    (PoliciesClient, '_policies_api_path', 'policies', lambda label: {
+        'group_uuid': label, 'priority': 0, 'effect': 'allow', 'action': 'read', 'resource': 'things/%'
+    }, 'policy_uuid'),
+    (ProgramsClient, '_programs_api_path', 'programs', lambda label: {
+        'name': label, 'program_type': 'routine'
+    }, 'program_uuid'),
+    (ThingsClient, '_things_api_path', 'things', lambda label: {'name': label}, 'thing_uuid'),
+    (TimeseriesClient, '_timeseries_api_path', 'timeseries', lambda label: {
+        'name': label, 'si_unit': 'C'
+    }, 'timeseries_uuid'),
+    (UsersClient, '_users_api_path', 'users', lambda label: {'name': label}, 'user_uuid'),
+]
+
+LABELS: List[str] = ['item 0', 'item 1', 'invalid', 'item 3', 'item 4', 'item 5']
+
+
+class TestBatchHelpers(unittest.TestCase):
+    """Walks the create_*_many, update_*_many and delete_*_many helpers of every client"""
+
+    def setUp(self) -> None:
+        self.base_url: str = 'http://example.com'
+
+    @staticmethod
+    def create_callback(request: Any) -> Tuple[int, Dict, str]:
+        body: Dict[str, Any] = json.loads(request.body)
+        if 'invalid' in body.values():
+            return 400, {}, ''
+        return 201, {}, json.dumps(body)
+
+    @staticmethod
+    def uuid_callback(request: Any) -> Tuple[int, Dict, str]:
+        if request.url.endswith('/invalid'):
+            return 404, {}, ''
+        return 204, {}, ''
+
+    def assert_outcomes(self, results: List[BatchResultType], exception: type) -> None:
+        self.assertEqual(len(results), len(LABELS))
+        for label, result in zip(LABELS, results):
+            if label == 'invalid':
+                self.assertIsNone(result['result'])
+                self.assertIsInstance(result['exception'], exception)
+            else:
+                self.assertIsNone(result['exception'])
+
+    @responses.activate
+    def test_many(self) -> None:
+        for client_class, path_attribute, plural, create_arguments, uuid_argument in CLIENTS:
+            client: BaseClient = client_class(base_url=self.base_url, username='test', password='test')
+            url: str = f'{self.base_url}/{client._api_version}/{getattr(client, path_attribute)}'
+            responses.reset()
+            responses.add_callback(responses.POST, url=url, callback=self.create_callback)
+            responses.add_callback(responses.PUT, url=re.compile(f'{url}/.+'), callback=self.uuid_callback)
+            responses.add_callback(responses.DELETE, url=re.compile(f'{url}/.+'), callback=self.uuid_callback)
+
+            with self.subTest(f'create_{plural}_many'):
+                arguments: List[Dict[str, Any]] = [create_arguments(label) for label in LABELS]
+                results: List[BatchResultType] = getattr(client, f'create_{plural}_many')(arguments, max_workers=3)
+                self.assert_outcomes(results, SelfHostBadRequestException)
+                # Results are in the order of the items, although the requests run concurrently.
+                for label, result in zip(LABELS, results):
+                    if result['result'] is not None:
+                        self.assertIn(label, result['result'].values())
+
+            with self.subTest(f'update_{plural}_many'):
+                results = getattr(client, f'update_{plural}_many')(
+                    [{uuid_argument: label.replace(' ', '-'), 'name': label} if 'name' in create_arguments(label)
+                     else {uuid_argument: label.replace(' ', '-')} for label in LABELS],
+                    max_workers=3
+                )
+                self.assert_outcomes(results, SelfHostNotFoundException)
+
+            with self.subTest(f'delete_{plural}_many'):
+                results = getattr(client, f'delete_{plural}_many')(
+                    [label.replace(' ', '-') for label in LABELS], max_workers=3
+                )
+                self.assert_outcomes(results, SelfHostNotFoundException)
+                self.assertEqual(getattr(client, f'delete_{plural}_many')([]), [])
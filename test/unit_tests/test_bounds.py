@@ -0,0 +1,54 @@
+import unittest
+from typing import List, Optional
+from unittest import mock
+
+from selfhost_client import SelfHostOutOfBoundsException, TimeseriesDataPointResponse
+from selfhost_client.bounds import apply_bounds, np
+
+
+class TestBounds(unittest.TestCase):
+    def setUp(self) -> None:
+        values: List[Optional[float]] = [-1.5, 3.99, 12, float('nan'), 0, 10, None]
+        # Repeated past the number of data points that are compared as an array.
+        self.data_points: List[TimeseriesDataPointResponse] = [
+            {'v': value, 'ts': f'2022-01-14T12:{index // 60:02d}:{index % 60:02d}Z'}
+            for index, value in enumerate(values * 20)
+        ]
+
+    def _test_apply_bounds(self) -> None:
+        with self.subTest('filter'):
+            res, out_of_bounds = apply_bounds(self.data_points, 0, 10, 'filter')
+            self.assertEqual(out_of_bounds, 80)
+            self.assertEqual([data_point['v'] for data_point in res[:3]], [3.99, 0, 10])
+            self.assertEqual(len(res), 60)
+            self.assertIs(res[0], self.data_points[1])
+
+        with self.subTest('clip'):
+            res, out_of_bounds = apply_bounds(self.data_points, 0, None, 'clip')
+            self.assertEqual(out_of_bounds, 60)
+            self.assertEqual([data_point['v'] for data_point in res[:3]], [0, 3.99, 12])
+            # NaN and None have no nearest bound and are left out.
+            self.assertEqual([data_point['v'] for data_point in res[3:6]], [0, 10, 0])
+            self.assertEqual(len(res), 100)
+            self.assertEqual(res[0]['ts'], self.data_points[0]['ts'])
+
+        with self.subTest('raise'):
+            with self.assertRaisesRegex(SelfHostOutOfBoundsException, '80 data points') as context:
+                apply_bounds(self.data_points, 0, 10, 'raise')
+            self.assertIn('the first is -1.5 at 2022-01-14T12:00:00Z', context.exception.message)
+
+        with self.subTest('all data points within bounds'):
+            data_points: List[TimeseriesDataPointResponse] = [self.data_points[1]] * 100
+            self.assertEqual(apply_bounds(data_points, 0, 10, 'raise'), (data_points, 0))
+            self.assertIs(apply_bounds(data_points, None, None, 'filter')[0], data_points)
+
+        with self.subTest('unknown mode'):
+            self.assertRaises(ValueError, apply_bounds, self.data_points, 0, 10, 'ignore')
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_apply_bounds_vectorized(self) -> None:
+        self._test_apply_bounds()
+
+    def test_apply_bounds(self) -> None:
+        with mock.patch('selfhost_client.bounds.np', None):
+            self._test_apply_bounds()
@@ -0,0 +1,212 @@
+import io
+import json
+import os
+import re
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from typing import Any, Dict, List, Tuple
+
+import responses
+import unittest
+
+from selfhost_client import (
+    ImportProgressType,
+    SelfHostBadRequestException,
+    SelfHostImportFailedException,
+    SelfHostTooManyRequestsException,
+    TimeseriesClient,
+    import_timeseries
+)
+from selfhost_client.arrow import pa, pq
+from selfhost_client.cli import main
+
+
+class TestBulkImport(unittest.TestCase):
+    def setUp(self) -> None:
+        self.base_url: str = 'http://example.com'
+        self.client: TimeseriesClient = TimeseriesClient(
+            base_url=self.base_url,
+            username='test',
+            password='test'
+        )
+        self.url: str = f'{self.base_url}/{self.client._api_version}/{self.client._timeseries_api_path}'
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory: str = directory.name
+        self.posted: Dict[str, List[Dict[str, Any]]] = {}
+
+    def add_data(self, status: int = 201) -> None:
+        def callback(request: Any) -> Tuple[int, Dict, str]:
+            uuid: str = request.url.split('/')[-2]
+            self.posted.setdefault(uuid, []).extend(json.loads(request.body))
+            return 201, {}, ''
+
+        if status != 201:
+            responses.add(responses.POST, re.compile(f'{self.url}/.+/data'), status=status)
+        responses.add_callback(responses.POST, re.compile(f'{self.url}/.+/data'), callback=callback)
+
+    def write(self, name: str, content: str) -> str:
+        path: str = os.path.join(self.directory, name)
+        with open(path, 'w') as file:
+            file.write(content)
+        return path
+
+    @responses.activate
+    def test_import_timeseries_long_csv(self) -> None:
+        self.add_data()
+        path: str = self.write('data.csv', (
+            'uuid,ts,v\n'
+            'a,2022-01-01T00:00:00Z,1\n'
+            'b,2022-01-01T00:00:00Z,2\n'
+            'a,2022-01-01T01:00:00Z,3\n'
+        ))
+        progress: List[int] = []
+
+        result: ImportProgressType = import_timeseries(
+            self.client, path, chunk_size=2, unit='C', progress=lambda p: progress.append(p['rows'])
+        )
+
+        with self.subTest('reports the progress'):
+            self.assertEqual(result['rows'], 3)
+            self.assertEqual(result['data_points'], 3)
+            self.assertEqual(result['retries'], 0)
+            self.assertEqual(result['created'], {})
+            self.assertEqual(progress[-1], 3)
+
+        with self.subTest('sends one request per timeseries and chunk'):
+            self.assertEqual(len(responses.calls), 3)
+            self.assertEqual(responses.calls[0].request.params['unit'], 'C')
+            self.assertEqual(self.posted['a'], [
+                {'v': 1.0, 'ts': '2022-01-01T00:00:00Z'}, {'v': 3.0, 'ts': '2022-01-01T01:00:00Z'}
+            ])
+            self.assertEqual(self.posted['b'], [{'v': 2.0, 'ts': '2022-01-01T00:00:00Z'}])
+
+    @responses.activate
+    def test_import_timeseries_wide_csv(self) -> None:
+        self.add_data()
+        responses.add(responses.POST, self.url, json={'uuid': 'created', 'name': 'flow'}, status=201)
+        path: str = self.write('data.csv', (
+            'time,supply,flow\n'
+            '2022-01-01T00:00:00Z,1.5,\n'
+            '2022-01-01T01:00:00Z,2.5,4\n'
+        ))
+
+        with self.subTest('imports the mapped columns and creates timeseries for the others'):
+            result: ImportProgressType = import_timeseries(
+                self.client, path, columns={'supply': 'a'}, ts_column='time', create_si_unit='m3/h'
+            )
+            self.assertEqual(result['created'], {'flow': 'created'})
+            self.assertEqual(json.loads(responses.calls[0].request.body), {'name': 'flow', 'si_unit': 'm3/h'})
+            self.assertEqual(result['rows'], 2)
+            self.assertEqual(result['data_points'], 3)
+            self.assertEqual(self.posted['created'], [{'v': 4.0, 'ts': '2022-01-01T01:00:00Z'}])
+
+        with self.subTest('rejects columns that are not in the file'):
+            with self.assertRaises(ValueError):
+                import_timeseries(self.client, path, columns={'return': 'a'}, ts_column='time')
+
+        with self.subTest('rejects a wide file without columns'):
+            with self.assertRaises(ValueError):
+                import_timeseries(self.client, path, ts_column='time')
+
+    @responses.activate
+    def test_import_timeseries_partial_create(self) -> None:
+        def callback(request: Any) -> Tuple[int, Dict, str]:
+            name: str = json.loads(request.body)['name']
+            if name == 'return':
+                return 400, {}, ''
+            return 201, {}, json.dumps({'uuid': 'created', 'name': name})
+
+        responses.add_callback(responses.POST, self.url, callback=callback)
+        path: str = self.write('data.csv', 'ts,supply,return\n2022-01-01T00:00:00Z,1.5,4\n')
+
+        with self.subTest('the created timeseries are attached to the exception'):
+            with self.assertRaises(SelfHostImportFailedException) as context:
+                import_timeseries(self.client, path, create_si_unit='C')
+            self.assertEqual(context.exception.created, {'supply': 'created'})
+            self.assertIsInstance(context.exception.__cause__, SelfHostBadRequestException)
+
+        with self.subTest('the command prints the created timeseries before failing'):
+            output = io.StringIO()
+            with redirect_stdout(output), self.assertRaises(SelfHostImportFailedException):
+                main([
+                    'import', path, '--create-si-unit', 'C', '--quiet',
+                    '--base-url', self.base_url, '--username', 'test', '--password', 'test'
+                ])
+            self.assertEqual(output.getvalue(), 'supply=created\n')
+
+    def test_import_timeseries_invalid_options(self) -> None:
+        path: str = self.write('data.csv', 'uuid,ts,v\na,2022-01-01T00:00:00Z,1\n')
+
+        with self.subTest('rejects invalid options'):
+            for options in ({'retries': -1}, {'max_workers': 0}, {'chunk_size': 0}):
+                with self.assertRaises(ValueError):
+                    import_timeseries(self.client, path, **options)
+
+        with self.subTest('the command rejects invalid options'):
+            for option, value in (('--retries', '-1'), ('--max-workers', '0'), ('--chunk-size', 'x')):
+                with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+                    main(['import', path, option, value])
+
+    @responses.activate
+    def test_import_timeseries_short_row(self) -> None:
+        self.add_data()
+        path: str = self.write('data.csv', 'uuid,ts,v\na,2022-01-01T00:00:00Z,1\n\na,2022-01-01T01:00:00Z\n')
+
+        with self.assertRaises(SelfHostImportFailedException) as context:
+            import_timeseries(self.client, path)
+        self.assertIsInstance(context.exception.__cause__, ValueError)
+        self.assertEqual(str(context.exception.__cause__), f'{path}, line 4: expected 3 columns, got 2')
+
+    @responses.activate
+    def test_import_timeseries_retry(self) -> None:
+        path: str = self.write('data.csv', 'uuid,ts,v\na,2022-01-01T00:00:00Z,1\n')
+
+        with self.subTest('retries transient failures'):
+            self.add_data(status=429)
+            result: ImportProgressType = import_timeseries(self.client, path, backoff=0)
+            self.assertEqual(result['retries'], 1)
+            self.assertEqual(self.posted['a'], [{'v': 1.0, 'ts': '2022-01-01T00:00:00Z'}])
+
+        with self.subTest('raises when all retries failed'):
+            responses.reset()
+            responses.add(responses.POST, f'{self.url}/a/data', status=429)
+            with self.assertRaises(SelfHostImportFailedException) as context:
+                import_timeseries(self.client, path, retries=2, backoff=0)
+            self.assertIsInstance(context.exception.__cause__, SelfHostTooManyRequestsException)
+            self.assertEqual(len(responses.calls), 3)
+
+    @unittest.skipIf(pa is None, 'pyarrow is not installed')
+    @responses.activate
+    def test_import_timeseries_parquet(self) -> None:
+        self.add_data()
+        path: str = os.path.join(self.directory, 'data.parquet')
+        pq.write_table(pa.table({
+            'ts': pa.array([0, 3600 * 10 ** 6], type=pa.timestamp('us', tz='UTC')),
+            'supply': pa.array([1.5, None]),
+            'flow': pa.array([3, 4]),
+        }), path)
+
+        result: ImportProgressType = import_timeseries(self.client, path, columns={'supply': 'a', 'flow': 'b'})
+
+        self.assertEqual(result['rows'], 2)
+        self.assertEqual(result['data_points'], 3)
+        self.assertEqual(self.posted['a'], [{'v': 1.5, 'ts': '1970-01-01T00:00:00.000000Z'}])
+        self.assertEqual([data_point['v'] for data_point in self.posted['b']], [3.0, 4.0])
+
+    @responses.activate
+    def test_main_import(self) -> None:
+        self.add_data()
+        responses.add(responses.POST, self.url, json={'uuid': 'created', 'name': 'flow'}, status=201)
+        path: str = self.write('data.csv', 'ts,supply,flow\n2022-01-01T00:00:00Z,1.5,4\n')
+        output = io.StringIO()
+
+        with redirect_stdout(output):
+            status: int = main([
+                'import', path, '--column', 'supply=a', '--create-si-unit', 'm3/h', '--quiet',
+                '--base-url', self.base_url, '--username', 'test', '--password', 'test'
+            ])
+
+        self.assertEqual(status, 0)
+        self.assertEqual(output.getvalue(), 'flow=created\n')
+        self.assertEqual(sorted(self.posted), ['a', 'created'])
@@ -0,0 +1,65 @@
+import unittest
+from typing import List
+
+import pyrfc3339
+
+from selfhost_client import TimeseriesDataResponse, TimeseriesDataType
+from selfhost_client.dataframes import pd, timeseries_data_to_dataframe
+
+
+@unittest.skipIf(pd is None, 'pandas is not installed')
+class TestDataframes(unittest.TestCase):
+    def setUp(self) -> None:
+        self.timeseries_data: List[TimeseriesDataResponse] = [
+            {
+                'uuid': 'be7823cc-44fa-403d-853f-d5ce48a002e4',
+                'data': [
+                    {'ts': '2022-01-14T12:00:00Z', 'v': 1.0},
+                    {'ts': '2022-01-14T12:00:01.500Z', 'v': 2.0}
+                ]
+            },
+            {
+                'uuid': 'ze7823cc-44fa-403d-853f-d5ce48a002e4',
+                'data': [
+                    {'ts': '2022-01-14T13:00:01.500+01:00', 'v': 3.0}
+                ]
+            },
+            {
+                'uuid': 'ce7823cc-44fa-403d-853f-d5ce48a002e4',
+                'data': []
+            }
+        ]
+
+    def test_wide_layout(self) -> None:
+        frame = timeseries_data_to_dataframe(self.timeseries_data)
+
+        self.assertEqual(list(frame.columns), [series['uuid'] for series in self.timeseries_data])
+        self.assertEqual(len(frame.index), 2)
+        self.assertEqual(frame.index[1], pd.Timestamp('2022-01-14T12:00:01.500Z'))
+        self.assertEqual(frame.iloc[1].tolist()[:2], [2.0, 3.0])
+        self.assertTrue(pd.isna(frame.iloc[0, 1]))
+        self.assertTrue(frame.iloc[:, 2].isna().all())
+
+    def test_long_layout(self) -> None:
+        frame = timeseries_data_to_dataframe(self.timeseries_data, layout='long')
+
+        self.assertEqual(list(frame.columns), ['uuid', 'ts', 'v'])
+        self.assertEqual(frame['uuid'].tolist(), [
+            'be7823cc-44fa-403d-853f-d5ce48a002e4',
+            'be7823cc-44fa-403d-853f-d5ce48a002e4',
+            'ze7823cc-44fa-403d-853f-d5ce48a002e4'
+        ])
+        self.assertEqual(frame['v'].tolist(), [1.0, 2.0, 3.0])
+        self.assertEqual(frame['ts'].iloc[2], pd.Timestamp('2022-01-14T12:00:01.500Z'))
+
+    def test_decoded_timeseries_data(self) -> None:
+        timeseries_data: List[TimeseriesDataType] = [{
+            'uuid': 'be7823cc-44fa-403d-853f-d5ce48a002e4',
+            'data': [{'ts': pyrfc3339.parse('2022-01-14T13:00:00+01:00'), 'v': 1.0}]
+        }]
+        frame = timeseries_data_to_dataframe(timeseries_data)
+
+        self.assertEqual(frame.index[0], pd.Timestamp('2022-01-14T12:00:00Z'))
+
+    def test_invalid_layout(self) -> None:
+        self.assertRaises(ValueError, timeseries_data_to_dataframe, self.timeseries_data, 'tall')
@@ -0,0 +1,116 @@
+import hashlib
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+import responses
+
+from selfhost_client import DatasetCache, DatasetsClient
+from selfhost_client.dataset_cache import _file_lock
+
+
+class TestDatasetCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.base_url: str = 'http://example.com'
+        self.client: DatasetsClient = DatasetsClient(base_url=self.base_url, username='test', password='test')
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache: DatasetCache = DatasetCache(self.client, self.directory.name, max_size=250)
+        self.contents: Dict[str, bytes] = {
+            'a': b'a' * 100,
+            'b': b'b' * 100,
+            'c': b'c' * 100,
+            'd': b'a' * 100,
+        }
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def _add_dataset(self, dataset_uuid: str) -> None:
+        url: str = f'{self.base_url}/v2/datasets/{dataset_uuid}'
+        content: bytes = self.contents[dataset_uuid]
+        responses.add(responses.GET, url=url, json={
+            'uuid': dataset_uuid,
+            'checksum': hashlib.sha256(content).hexdigest(),
+            'size': len(content),
+            'created': '2017-07-21T17:32:28+02:00',
+            'updated': '2017-07-21T17:32:28+02:00',
+        }, status=200)
+
+        def callback(request) -> Tuple[int, Dict, bytes]:
+            start, end = (int(value) for value in request.headers['Range'][len('bytes='):].split('-'))
+            return 206, {'Content-Range': f'bytes {start}-{end}/{len(content)}'}, content[start:end + 1]
+
+        responses.add_callback(responses.GET, url=f'{url}/raw', callback=callback)
+
+    def _downloads(self) -> List[str]:
+        return [call.request.url for call in responses.calls if call.request.url.endswith('/raw')]
+
+    @responses.activate
+    def test_cache(self) -> None:
+        for dataset_uuid in self.contents:
+            self._add_dataset(dataset_uuid)
+
+        with self.subTest('content is downloaded once'):
+            self.assertEqual(self.cache.read('a'), self.contents['a'])
+            self.assertEqual(self.cache.read('a'), self.contents['a'])
+            self.assertEqual(len(self._downloads()), 1)
+            metadata = [call for call in responses.calls if call.request.url.endswith('/datasets/a')]
+            self.assertEqual(len(metadata), 2)
+
+        with self.subTest('datasets with identical content share a file'):
+            self.assertEqual(self.cache.path('d'), self.cache.path('a'))
+            self.assertEqual(len(self._downloads()), 1)
+
+        with self.subTest('content is memory mapped'):
+            with self.cache.open('b') as content:
+                self.assertEqual(content[:], self.contents['b'])
+            self.assertEqual(self.cache.size(), 200)
+
+        with self.subTest('least recently used content is evicted'):
+            os.utime(self.cache.path('a'), (1, 1))
+            os.utime(self.cache.path('b'), (2, 2))
+            self.cache.read('c')
+            self.assertEqual(self.cache.size(), 200)
+            self.assertFalse(os.path.exists(os.path.join(self.directory.name, hashlib.sha256(b'a' * 100).hexdigest())))
+            self.assertTrue(os.path.exists(os.path.join(self.directory.name, hashlib.sha256(b'b' * 100).hexdigest())))
+
+        with self.subTest('lock files and markers are removed with the content'):
+            checksum: str = hashlib.sha256(b'a' * 100).hexdigest()
+            self.assertEqual(sorted(name for name in os.listdir(self.directory.name) if name.startswith(checksum)), [])
+
+        with self.subTest('content in use is not evicted'):
+            b_path: str = self.cache.path('b')
+            os.utime(b_path, (1, 1))
+            # Locked as if another process was accessing it.
+            with _file_lock(f'{b_path}.lock'):
+                self.cache.read('a')
+            self.assertTrue(os.path.exists(b_path))
+            self.assertFalse(os.path.exists(os.path.join(self.directory.name, hashlib.sha256(b'c' * 100).hexdigest())))
+            self.assertEqual(self.cache.size(), 200)
+
+        with self.subTest('modified content is downloaded again'):
+            downloads: int = len(self._downloads())
+            a_path: str = os.path.join(self.directory.name, hashlib.sha256(b'a' * 100).hexdigest())
+            with open(a_path, 'r+b') as file:
+                file.write(b'x')
+            os.remove(f'{a_path}.sha256')
+            self.assertEqual(self.cache.read('a'), self.contents['a'])
+            self.assertEqual(len(self._downloads()), downloads + 1)
+
+        with self.subTest('clear'):
+            self.cache.clear()
+            self.assertEqual(self.cache.size(), 0)
+            self.assertEqual(os.listdir(self.directory.name), [])
+
+    @responses.activate
+    def test_concurrent_downloads(self) -> None:
+        self._add_dataset('a')
+
+        with ThreadPoolExecutor(4) as executor:
+            paths: List[str] = list(executor.map(lambda _: self.cache.path('a'), range(8)))
+
+        self.assertEqual(len(set(paths)), 1)
+        self.assertEqual(len(self._downloads()), 1)
+        self.assertEqual(self.cache.read('a'), self.contents['a'])
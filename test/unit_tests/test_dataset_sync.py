@@ -0,0 +1,91 @@
+import hashlib
+import json
+import os
+import tempfile
+import unittest
+from typing import Dict, List
+
+import responses
+
+from selfhost_client import SelfHostClient, SelfHostInternalServerException
+from selfhost_client.dataset_sync import MANIFEST_NAME, sync_thing_datasets
+
+
+class TestDatasetSync(unittest.TestCase):
+    def setUp(self) -> None:
+        self.base_url: str = 'http://example.com'
+        self.client: SelfHostClient = SelfHostClient(base_url=self.base_url, username='test', password='test')
+        self.thing_uuid: str = 'f36834fb-8d96-4c01-b0e4-0bd85906bc25'
+        self.directory = tempfile.TemporaryDirectory()
+        self.contents: Dict[str, bytes] = {'a': b'model a', 'b': b'model b'}
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def _mock(self, failing: List[str] = ()) -> None:
+        responses.reset()
+        responses.add(
+            responses.GET,
+            url=f'{self.base_url}/v2/things/{self.thing_uuid}/datasets',
+            json=[{
+                'uuid': dataset_uuid,
+                'format': 'bin',
+                'checksum': hashlib.sha256(content).hexdigest(),
+                'size': len(content),
+            } for dataset_uuid, content in self.contents.items()],
+            status=200
+        )
+        for dataset_uuid, content in self.contents.items():
+            responses.add(
+                responses.GET,
+                url=f'{self.base_url}/v2/datasets/{dataset_uuid}/raw',
+                body=content,
+                status=500 if dataset_uuid in failing else 200
+            )
+
+    def _downloads(self) -> List[str]:
+        return sorted(call.request.url for call in responses.calls if call.request.url.endswith('/raw'))
+
+    def _read(self, name: str) -> bytes:
+        with open(os.path.join(self.directory.name, name), 'rb') as file:
+            return file.read()
+
+    @responses.activate
+    def test_sync_thing_datasets(self) -> None:
+        with self.subTest('downloads new datasets'):
+            self._mock()
+            result = sync_thing_datasets(self.client, self.thing_uuid, self.directory.name)
+
+            self.assertEqual(sorted(result['downloaded']), ['a', 'b'])
+            self.assertEqual(self._read('a.bin'), b'model a')
+            self.assertEqual(self._read('b.bin'), b'model b')
+            self.assertEqual(sorted(os.listdir(self.directory.name)), [MANIFEST_NAME, 'a.bin', 'b.bin'])
+
+        with self.subTest('skips unchanged datasets without downloading'):
+            self._mock()
+            result = sync_thing_datasets(self.client, self.thing_uuid, self.directory.name)
+
+            self.assertEqual(sorted(result['unchanged']), ['a', 'b'])
+            self.assertEqual(self._downloads(), [])
+
+        with self.subTest('downloads changed datasets and removes deleted ones'):
+            self.contents = {'a': b'model a, version 2'}
+            self._mock()
+            result = sync_thing_datasets(self.client, self.thing_uuid, self.directory.name)
+
+            self.assertEqual(result['downloaded'], ['a'])
+            self.assertEqual(result['removed'], ['b'])
+            self.assertEqual(self._read('a.bin'), b'model a, version 2')
+            self.assertEqual(sorted(os.listdir(self.directory.name)), [MANIFEST_NAME, 'a.bin'])
+
+        with self.subTest('failed downloads keep the previous copy'):
+            self.contents = {'a': b'model a, version 3', 'c': b'model c'}
+            self._mock(failing=['a'])
+            result = sync_thing_datasets(self.client, self.thing_uuid, self.directory.name)
+
+            self.assertEqual(result['downloaded'], ['c'])
+            self.assertIsInstance(result['failed']['a'], SelfHostInternalServerException)
+            self.assertEqual(self._read('a.bin'), b'model a, version 2')
+            with open(os.path.join(self.directory.name, MANIFEST_NAME)) as file:
+                manifest = json.load(file)
+            self.assertEqual(manifest['a']['checksum'], hashlib.sha256(b'model a, version 2').hexdigest())
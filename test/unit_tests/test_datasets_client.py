@@ -1,12 +1,25 @@
+import hashlib
+import io
 import json
-from typing import List, Dict, Union
+import os
+import tempfile
+from typing import List, Dict, Optional, Tuple, Union
+from unittest import mock
 
 import pyrfc3339
+import requests
 import responses
 import unittest
 import urllib
 
-from selfhost_client import DatasetsClient, DatasetType
+from selfhost_client import (
+    DatasetsClient,
+    DatasetType,
+    SelfHostChecksumMismatchException,
+    SelfHostInternalServerException,
+    SelfHostNotFoundException,
+    SelfHostRangeNotSatisfiableException
+)
 
 
 class TestDatasetsClient(unittest.TestCase):
@@ -272,3 +285,254 @@ class TestDatasetsClient(unittest.TestCase):
                 responses.calls[0].request.url,
                 f'{self.base_url}/{self.client._api_version}/{self.client._datasets_api_path}/{dataset_uuid}/raw'
             )
+
+    @responses.activate
+    def test_create_dataset_from_stream(self) -> None:
+        bodies: List[Dict] = []
+
+        def callback(request) -> Tuple[int, Dict, str]:
+            bodies.append(json.loads(b''.join(request.body)))
+            return 201, {}, json.dumps({'uuid': '5e029cdf-4fee-42d2-9196-afbdfbdb9d8f'})
+
+        responses.add_callback(
+            responses.POST,
+            url=f'{self.base_url}/{self.client._api_version}/{self.client._datasets_api_path}',
+            callback=callback
+        )
+
+        with self.subTest('binary content is base64 encoded'):
+            progress: List[Tuple[int, Optional[int]]] = []
+            res: DatasetType = self.client.create_dataset_from_stream(
+                name='ML model yTgvX7z',
+                dataset_format='ini',
+                content=io.BytesIO(b'hello, world!'),
+                tags=['tag1'],
+                chunk_size=5,
+                progress=lambda done, total: progress.append((done, total))
+            )
+
+            self.assertEqual(res, {'uuid': '5e029cdf-4fee-42d2-9196-afbdfbdb9d8f'})
+            self.assertEqual(
+                bodies[-1],
+                {'name': 'ML model yTgvX7z', 'format': 'ini', 'tags': ['tag1'], 'content': 'aGVsbG8sIHdvcmxkIQ=='}
+            )
+            self.assertEqual(progress, [(5, 13), (10, 13), (13, 13)])
+
+        with self.subTest('text content is sent as it is'):
+            self.client.create_dataset_from_stream(
+                name='config', dataset_format='ini', content=(line for line in ['[a]\n', 'b = "c"\n'])
+            )
+            self.assertEqual(bodies[-1], {'name': 'config', 'format': 'ini', 'content': '[a]\nb = "c"\n'})
+
+    @responses.activate
+    def test_update_dataset_from_stream(self) -> None:
+        dataset_uuid: str = 'Ze7823cc-44fa-403d-853f-d5ce48a002e4'
+        bodies: List[Dict] = []
+
+        def callback(request) -> Tuple[int, Dict, str]:
+            bodies.append(json.loads(b''.join(request.body)))
+            return 204, {}, ''
+
+        responses.add_callback(
+            responses.PUT,
+            url=f'{self.base_url}/{self.client._api_version}/{self.client._datasets_api_path}/{dataset_uuid}',
+            callback=callback
+        )
+
+        self.assertIsNone(self.client.update_dataset_from_stream(dataset_uuid, b'hello, world!', name='new name'))
+        self.assertEqual(bodies, [{'name': 'new name', 'content': 'aGVsbG8sIHdvcmxkIQ=='}])
+
+    @responses.activate
+    def test_download_dataset_raw_content(self) -> None:
+        dataset_uuid: str = 'Ze7823cc-44fa-403d-853f-d5ce48a002e4'
+        url: str = f'{self.base_url}/{self.client._api_version}/{self.client._datasets_api_path}/{dataset_uuid}/raw'
+        content: bytes = bytes(range(256)) * 4
+
+        with self.subTest('to a stream'):
+            responses.add(responses.GET, url=url, body=content, status=200, auto_calculate_content_length=True)
+            stream = io.BytesIO()
+            progress: List[Tuple[int, Optional[int]]] = []
+
+            written: int = self.client.download_dataset_raw_content(
+                dataset_uuid, stream, chunk_size=512, progress=lambda done, total: progress.append((done, total))
+            )
+
+            self.assertEqual(written, len(content))
+            self.assertEqual(stream.getvalue(), content)
+            self.assertEqual(progress, [(512, 1024), (1024, 1024)])
+
+        with self.subTest('to a path'):
+            with tempfile.TemporaryDirectory() as directory:
+                path: str = os.path.join(directory, 'model.bin')
+                self.client.download_dataset_raw_content(dataset_uuid, path)
+                with open(path, 'rb') as file:
+                    self.assertEqual(file.read(), content)
+
+        with self.subTest('keeps an existing file when the download fails'):
+            responses.replace(responses.GET, url=url, body=content, status=200)
+
+            def interrupt(done: int, total: Optional[int]) -> None:
+                raise requests.ConnectionError('reset')
+
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, 'model.bin')
+                with open(path, 'wb') as file:
+                    file.write(b'previous')
+                self.assertRaises(
+                    requests.ConnectionError, self.client.download_dataset_raw_content, dataset_uuid, path,
+                    chunk_size=512, progress=interrupt
+                )
+                with open(path, 'rb') as file:
+                    self.assertEqual(file.read(), b'previous')
+                self.assertEqual(os.listdir(directory), ['model.bin'])
+
+        with self.subTest('not found'):
+            responses.replace(responses.GET, url=url, status=404)
+            self.assertRaises(
+                SelfHostNotFoundException, self.client.download_dataset_raw_content, dataset_uuid, io.BytesIO()
+            )
+
+    @responses.activate
+    def test_download_dataset(self) -> None:
+        dataset_uuid: str = 'Ze7823cc-44fa-403d-853f-d5ce48a002e4'
+        url: str = f'{self.base_url}/{self.client._api_version}/{self.client._datasets_api_path}/{dataset_uuid}'
+        content: bytes = os.urandom(1000)
+        dataset: Dict = {
+            'uuid': dataset_uuid,
+            'checksum': hashlib.sha256(content).hexdigest(),
+            'size': len(content),
+            'created': '2017-07-21T17:32:28+02:00',
+            'updated': '2017-07-21T17:32:28+02:00',
+        }
+        responses.add(responses.GET, url=url, json=dataset, status=200)
+        ranges: List[str] = []
+        failing: List[str] = []
+        # Ranges answered with the whole content, as by a server that stopped supporting ranges.
+        whole: List[str] = []
+        # The number of bytes sent past the end of the requested range, and the offset of the range answered.
+        overflow: List[int] = [0]
+        shift: List[int] = [0]
+
+        def callback(request) -> Tuple[int, Dict, bytes]:
+            if 'Range' not in request.headers:
+                return 200, {}, content
+            ranges.append(request.headers['Range'])
+            if request.headers['Range'] in failing:
+                return 500, {}, b''
+            if request.headers['Range'] in whole:
+                return 200, {}, content
+            start, end = (int(value) + shift[0] for value in request.headers['Range'][len('bytes='):].split('-'))
+            if start >= len(content):
+                return 416, {'Content-Range': f'bytes */{len(content)}'}, b''
+            end = min(end, len(content) - 1)
+            headers: Dict = {'Content-Range': f'bytes {start}-{end}/{len(content)}'}
+            return 206, headers, content[start:end + 1] + b'x' * overflow[0]
+
+        responses.add_callback(responses.GET, url=f'{url}/raw', callback=callback)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, 'model.bin')
+
+            with self.subTest('downloads ranges in parallel'):
+                progress: List[Tuple[int, Optional[int]]] = []
+                self.assertTrue(self.client.download_dataset(
+                    dataset_uuid, path, range_size=300, progress=lambda done, total: progress.append((done, total))
+                ))
+                with open(path, 'rb') as file:
+                    self.assertEqual(file.read(), content)
+                self.assertEqual(
+                    sorted(ranges), ['bytes=0-299', 'bytes=300-599', 'bytes=600-899', 'bytes=900-999']
+                )
+                self.assertEqual(progress[-1], (1000, 1000))
+                self.assertEqual(sorted(os.listdir(directory)), ['model.bin'])
+
+            with self.subTest('skips a file matching the checksum'):
+                ranges.clear()
+                self.assertFalse(self.client.download_dataset(dataset_uuid, path, range_size=300))
+                self.assertEqual(ranges, [])
+
+            with self.subTest('downloads with a known size and checksum without fetching the dataset'):
+                calls: int = len(responses.calls)
+                other_path: str = os.path.join(directory, 'other.bin')
+                self.assertTrue(self.client.download_dataset_content(
+                    dataset_uuid, other_path, dataset['size'], dataset['checksum'], range_size=600
+                ))
+                with open(other_path, 'rb') as file:
+                    self.assertEqual(file.read(), content)
+                self.assertEqual(sorted(ranges), ['bytes=0-599', 'bytes=600-999'])
+                self.assertTrue(all(call.request.url.endswith('/raw') for call in responses.calls[calls:]))
+                os.remove(other_path)
+                ranges.clear()
+
+            with self.subTest('resumes an interrupted download'):
+                os.remove(path)
+                ranges.clear()
+                failing.append('bytes=600-899')
+                self.assertRaises(
+                    SelfHostInternalServerException,
+                    self.client.download_dataset, dataset_uuid, path, range_size=300, max_workers=1
+                )
+                self.assertFalse(os.path.exists(path))
+
+                ranges.clear()
+                failing.clear()
+                self.assertTrue(self.client.download_dataset(dataset_uuid, path, range_size=300))
+                self.assertEqual(ranges, ['bytes=600-899'])
+                with open(path, 'rb') as file:
+                    self.assertEqual(file.read(), content)
+
+            with self.subTest('ignores content past the end of a range'):
+                os.remove(path)
+                overflow[0] = 100
+                # Small chunks, so that the content past the end arrives in chunks of its own.
+                with mock.patch('selfhost_client.downloads.DEFAULT_CHUNK_SIZE', 64):
+                    self.assertTrue(self.client.download_dataset(dataset_uuid, path, range_size=300))
+                with open(path, 'rb') as file:
+                    self.assertEqual(file.read(), content)
+                overflow[0] = 0
+
+            with self.subTest('rejects another range than requested'):
+                os.remove(path)
+                shift[0] = 1
+                self.assertRaises(
+                    SelfHostRangeNotSatisfiableException,
+                    self.client.download_dataset, dataset_uuid, path, range_size=300
+                )
+                shift[0] = 0
+                self.assertTrue(self.client.download_dataset(dataset_uuid, path, range_size=300))
+
+            with self.subTest('uses the whole content answering a later range'):
+                os.remove(path)
+                whole.append('bytes=300-399')
+                self.assertTrue(self.client.download_dataset(dataset_uuid, path, range_size=100, max_workers=4))
+                with open(path, 'rb') as file:
+                    self.assertEqual(file.read(), content)
+                whole.clear()
+
+            with self.subTest('a resource shorter than its size'):
+                os.remove(path)
+                responses.replace(responses.GET, url=url, json={**dataset, 'size': 1300}, status=200)
+                self.assertRaises(
+                    SelfHostRangeNotSatisfiableException,
+                    self.client.download_dataset, dataset_uuid, path, range_size=300
+                )
+                responses.replace(responses.GET, url=url, json=dataset, status=200)
+                self.assertTrue(self.client.download_dataset(dataset_uuid, path, range_size=300))
+
+            with self.subTest('uses the answer of a server without range support'):
+                os.remove(path)
+                responses.replace(responses.GET, url=f'{url}/raw', body=content, status=200)
+                calls: int = len(responses.calls)
+                self.assertTrue(self.client.download_dataset(dataset_uuid, path, range_size=300))
+                with open(path, 'rb') as file:
+                    self.assertEqual(file.read(), content)
+                self.assertEqual([call.request.url for call in responses.calls[calls:]], [url, f'{url}/raw'])
+
+            with self.subTest('rejects content not matching the checksum'):
+                os.remove(path)
+                responses.replace(responses.GET, url=f'{url}/raw', body=content[::-1], status=200)
+                self.assertRaises(
+                    SelfHostChecksumMismatchException,
+                    self.client.download_dataset, dataset_uuid, path, range_size=300
+                )
+                self.assertEqual(os.listdir(directory), [])
@@ -0,0 +1,140 @@
+import csv
+import datetime
+import io
+import json
+import os
+import tempfile
+from contextlib import redirect_stderr
+from typing import Any, Dict, List, Tuple
+
+import responses
+import unittest
+
+from selfhost_client import TimeseriesClient, export_timeseries
+from selfhost_client.arrow import pa, pq
+from selfhost_client.cli import main
+
+START = datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class TestExport(unittest.TestCase):
+    def setUp(self) -> None:
+        self.base_url: str = 'http://example.com'
+        self.client: TimeseriesClient = TimeseriesClient(
+            base_url=self.base_url,
+            username='test',
+            password='test'
+        )
+        self.url: str = f'{self.base_url}/{self.client._api_version}/tsquery'
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory: str = directory.name
+
+    def add_tsquery(self) -> None:
+        def callback(request: Any) -> Tuple[int, Dict, str]:
+            # One data point per timeseries at the start of every window.
+            uuids = request.params['uuids']
+            body: List[Dict[str, Any]] = [
+                {'uuid': uuid, 'data': [{'ts': request.params['start'], 'v': 1.5}]}
+                for uuid in ([uuids] if isinstance(uuids, str) else uuids)
+            ]
+            return 200, {}, json.dumps(body)
+
+        responses.add_callback(responses.GET, self.url, callback=callback)
+
+    @responses.activate
+    def test_export_timeseries_csv(self) -> None:
+        self.add_tsquery()
+        path: str = os.path.join(self.directory, 'export.csv')
+        progress: List[int] = []
+
+        rows: int = export_timeseries(
+            self.client, ['a', 'b', 'c'], START, START + datetime.timedelta(days=3), path,
+            window=datetime.timedelta(days=2), uuids_per_request=2, max_workers=2, unit='C', progress=progress.append
+        )
+
+        with self.subTest('returns the number of rows'):
+            self.assertEqual(rows, 6)
+            self.assertEqual(progress, [2, 4, 5, 6])
+
+        with self.subTest('splits the period into windows that do not overlap'):
+            self.assertEqual(len(responses.calls), 4)
+            periods = sorted({(call.request.params['start'], call.request.params['end']) for call in responses.calls})
+            self.assertEqual(periods, [
+                ('2022-01-01T00:00:00+00:00', '2022-01-02T23:59:59.999999+00:00'),
+                ('2022-01-03T00:00:00+00:00', '2022-01-04T00:00:00+00:00'),
+            ])
+            self.assertEqual(responses.calls[0].request.params['unit'], 'C')
+
+        with self.subTest('writes the rows in order'):
+            with open(path, newline='') as file:
+                self.assertEqual(list(csv.reader(file)), [
+                    ['uuid', 'ts', 'v'],
+                    ['a', '2022-01-01T00:00:00+00:00', '1.5'],
+                    ['b', '2022-01-01T00:00:00+00:00', '1.5'],
+                    ['a', '2022-01-03T00:00:00+00:00', '1.5'],
+                    ['b', '2022-01-03T00:00:00+00:00', '1.5'],
+                    ['c', '2022-01-01T00:00:00+00:00', '1.5'],
+                    ['c', '2022-01-03T00:00:00+00:00', '1.5'],
+                ])
+
+        with self.subTest('rejects an unknown format'):
+            with self.assertRaises(ValueError):
+                export_timeseries(self.client, ['a'], START, START, path, file_format='xlsx')
+
+        with self.subTest('rejects invalid options'):
+            for options in (
+                    {'window': datetime.timedelta(0)},
+                    {'uuids_per_request': 0},
+                    {'uuids_per_request': -1},
+                    {'max_workers': 0},
+            ):
+                with self.assertRaises(ValueError):
+                    export_timeseries(self.client, ['a'], START, START, path, **options)
+
+        with self.subTest('the command rejects invalid options'):
+            for option, value in (
+                    ('--window-days', '0'), ('--window-days', 'nan'), ('--uuids-per-request', '0'),
+                    ('--uuids-per-request', '-1'), ('--max-workers', '0'),
+            ):
+                with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+                    main([
+                        'export', '--uuid', 'a', '--start', '2022-01-01', '--end', '2022-01-02', '--output', path,
+                        option, value
+                    ])
+
+    @unittest.skipIf(pa is None, 'pyarrow is not installed')
+    @responses.activate
+    def test_export_timeseries_parquet(self) -> None:
+        self.add_tsquery()
+        path: str = os.path.join(self.directory, 'export.parquet')
+
+        rows: int = export_timeseries(
+            self.client, ['a', 'b'], START, START + datetime.timedelta(days=14), path
+        )
+
+        table = pq.read_table(path)
+        self.assertEqual(rows, 4)
+        self.assertEqual(table.num_rows, 4)
+        self.assertEqual(table.column('uuid').to_pylist(), ['a', 'b', 'a', 'b'])
+        self.assertEqual(table.column('ts').to_pylist()[2], START + datetime.timedelta(days=7))
+
+    @responses.activate
+    def test_main_export(self) -> None:
+        self.add_tsquery()
+        path: str = os.path.join(self.directory, 'export.csv')
+        uuids_file: str = os.path.join(self.directory, 'uuids.txt')
+        with open(uuids_file, 'w') as file:
+            file.write('b\n\nc\n')
+
+        status: int = main([
+            'export', '--uuid', 'a', '--uuids-file', uuids_file, '--start', '2022-01-01', '--end',
+            '2022-01-01T12:00:00Z', '--output', path, '--quiet', '--base-url', self.base_url, '--username', 'test',
+            '--password', 'test'
+        ])
+
+        self.assertEqual(status, 0)
+        self.assertEqual(responses.calls[0].request.params['uuids'], ['a', 'b', 'c'])
+        self.assertEqual(responses.calls[0].request.params['start'], '2022-01-01T00:00:00+00:00')
+        with open(path, newline='') as file:
+            self.assertEqual(len(list(csv.reader(file))), 4)
@@ -0,0 +1,116 @@
+import unittest
+
+import responses
+
+from selfhost_client import BaseClient, MetricsCollector, SelfHostTooManyRequestsException
+from selfhost_client.types.request_types import RequestMetricsType
+
+
+def _metrics(**overrides) -> RequestMetricsType:
+    metrics: RequestMetricsType = {
+        'method': 'GET',
+        'url': 'http://example.com/v2/tsquery',
+        'endpoint': 'tsquery',
+        'status_code': 200,
+        'bytes_sent': 0,
+        'bytes_received': 100,
+        'connect': None,
+        'tls': None,
+        'ttfb': 0.01,
+        'decode': 0.001,
+        'total': 0.02,
+        'retries': 0,
+        'exception': None,
+    }
+    metrics.update(overrides)
+    return metrics
+
+
+class TestMetricsCollector(unittest.TestCase):
+    def setUp(self) -> None:
+        self.base_url: str = 'http://example.com'
+        self.collector: MetricsCollector = MetricsCollector(buckets=(0.1, 0.01))
+
+    def test_expose(self) -> None:
+        self.collector(_metrics())
+        self.collector(_metrics(total=0.0625))
+        self.collector(_metrics(total=0.5, status_code=429, exception='SelfHostTooManyRequestsException'))
+        self.collector(_metrics(
+            method='POST', endpoint='timeseries/{uuid}/data', status_code=None, bytes_sent=10, bytes_received=None,
+            exception='ConnectionError'
+        ))
+        lines = self.collector.expose().splitlines()
+
+        with self.subTest('latency histogram per endpoint'):
+            labels = 'endpoint="tsquery",method="GET"'
+            self.assertIn('# TYPE selfhost_client_request_duration_seconds histogram', lines)
+            self.assertIn(f'selfhost_client_request_duration_seconds_bucket{{{labels},le="0.01"}} 0', lines)
+            self.assertIn(f'selfhost_client_request_duration_seconds_bucket{{{labels},le="0.1"}} 2', lines)
+            self.assertIn(f'selfhost_client_request_duration_seconds_bucket{{{labels},le="+Inf"}} 3', lines)
+            self.assertIn(f'selfhost_client_request_duration_seconds_count{{{labels}}} 3', lines)
+            self.assertIn(f'selfhost_client_request_duration_seconds_sum{{{labels}}} 0.5825', lines)
+
+        with self.subTest('status codes and exceptions'):
+            self.assertIn('selfhost_client_responses_total{endpoint="tsquery",method="GET",code="200"} 2', lines)
+            self.assertIn('selfhost_client_responses_total{endpoint="tsquery",method="GET",code="429"} 1', lines)
+            self.assertIn(
+                'selfhost_client_exceptions_total'
+                '{endpoint="tsquery",method="GET",exception="SelfHostTooManyRequestsException"} 1',
+                lines
+            )
+            self.assertIn(
+                'selfhost_client_exceptions_total'
+                '{endpoint="timeseries/{uuid}/data",method="POST",exception="ConnectionError"} 1',
+                lines
+            )
+
+        with self.subTest('bytes transferred'):
+            self.assertIn('selfhost_client_response_bytes_total{endpoint="tsquery",method="GET"} 300', lines)
+            self.assertIn(
+                'selfhost_client_request_bytes_total{endpoint="timeseries/{uuid}/data",method="POST"} 10', lines
+            )
+
+        with self.subTest('terminated by EOF'):
+            self.assertEqual(lines[-1], '# EOF')
+
+    @responses.activate
+    def test_attach(self) -> None:
+        client: BaseClient = BaseClient(base_url=self.base_url, username='test', password='test')
+        self.collector.attach(client)
+
+        with self.subTest('collects the requests of the client'):
+            responses.add(responses.GET, url=f'{self.base_url}/v2/users/me', status=429)
+            self.assertRaises(
+                SelfHostTooManyRequestsException,
+                client._process_response,
+                client._session.get(url=f'{self.base_url}/v2/users/me'),
+            )
+            self.assertIn(
+                'selfhost_client_exceptions_total'
+                '{endpoint="users/me",method="GET",exception="SelfHostTooManyRequestsException"} 1',
+                self.collector.expose().splitlines()
+            )
+
+        with self.subTest('reports the connection pools of the client'):
+            client._session.get_adapter(self.base_url).poolmanager.connection_from_url(self.base_url)
+            lines = self.collector.expose().splitlines()
+            self.assertIn('selfhost_client_pool_in_use_connections{host="http://example.com:80"} 0', lines)
+            self.assertIn('selfhost_client_pool_idle_connections{host="http://example.com:80"} 0', lines)
+            self.assertIn('selfhost_client_pool_max_connections{host="http://example.com:80"} 10', lines)
+
+        with self.subTest('sums the pools of clients of the same host'):
+            other: BaseClient = BaseClient(base_url=self.base_url, username='test', password='test')
+            other._session.get_adapter(self.base_url).poolmanager.connection_from_url(self.base_url)
+            self.collector.attach(other)
+            lines = self.collector.expose().splitlines()
+            max_lines = [line for line in lines if line.startswith('selfhost_client_pool_max_connections{')]
+            self.assertEqual(max_lines, ['selfhost_client_pool_max_connections{host="http://example.com:80"} 20'])
+            self.collector.detach(other)
+
+        with self.subTest('stops collecting when detached'):
+            self.collector.detach(client)
+            self.assertNotIn(self.collector, client._session.request_hooks)
+            self.assertNotIn(
+                'selfhost_client_pool_max_connections{host="http://example.com:80"} 10',
+                self.collector.expose().splitlines()
+            )
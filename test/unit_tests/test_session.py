@@ -0,0 +1,18 @@
+import unittest
+
+from selfhost_client.session import endpoint_template
+
+
+class TestSession(unittest.TestCase):
+    def test_endpoint_template(self) -> None:
+        api_url: str = 'http://example.com/v2'
+        expected = {
+            'http://example.com/v2/timeseries?limit=20': 'timeseries',
+            'http://example.com/v2/tsquery?uuids=a&uuids=b': 'tsquery',
+            'http://example.com/v2/timeseries/a21ae595-15a5-4f11-8992-9d33600cc1ee/data': 'timeseries/{uuid}/data',
+            'http://example.com/v2/users/me': 'users/me',
+            'http://example.com/v2/users/a21ae595/tokens/b21ae595': 'users/{uuid}/tokens/{uuid}',
+        }
+        for url, template in expected.items():
+            with self.subTest(url):
+                self.assertEqual(endpoint_template(api_url, url), template)
@@ -1,10 +1,18 @@
 import json
-from typing import List, Union, Dict
+from typing import List, Tuple, Union, Dict
 
 import responses
 import unittest
 import urllib
-from selfhost_client import ThingsClient, DatasetType, ThingType, TimeseriesType
+from selfhost_client import (
+    BatchResultType,
+    DatasetType,
+    SelfHostBadRequestException,
+    SelfHostNotFoundException,
+    ThingsClient,
+    ThingType,
+    TimeseriesType
+)
 
 
 class TestThingsClient(unittest.TestCase):
@@ -268,3 +276,44 @@ class TestThingsClient(unittest.TestCase):
                 responses.calls[0].request.url,
                 f'{self.base_url}/{self.client._api_version}/{self.client._things_api_path}/{thing_uuid}/timeseries'
             )
+
+    @responses.activate
+    def test_create_things_many(self) -> None:
+        def callback(request) -> Tuple[int, Dict, str]:
+            body: Dict = json.loads(request.body)
+            if body['name'] == 'invalid':
+                return 400, {}, ''
+            return 201, {}, json.dumps({'name': body['name']})
+
+        responses.add_callback(
+            responses.POST,
+            url=f'{self.base_url}/{self.client._api_version}/{self.client._things_api_path}',
+            callback=callback
+        )
+
+        res: List[BatchResultType] = self.client.create_things_many(
+            [{'name': f'Thing {index}'} for index in range(10)] + [{'name': 'invalid'}, {'name': 'Thing 10'}],
+            max_workers=4
+        )
+
+        self.assertEqual(len(responses.calls), 12)
+        self.assertEqual([item['result'] for item in res[:10]], [{'name': f'Thing {index}'} for index in range(10)])
+        self.assertIsNone(res[10]['result'])
+        self.assertIsInstance(res[10]['exception'], SelfHostBadRequestException)
+        self.assertEqual(res[11], {'result': {'name': 'Thing 10'}, 'exception': None})
+
+    @responses.activate
+    def test_delete_things_many(self) -> None:
+        thing_uuids: List[str] = ['a', 'b', 'c']
+        for thing_uuid in thing_uuids:
+            responses.add(
+                responses.DELETE,
+                url=f'{self.base_url}/{self.client._api_version}/{self.client._things_api_path}/{thing_uuid}',
+                status=404 if thing_uuid == 'b' else 204
+            )
+
+        res: List[BatchResultType] = self.client.delete_things_many(thing_uuids)
+
+        self.assertEqual([item['exception'] is None for item in res], [True, False, True])
+        self.assertIsInstance(res[1]['exception'], SelfHostNotFoundException)
+        self.assertEqual(self.client.delete_things_many([]), [])
@@ -1,6 +1,6 @@
 import datetime
 import json
-from typing import List, Dict, Union
+from typing import Any, List, Dict, Union
 
 import pyrfc3339
 import responses
@@ -12,8 +12,11 @@ from selfhost_client import (
     TimeseriesType,
     TimeseriesDataPointType,
     TimeseriesDataType,
-    TimeseriesDataPointResponse, TimeseriesDataResponse
+    TimeseriesDataPointResponse, TimeseriesDataResponse,
+    SelfHostOutOfBoundsException
 )
+from selfhost_client.arrow import pa
+from selfhost_client.dataframes import pd
 
 
 class TestPCTTimeseriesClient(unittest.TestCase):
@@ -294,6 +297,83 @@ class TestPCTTimeseriesClient(unittest.TestCase):
             self.assertEqual(sent_body[1]['ts'], body[1]['ts'].isoformat())
             self.assertEqual(sent_body[1]['v'], body[1]['v'])
 
+    @responses.activate
+    def test_create_timeseries_data_raw(self) -> None:
+        timeseries_uuid: str = '7e7823cc-44fa-403d-853f-d5ce48a002e4'
+        url: str = f'{self.base_url}/{self.client._api_version}/{self.client._timeseries_api_path}/{timeseries_uuid}'
+        responses.add(
+            responses.GET,
+            url=url,
+            json={'uuid': timeseries_uuid, 'si_unit': 'C', 'lower_bound': 0, 'upper_bound': 10},
+            status=200
+        )
+        responses.add(responses.POST, url=f'{url}/data', status=201)
+        body: List[TimeseriesDataPointResponse] = [
+            {'ts': '2022-01-14T12:52:04.147Z', 'v': -1.5},
+            {'ts': '2022-01-14T12:53:04+01:00', 'v': 3.99}
+        ]
+
+        with self.subTest('timestamps are sent as they are'):
+            self.assertEqual(self.client.create_timeseries_data_raw(timeseries_uuid, body, unit='C'), 2)
+            self.assertEqual(responses.calls[0].request.params.get('unit'), 'C')
+            self.assertEqual(json.loads(responses.calls[0].request.body), body)
+
+        with self.subTest('returns the number of data points within bounds'):
+            with self.assertLogs('selfhost_client.timeseries_client', 'WARNING'):
+                self.assertEqual(self.client.create_timeseries_data_raw(timeseries_uuid, body, bounds='filter'), 1)
+            self.assertEqual(json.loads(responses.calls[2].request.body), body[1:])
+
+    @responses.activate
+    def test_create_timeseries_data_bounds(self) -> None:
+        timeseries_uuid: str = '7e7823cc-44fa-403d-853f-d5ce48a002e4'
+        url: str = f'{self.base_url}/{self.client._api_version}/{self.client._timeseries_api_path}/{timeseries_uuid}'
+        responses.add(
+            responses.GET,
+            url=url,
+            json={'uuid': timeseries_uuid, 'si_unit': 'C', 'lower_bound': 0, 'upper_bound': 10},
+            status=200
+        )
+        responses.add(responses.POST, url=f'{url}/data', status=201)
+        body: List[TimeseriesDataPointType] = [
+            {'ts': pyrfc3339.parse('2022-01-14T12:52:04.147Z'), 'v': -1.5},
+            {'ts': pyrfc3339.parse('2022-01-14T12:53:04.147Z'), 'v': 3.99},
+            {'ts': pyrfc3339.parse('2022-01-14T12:54:04.147Z'), 'v': 12}
+        ]
+
+        with self.subTest('filter'):
+            with self.assertLogs('selfhost_client.timeseries_client', 'WARNING'):
+                self.client.create_timeseries_data(timeseries_uuid, body, bounds='filter')
+            self.assertEqual([call.request.method for call in responses.calls], ['GET', 'POST'])
+            self.assertEqual([p['v'] for p in json.loads(responses.calls[1].request.body)], [3.99])
+
+        with self.subTest('clip with the cached bounds'):
+            self.client.create_timeseries_data(timeseries_uuid, body, unit='C', bounds='clip')
+            self.assertEqual([call.request.method for call in responses.calls], ['GET', 'POST', 'POST'])
+            self.assertEqual([p['v'] for p in json.loads(responses.calls[2].request.body)], [0, 3.99, 10])
+
+        with self.subTest('raise'):
+            with self.assertRaises(SelfHostOutOfBoundsException):
+                self.client.create_timeseries_data(timeseries_uuid, body, bounds='raise')
+            self.assertEqual(len(responses.calls), 3)
+
+        with self.subTest('bounds are converted into other units'):
+            self.client.create_timeseries_data(timeseries_uuid, body, unit='F', bounds='clip')
+            for value, expected in zip([p['v'] for p in json.loads(responses.calls[3].request.body)], [32, 32, 32]):
+                self.assertAlmostEqual(value, expected)
+
+        with self.subTest('units that can not be converted are not validated'):
+            self.client.create_timeseries_data(timeseries_uuid, body, unit='kWh', bounds='raise')
+            self.assertEqual(len(json.loads(responses.calls[4].request.body)), 3)
+
+        with self.subTest('nothing is sent when all data points are filtered out'):
+            with self.assertLogs('selfhost_client.timeseries_client', 'WARNING'):
+                self.client.create_timeseries_data(timeseries_uuid, [body[0], body[2]], bounds='filter')
+            self.assertEqual(len(responses.calls), 5)
+
+        with self.subTest('unknown bounds'):
+            with self.assertRaises(ValueError):
+                self.client.create_timeseries_data(timeseries_uuid, body, bounds='drop')
+
     @responses.activate
     def test_delete_timeseries_data(self) -> None:
         timeseries_uuid: str = '7e7823cc-44fa-403d-853f-d5ce48a002e4'
@@ -393,3 +473,225 @@ class TestPCTTimeseriesClient(unittest.TestCase):
                 res[0]['data'][0]['ts'],
                 pyrfc3339.parse('2022-01-14T12:43:44.147Z')
             )
+
+    @responses.activate
+    def test_get_multiple_timeseries_data_raw(self) -> None:
+        mock_response: List[TimeseriesDataResponse] = [
+            {
+                'data': [{
+                    'ts': '2022-01-14T12:43:44.147Z',
+                    'v': 3.14
+                }],
+                'uuid': 'ze7823cc-44fa-403d-853f-d5ce48a002e4'
+            }
+        ]
+        responses.add(
+            responses.GET,
+            url=f'{self.base_url}/{self.client._api_version}/tsquery',
+            json=mock_response,
+            status=200
+        )
+
+        res: List[TimeseriesDataResponse] = self.client.get_multiple_timeseries_data_raw(
+            ['ze7823cc-44fa-403d-853f-d5ce48a002e4'],
+            pyrfc3339.parse('2022-01-14T12:43:44.147Z'),
+            pyrfc3339.parse('2022-01-14T12:43:44.147Z'),
+            unit='C'
+        )
+
+        self.assertEqual(len(responses.calls), 1)
+        self.assertEqual(responses.calls[0].request.params.get('unit'), 'C')
+        self.assertEqual(res, mock_response)
+
+    @unittest.skipIf(pd is None, 'pandas is not installed')
+    @responses.activate
+    def test_get_multiple_timeseries_dataframe(self) -> None:
+        mock_response: List[TimeseriesDataResponse] = [
+            {
+                'data': [{
+                    'ts': '2022-01-14T12:43:44.147Z',
+                    'v': 3.14
+                }],
+                'uuid': 'ze7823cc-44fa-403d-853f-d5ce48a002e4'
+            }
+        ]
+        with self.subTest('call successful with complete parameter list'):
+            responses.add(
+                responses.GET,
+                url=f'{self.base_url}/{self.client._api_version}/tsquery',
+                json=mock_response,
+                status=200
+            )
+
+            res = self.client.get_multiple_timeseries_dataframe(
+                uuids=['ze7823cc-44fa-403d-853f-d5ce48a002e4'],
+                start=pyrfc3339.parse('2022-01-14T12:43:44.147Z'),
+                end=pyrfc3339.parse('2022-01-14T12:43:44.147Z'),
+                precision='second',
+                layout='long'
+            )
+
+            self.assertEqual(len(responses.calls), 1)
+            self.assertEqual(responses.calls[0].request.params.get('precision'), 'second')
+            self.assertEqual(res['uuid'].tolist(), ['ze7823cc-44fa-403d-853f-d5ce48a002e4'])
+            self.assertEqual(res['v'].tolist(), [3.14])
+            self.assertEqual(res['ts'].iloc[0], pd.Timestamp('2022-01-14T12:43:44.147Z'))
+
+    @unittest.skipIf(pa is None, 'pyarrow is not installed')
+    @responses.activate
+    def test_get_timeseries_data_arrow(self) -> None:
+        timeseries_uuid: str = 'a21ae595-15a5-4f11-8992-9d33600cc1ee'
+        mock_response: List[TimeseriesDataPointResponse] = [
+            {
+                'ts': '2022-01-14T12:52:04.147Z',
+                'v': 3.14
+            }
+        ]
+        with self.subTest('call successful with complete parameter list'):
+            responses.add(
+                responses.GET,
+                url=f'{self.base_url}/{self.client._api_version}/{self.client._timeseries_api_path}/{timeseries_uuid}'
+                    f'/data',
+                json=mock_response,
+                status=200
+            )
+
+            res = self.client.get_timeseries_data_arrow(
+                timeseries_uuid,
+                start=pyrfc3339.parse('2022-01-14T12:43:44.147Z'),
+                end=pyrfc3339.parse('2022-01-14T12:53:44.147Z')
+            )
+
+            self.assertEqual(len(responses.calls), 1)
+            self.assertEqual(res.column('uuid').to_pylist(), [timeseries_uuid])
+            self.assertEqual(res.column('v').to_pylist(), [3.14])
+            self.assertEqual(res.column('ts').to_pylist(), [pyrfc3339.parse('2022-01-14T12:52:04.147Z')])
+
+    @unittest.skipIf(pa is None, 'pyarrow is not installed')
+    @responses.activate
+    def test_get_multiple_timeseries_data_arrow(self) -> None:
+        mock_response: List[TimeseriesDataResponse] = [
+            {
+                'data': [{
+                    'ts': '2022-01-14T12:43:44.147Z',
+                    'v': 3.14
+                }],
+                'uuid': 'ze7823cc-44fa-403d-853f-d5ce48a002e4'
+            }
+        ]
+        with self.subTest('call successful with complete parameter list'):
+            responses.add(
+                responses.GET,
+                url=f'{self.base_url}/{self.client._api_version}/tsquery',
+                json=mock_response,
+                status=200
+            )
+
+            res = self.client.get_multiple_timeseries_data_arrow(
+                uuids=['ze7823cc-44fa-403d-853f-d5ce48a002e4'],
+                start=pyrfc3339.parse('2022-01-14T12:43:44.147Z'),
+                end=pyrfc3339.parse('2022-01-14T12:43:44.147Z')
+            )
+
+            self.assertEqual(len(responses.calls), 1)
+            self.assertEqual(res.column('uuid').to_pylist(), ['ze7823cc-44fa-403d-853f-d5ce48a002e4'])
+            self.assertEqual(res.column('v').to_pylist(), [3.14])
+
+    @unittest.skipIf(pa is None, 'pyarrow is not installed')
+    @responses.activate
+    def test_create_timeseries_data_from_arrow(self) -> None:
+        table = pa.table({
+            'uuid': ['a21ae595', 'a21ae595', 'b21ae595'],
+            'ts': pa.array([
+                pyrfc3339.parse('2022-01-14T12:00:00Z'),
+                pyrfc3339.parse('2022-01-14T12:00:01Z'),
+                pyrfc3339.parse('2022-01-14T12:00:02Z')
+            ], type=pa.timestamp('us', tz='UTC')),
+            'v': [1.0, 2.0, 3.0]
+        })
+        for timeseries_uuid in ['a21ae595', 'b21ae595']:
+            responses.add(
+                responses.POST,
+                url=f'{self.base_url}/{self.client._api_version}/{self.client._timeseries_api_path}/{timeseries_uuid}'
+                    f'/data',
+                status=201
+            )
+
+        with self.subTest('call successful with batches split per timeseries'):
+            res: int = self.client.create_timeseries_data_from_arrow(table, unit='C', batch_size=2)
+
+            self.assertEqual(res, 3)
+            self.assertEqual(len(responses.calls), 2)
+            self.assertEqual(responses.calls[0].request.params.get('unit'), 'C')
+            self.assertEqual(json.loads(responses.calls[0].request.body.decode('utf-8')), [
+                {'v': 1.0, 'ts': '2022-01-14T12:00:00.000000Z'},
+                {'v': 2.0, 'ts': '2022-01-14T12:00:01.000000Z'}
+            ])
+            self.assertIn('b21ae595', responses.calls[1].request.url)
+
+    @unittest.skipIf(pd is None, 'pandas is not installed')
+    @responses.activate
+    def test_get_multiple_timeseries_aggregates(self) -> None:
+        # Two minute buckets of the same hour, the first averages one data point and the second three.
+        source_buckets: Dict[str, List[TimeseriesDataPointResponse]] = {
+            'sum': [{'ts': '2022-01-14T12:00:00Z', 'v': 1.0}, {'ts': '2022-01-14T12:30:00Z', 'v': 9.0}],
+            'count': [{'ts': '2022-01-14T12:00:00Z', 'v': 1}, {'ts': '2022-01-14T12:30:00Z', 'v': 3}],
+            'max': [{'ts': '2022-01-14T12:00:00Z', 'v': 1.0}, {'ts': '2022-01-14T12:30:00Z', 'v': 5.0}],
+        }
+
+        def source_bucket_callback(request: Any) -> Any:
+            return 200, {}, json.dumps([
+                {'uuid': 'ze7823cc-44fa-403d-853f-d5ce48a002e4', 'data': source_buckets[request.params['aggregate']]}
+            ])
+
+        with self.subTest('call successful with source precision'):
+            responses.add_callback(
+                responses.GET,
+                url=f'{self.base_url}/{self.client._api_version}/tsquery',
+                callback=source_bucket_callback
+            )
+
+            res = self.client.get_multiple_timeseries_aggregates(
+                uuids=['ze7823cc-44fa-403d-853f-d5ce48a002e4'],
+                start=pyrfc3339.parse('2022-01-14T12:00:00Z'),
+                end=pyrfc3339.parse('2022-01-14T13:00:00Z'),
+                precision='hour',
+                aggregates=['avg', 'max', 'count'],
+                timezone='Europe/Stockholm',
+                source_precision='minute'
+            )
+
+            self.assertEqual(len(responses.calls), 3)
+            self.assertEqual(
+                [call.request.params.get('aggregate') for call in responses.calls], ['sum', 'count', 'max']
+            )
+            for call in responses.calls:
+                self.assertEqual(call.request.params.get('precision'), 'minute')
+                self.assertEqual(call.request.params.get('timezone'), 'Europe/Stockholm')
+            # Weighted by the number of data points, not the average of the averages 1.0 and 3.0.
+            self.assertEqual(res['avg'].iloc[0], 2.5)
+            self.assertEqual(res['max'].iloc[0], 5.0)
+            self.assertEqual(res['count'].iloc[0], 4)
+            self.assertEqual(res['ts'].iloc[0], pd.Timestamp('2022-01-14T12:00:00Z'))
+
+        with self.subTest('rejects invalid options before the request'):
+            responses.reset()
+            invalid: List[Dict[str, Any]] = [
+                {'precision': 'fortnight', 'aggregates': ['avg']},
+                {'precision': 'hour', 'aggregates': ['median']},
+                {'precision': 'hour', 'aggregates': ['avg', 'p95'], 'source_precision': 'minute'},
+                {'precision': 'hour', 'aggregates': ['avg'], 'source_precision': 'fortnight'},
+                {'precision': 'minute30', 'aggregates': ['avg'], 'source_precision': 'minute20'},
+                {'precision': 'hour', 'aggregates': ['avg'], 'source_precision': 'hour'},
+                {'precision': 'minute', 'aggregates': ['avg'], 'source_precision': 'hour'},
+                {'precision': 'century', 'aggregates': ['avg'], 'source_precision': 'decade'},
+            ]
+            for options in invalid:
+                with self.assertRaises(ValueError):
+                    self.client.get_multiple_timeseries_aggregates(
+                        uuids=['ze7823cc-44fa-403d-853f-d5ce48a002e4'],
+                        start=pyrfc3339.parse('2022-01-14T12:00:00Z'),
+                        end=pyrfc3339.parse('2022-01-14T13:00:00Z'),
+                        **options
+                    )
+            self.assertEqual(len(responses.calls), 0)
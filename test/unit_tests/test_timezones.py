@@ -0,0 +1,49 @@
+import unittest
+
+from selfhost_client.dataframes import np
+from selfhost_client.timezones import utc_to_wall_clock, wall_clock_to_utc
+
+
+def times(*values: str):
+    return np.array(values, dtype='datetime64[us]')
+
+
+@unittest.skipIf(np is None, 'pandas is not installed')
+class TestTimezones(unittest.TestCase):
+    def test_utc_to_wall_clock(self) -> None:
+        self.assertEqual(
+            utc_to_wall_clock(times('2024-01-15T12:00', '2024-07-15T12:00', 'NaT', '1990-07-01T00:00'),
+                              'Europe/Stockholm').tolist(),
+            times('2024-01-15T13:00', '2024-07-15T14:00', 'NaT', '1990-07-01T02:00').tolist()
+        )
+        self.assertEqual(
+            utc_to_wall_clock(times('2024-10-27T00:30', '2024-10-27T01:30'), 'Europe/Stockholm').tolist(),
+            times('2024-10-27T02:30', '2024-10-27T02:30').tolist()
+        )
+        self.assertEqual(utc_to_wall_clock(times('2024-07-15T12:00'), 'Asia/Kathmandu').tolist(),
+                         times('2024-07-15T17:45').tolist())
+
+    def test_wall_clock_to_utc(self) -> None:
+        with self.subTest('round trip'):
+            instants = np.arange(
+                np.datetime64('2023-01-01T00:00', 'us'), np.datetime64('2025-01-01T00:00', 'us'),
+                np.timedelta64(37, 'm')
+            )
+            for timezone in ['Europe/Stockholm', 'America/Santiago', 'Australia/Lord_Howe', 'UTC']:
+                wall_clock = utc_to_wall_clock(instants, timezone)
+                first = wall_clock_to_utc(wall_clock, timezone)
+                # Repeated wall clock times resolve to their first occurrence, at most an hour earlier.
+                self.assertTrue(((instants - first) >= np.timedelta64(0)).all())
+                self.assertTrue(((instants - first) <= np.timedelta64(1, 'h')).all())
+
+        with self.subTest('repeated wall clock times resolve to their first occurrence'):
+            self.assertEqual(wall_clock_to_utc(times('2024-10-27T02:30'), 'Europe/Stockholm').tolist(),
+                             times('2024-10-27T00:30').tolist())
+
+        with self.subTest('skipped wall clock times resolve to the transition'):
+            self.assertEqual(wall_clock_to_utc(times('2024-03-31T02:30', 'NaT'), 'Europe/Stockholm').tolist(),
+                             times('2024-03-31T01:00', 'NaT').tolist())
+
+        with self.subTest('unknown time zone'):
+            with self.assertRaises(ValueError):
+                wall_clock_to_utc(times('2024-03-31T02:30'), 'Mars/Olympus_Mons')
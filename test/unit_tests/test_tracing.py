@@ -0,0 +1,113 @@
+import contextlib
+import datetime
+import unittest
+from typing import Any, Dict, Iterator, List, MutableMapping
+
+import responses
+
+from selfhost_client import OpenTelemetryTracer, TimeseriesClient, Tracer, SelfHostNotFoundException
+from selfhost_client.tracing import otel_trace
+
+
+class _Span:
+    def __init__(self, name: str, attributes: Dict[str, Any], depth: int) -> None:
+        self.name = name
+        self.attributes = dict(attributes)
+        self.depth = depth
+        self.exception = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+
+class _RecordingTracer(Tracer):
+    def __init__(self) -> None:
+        self.spans: List[_Span] = []
+        self._stack: List[_Span] = []
+
+    @contextlib.contextmanager
+    def span(self, name: str, attributes: Dict[str, Any]) -> Iterator[_Span]:
+        span = _Span(name, attributes, len(self._stack))
+        self.spans.append(span)
+        self._stack.append(span)
+        try:
+            yield span
+        except Exception as e:
+            span.exception = e
+            raise
+        finally:
+            self._stack.pop()
+
+    def inject(self, headers: MutableMapping[str, str]) -> None:
+        headers['traceparent'] = f'00-trace-{self._stack[-1].name.replace(" ", "-")}-01'
+
+
+class TestTracing(unittest.TestCase):
+    def setUp(self) -> None:
+        self.base_url: str = 'http://example.com'
+        self.client: TimeseriesClient = TimeseriesClient(base_url=self.base_url, username='test', password='test')
+        self.tracer: _RecordingTracer = _RecordingTracer()
+        self.uuid: str = 'Ze7823cc-44fa-403d-853f-d5ce48a002e4'
+        self.url: str = f'{self.base_url}/v2/timeseries/{self.uuid}/data'
+        self.start: datetime.datetime = datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc)
+
+    @responses.activate
+    def test_spans(self) -> None:
+        responses.add(responses.GET, url=self.url, json=[{'ts': '2022-01-14T12:43:44.147Z', 'v': 3.14}], status=200)
+        self.client.set_tracer(self.tracer)
+        self.client.get_timeseries_data(self.uuid, self.start, self.start)
+
+        with self.subTest('public method, request and decode spans are nested'):
+            self.assertEqual(
+                [(span.name, span.depth) for span in self.tracer.spans],
+                [('TimeseriesClient.get_timeseries_data', 0), ('HTTP GET', 1), ('decode', 1)]
+            )
+            self.assertEqual(self.tracer.spans[0].attributes['code.function'], 'get_timeseries_data')
+            self.assertEqual(self.tracer.spans[1].attributes['selfhost.endpoint'], 'timeseries/{uuid}/data')
+            self.assertEqual(self.tracer.spans[1].attributes['http.status_code'], 200)
+
+        with self.subTest('trace context is propagated from the request span'):
+            self.assertEqual(responses.calls[0].request.headers['traceparent'], '00-trace-HTTP-GET-01')
+
+    @responses.activate
+    def test_exception(self) -> None:
+        responses.add(responses.GET, url=self.url, status=404)
+        self.client.set_tracer(self.tracer)
+        self.assertRaises(
+            SelfHostNotFoundException, self.client.get_timeseries_data, self.uuid, self.start, self.start
+        )
+        self.assertIsInstance(self.tracer.spans[0].exception, SelfHostNotFoundException)
+
+    @responses.activate
+    def test_disabled(self) -> None:
+        responses.add(responses.GET, url=self.url, json=[], status=200)
+        self.client.set_tracer(self.tracer)
+        self.client.set_tracer(None)
+        self.client.get_timeseries_data(self.uuid, self.start, self.start)
+
+        self.assertEqual(self.tracer.spans, [])
+        self.assertNotIn('traceparent', responses.calls[0].request.headers)
+
+    def test_base_tracer(self) -> None:
+        headers: Dict[str, str] = {}
+        with Tracer().span('name', {}) as span:
+            span.set_attribute('key', 'value')
+            Tracer().inject(headers)
+        self.assertEqual(headers, {})
+
+    @unittest.skipIf(otel_trace is None, 'opentelemetry-api is not installed')
+    @responses.activate
+    def test_opentelemetry(self) -> None:
+        from opentelemetry import propagate
+        from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
+
+        propagate.set_global_textmap(TraceContextTextMapPropagator())
+        responses.add(responses.GET, url=self.url, json=[], status=200)
+        self.client.set_tracer(OpenTelemetryTracer())
+        self.client.get_timeseries_data(self.uuid, self.start, self.start)
+        self.assertEqual(len(responses.calls), 1)
+
+    def test_opentelemetry_missing(self) -> None:
+        if otel_trace is not None:
+            self.skipTest('opentelemetry-api is installed')
+        self.assertRaises(ImportError, OpenTelemetryTracer)
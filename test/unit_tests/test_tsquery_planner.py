@@ -0,0 +1,114 @@
+import datetime
+import unittest
+from typing import Dict, List
+
+import pyrfc3339
+import responses
+
+from selfhost_client import (
+    SelfHostBadRequestException,
+    TimeseriesClient,
+    TimeseriesDataResponse,
+    TimeseriesDataType,
+    TsQueryPlanner
+)
+
+
+class TestTsQueryPlanner(unittest.TestCase):
+    def setUp(self) -> None:
+        self.base_url: str = 'http://example.com'
+        self.client: TimeseriesClient = TimeseriesClient(
+            base_url=self.base_url,
+            username='test',
+            password='test'
+        )
+        self.uuids: List[str] = ['ze7823cc-44fa-403d-853f-d5ce48a002e4']
+        self.start: datetime.datetime = pyrfc3339.parse('2022-01-14T12:00:00Z')
+        self.end: datetime.datetime = pyrfc3339.parse('2022-01-14T13:00:00Z')
+        self.mock_response: List[TimeseriesDataResponse] = [
+            {
+                'data': [{
+                    'ts': '2022-01-14T12:00:00Z',
+                    'v': 3.14
+                }],
+                'uuid': 'ze7823cc-44fa-403d-853f-d5ce48a002e4'
+            }
+        ]
+
+    @responses.activate
+    def test_query_aggregates(self) -> None:
+        responses.add(
+            responses.GET,
+            url=f'{self.base_url}/{self.client._api_version}/tsquery',
+            json=self.mock_response,
+            status=200
+        )
+
+        with self.subTest('one request per distinct aggregate'):
+            with TsQueryPlanner(self.client, window=0.05) as planner:
+                duplicate = planner.submit(self.uuids, self.start, self.end, precision='hour', aggregate='max')
+                res: Dict[str, List[TimeseriesDataType]] = planner.query_aggregates(
+                    self.uuids, self.start, self.end, precision='hour', aggregates=['avg', 'min', 'max']
+                )
+
+            self.assertEqual(len(responses.calls), 3)
+            self.assertEqual(
+                sorted(call.request.params.get('aggregate') for call in responses.calls),
+                ['avg', 'max', 'min']
+            )
+            self.assertEqual(list(res), ['avg', 'min', 'max'])
+            self.assertEqual(res['max'][0]['data'][0]['v'], 3.14)
+            self.assertEqual(duplicate.result(), res['max'])
+            self.assertIsNot(duplicate.result(), res['max'])
+            self.assertIsNot(duplicate.result()[0]['data'], res['max'][0]['data'])
+
+        responses.calls.reset()
+        with self.subTest('aggregates without precision are the same request'):
+            with TsQueryPlanner(self.client, window=0.05) as planner:
+                first = planner.submit(self.uuids, self.start, self.end, aggregate='min')
+                second = planner.submit(self.uuids, self.start, self.end, aggregate='max')
+                self.assertEqual(first.result(), second.result())
+                self.assertIsNot(first.result(), second.result())
+
+            self.assertEqual(len(responses.calls), 1)
+            self.assertIsNone(responses.calls[0].request.params.get('aggregate'))
+
+        responses.calls.reset()
+        with self.subTest('requests are sent right away without a window'):
+            with TsQueryPlanner(self.client) as planner:
+                res = planner.query_aggregates(
+                    self.uuids, self.start, self.end, precision='hour', aggregates=['avg', 'max', 'avg']
+                )
+
+            self.assertEqual(list(res), ['avg', 'max'])
+            self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_exceptions_are_passed_to_callers(self) -> None:
+        responses.add(
+            responses.GET,
+            url=f'{self.base_url}/{self.client._api_version}/tsquery',
+            status=400
+        )
+
+        with TsQueryPlanner(self.client) as planner:
+            self.assertRaises(
+                SelfHostBadRequestException,
+                planner.get_multiple_timeseries_data,
+                self.uuids, self.start, self.end
+            )
+
+    def test_submit_after_close(self) -> None:
+        planner: TsQueryPlanner = TsQueryPlanner(self.client)
+        planner.close()
+
+        with self.assertRaises(RuntimeError):
+            planner.submit(self.uuids, self.start, self.end)
+
+    def test_dispatch_failures_are_passed_to_callers(self) -> None:
+        planner: TsQueryPlanner = TsQueryPlanner(self.client, window=0.01)
+        planner._executor.shutdown()
+
+        future = planner.submit(self.uuids, self.start, self.end)
+
+        self.assertRaises(RuntimeError, future.result, timeout=5)
@@ -0,0 +1,60 @@
+from typing import List
+
+import unittest
+
+from selfhost_client import UnitRegistry, unit_registry
+from selfhost_client.arrow import pa
+from selfhost_client.dataframes import np, pd
+
+
+class TestUnitRegistry(unittest.TestCase):
+    def test_convert(self) -> None:
+        with self.subTest('numbers and lists'):
+            self.assertAlmostEqual(unit_registry.convert(100, 'C', 'F'), 212)
+            self.assertAlmostEqual(unit_registry.convert(0, 'C', 'K'), 273.15)
+            self.assertEqual(unit_registry.convert([1, 2.5], 'kWh', 'Wh'), [1000, 2500])
+            self.assertEqual(unit_registry.convert([1, 2], 'kW', 'kW'), [1, 2])
+            values: List[int] = [1, 2]
+            self.assertIsNot(unit_registry.convert(values, 'kW', 'kW'), values)
+            self.assertIsInstance(unit_registry.convert(1, 'kW', 'kW'), float)
+
+        with self.subTest('incompatible units'):
+            with self.assertRaises(ValueError):
+                unit_registry.convert(1, 'kWh', 'kW')
+            with self.assertRaises(ValueError):
+                unit_registry.convert(1, 'kWh', 'parsec')
+
+        with self.subTest('unsupported values'):
+            with self.assertRaises(TypeError):
+                unit_registry.convert('1', 'kWh', 'MWh')
+
+    def test_register(self) -> None:
+        registry: UnitRegistry = UnitRegistry()
+        registry.register('t', 'mass', 1000)
+        registry.register('kg', 'mass')
+        self.assertEqual(registry.factors('t', 'kg'), (1000, 0))
+        registry.register('kg', 'mass', 2)
+        self.assertEqual(registry.factors('t', 'kg'), (500, 0))
+        self.assertIn('kg', registry)
+        self.assertNotIn('kg', unit_registry)
+
+    @unittest.skipIf(pd is None, 'pandas is not installed')
+    def test_convert_pandas(self) -> None:
+        with self.subTest('wide'):
+            frame = pd.DataFrame({'a': [0.0, 100.0], 'b': [-40.0, 37.0]})
+            converted = unit_registry.convert(frame, 'C', 'F')
+            np.testing.assert_allclose(converted.to_numpy(), [[32, -40], [212, 98.6]])
+
+        with self.subTest('long'):
+            frame = pd.DataFrame({'uuid': ['a', 'a'], 'v': [1.0, 2.0]})
+            converted = unit_registry.convert(frame, 'MWh', 'kWh')
+            self.assertEqual(list(converted['v']), [1000, 2000])
+            self.assertEqual(list(frame['v']), [1, 2])
+
+    @unittest.skipIf(pa is None, 'pyarrow is not installed')
+    def test_convert_arrow(self) -> None:
+        table = pa.table({'uuid': ['a', 'a'], 'v': [1, 2]})
+        converted = unit_registry.convert(table, 'h', 'min')
+        self.assertEqual(converted.column('v').to_pylist(), [60.0, 120.0])
+        self.assertEqual(converted.column('uuid').to_pylist(), ['a', 'a'])
+        self.assertEqual(unit_registry.convert(pa.array([1.0]), 'bar', 'kPa').to_pylist(), [100.0])